@@ -19,10 +19,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'technical_blog/blog_components.py'),
                                                 'technical_blog.blog_components.topic_card': ( 'blog_components.html#topic_card',
                                                                                                'technical_blog/blog_components.py')},
-            'technical_blog.core': { 'technical_blog.core.get_nb_url': ('core.html#get_nb_url', 'technical_blog/core.py'),
+            'technical_blog.core': { 'technical_blog.core.check_import': ('core.html#check_import', 'technical_blog/core.py'),
+                                     'technical_blog.core.get_nb_url': ('core.html#get_nb_url', 'technical_blog/core.py'),
+                                     'technical_blog.core.import_profile': ('core.html#import_profile', 'technical_blog/core.py'),
                                      'technical_blog.core.read_meta': ('core.html#read_meta', 'technical_blog/core.py'),
                                      'technical_blog.core.slugify': ('core.html#slugify', 'technical_blog/core.py')},
-            'technical_blog.rbe.bayes': { 'technical_blog.rbe.bayes.bayes_calculator_component': ( 'rbe/bayes_theorem.html#bayes_calculator_component',
+            'technical_blog.rbe.bayes': { 'technical_blog.rbe.bayes._sens_blocks': ( 'rbe/bayes_theorem.html#_sens_blocks',
+                                                                                     'technical_blog/rbe/bayes.py'),
+                                          'technical_blog.rbe.bayes.bayes_calculator_component': ( 'rbe/bayes_theorem.html#bayes_calculator_component',
                                                                                                    'technical_blog/rbe/bayes.py'),
                                           'technical_blog.rbe.bayes.bayes_theorem_step_by_step': ( 'rbe/bayes_theorem.html#bayes_theorem_step_by_step',
                                                                                                    'technical_blog/rbe/bayes.py'),
@@ -34,8 +38,6 @@ d = { 'settings': { 'branch': 'main',
                                                                                             'technical_blog/rbe/bayes.py'),
                                           'technical_blog.rbe.bayes.integrated_threat_tracking': ( 'rbe/bayes_theorem.html#integrated_threat_tracking',
                                                                                                    'technical_blog/rbe/bayes.py'),
-                                          'technical_blog.rbe.bayes.interpret_bayes_factor': ( 'rbe/bayes_theorem.html#interpret_bayes_factor',
-                                                                                               'technical_blog/rbe/bayes.py'),
                                           'technical_blog.rbe.bayes.model_comparison_cybersec': ( 'rbe/bayes_theorem.html#model_comparison_cybersec',
                                                                                                   'technical_blog/rbe/bayes.py'),
                                           'technical_blog.rbe.bayes.plot_roc_and_precision_recall': ( 'rbe/bayes_theorem.html#plot_roc_and_precision_recall',
@@ -44,16 +46,78 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'technical_blog/rbe/bayes.py'),
                                           'technical_blog.rbe.bayes.sensitivity_analysis': ( 'rbe/bayes_theorem.html#sensitivity_analysis',
                                                                                              'technical_blog/rbe/bayes.py'),
+                                          'technical_blog.rbe.bayes.sensitivity_grid': ( 'rbe/bayes_theorem.html#sensitivity_grid',
+                                                                                         'technical_blog/rbe/bayes.py'),
                                           'technical_blog.rbe.bayes.threat_intelligence_fusion': ( 'rbe/bayes_theorem.html#threat_intelligence_fusion',
                                                                                                    'technical_blog/rbe/bayes.py'),
                                           'technical_blog.rbe.bayes.visualize_bayes_update': ( 'rbe/bayes_theorem.html#visualize_bayes_update',
                                                                                                'technical_blog/rbe/bayes.py')},
-            'technical_blog.rbe.core': { 'technical_blog.rbe.core.bayes_posterior_predictive': ( 'rbe/rbe_core.html#bayes_posterior_predictive',
+            'technical_blog.rbe.beliefs': { 'technical_blog.rbe.beliefs.BeliefTable': ( 'rbe/rbe_beliefs.html#belieftable',
+                                                                                        'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.__getitem__': ( 'rbe/rbe_beliefs.html#belieftable.__getitem__',
+                                                                                                    'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.__init__': ( 'rbe/rbe_beliefs.html#belieftable.__init__',
+                                                                                                 'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.__len__': ( 'rbe/rbe_beliefs.html#belieftable.__len__',
+                                                                                                'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable._evidence_rows': ( 'rbe/rbe_beliefs.html#belieftable._evidence_rows',
+                                                                                                       'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable._grow': ( 'rbe/rbe_beliefs.html#belieftable._grow',
+                                                                                              'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable._lookup': ( 'rbe/rbe_beliefs.html#belieftable._lookup',
+                                                                                                'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.add': ( 'rbe/rbe_beliefs.html#belieftable.add',
+                                                                                            'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.beliefs': ( 'rbe/rbe_beliefs.html#belieftable.beliefs',
+                                                                                                'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.entity_ids': ( 'rbe/rbe_beliefs.html#belieftable.entity_ids',
+                                                                                                   'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.entropy': ( 'rbe/rbe_beliefs.html#belieftable.entropy',
+                                                                                                'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.rows': ( 'rbe/rbe_beliefs.html#belieftable.rows',
+                                                                                             'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.top': ( 'rbe/rbe_beliefs.html#belieftable.top',
+                                                                                            'technical_blog/rbe/beliefs.py'),
+                                            'technical_blog.rbe.beliefs.BeliefTable.update': ( 'rbe/rbe_beliefs.html#belieftable.update',
+                                                                                               'technical_blog/rbe/beliefs.py')},
+            'technical_blog.rbe.changepoint': { 'technical_blog.rbe.changepoint.ChangepointDetector': ( 'rbe/rbe_changepoint.html#changepointdetector',
+                                                                                                        'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint.ChangepointDetector.__init__': ( 'rbe/rbe_changepoint.html#changepointdetector.__init__',
+                                                                                                                 'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint.ChangepointDetector.change_prob': ( 'rbe/rbe_changepoint.html#changepointdetector.change_prob',
+                                                                                                                    'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint.ChangepointDetector.expected_run_length': ( 'rbe/rbe_changepoint.html#changepointdetector.expected_run_length',
+                                                                                                                            'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint.ChangepointDetector.map_run_length': ( 'rbe/rbe_changepoint.html#changepointdetector.map_run_length',
+                                                                                                                       'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint.ChangepointDetector.mean': ( 'rbe/rbe_changepoint.html#changepointdetector.mean',
+                                                                                                             'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint.ChangepointDetector.reset': ( 'rbe/rbe_changepoint.html#changepointdetector.reset',
+                                                                                                              'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint.ChangepointDetector.run_length_probs': ( 'rbe/rbe_changepoint.html#changepointdetector.run_length_probs',
+                                                                                                                         'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint.ChangepointDetector.update': ( 'rbe/rbe_changepoint.html#changepointdetector.update',
+                                                                                                               'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint._lgamma_half_ratio': ( 'rbe/rbe_changepoint.html#_lgamma_half_ratio',
+                                                                                                       'technical_blog/rbe/changepoint.py'),
+                                                'technical_blog.rbe.changepoint.cp_detect': ( 'rbe/rbe_changepoint.html#cp_detect',
+                                                                                              'technical_blog/rbe/changepoint.py')},
+            'technical_blog.rbe.core': { 'technical_blog.rbe.core.__getattr__': ( 'rbe/rbe_core.html#__getattr__',
+                                                                                  'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core._pf_ends_to_indices': ( 'rbe/rbe_core.html#_pf_ends_to_indices',
+                                                                                          'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core._pf_is_batched': ( 'rbe/rbe_core.html#_pf_is_batched',
+                                                                                     'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core._pf_log_normalize': ( 'rbe/rbe_core.html#_pf_log_normalize',
+                                                                                        'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core.bayes_posterior_predictive': ( 'rbe/rbe_core.html#bayes_posterior_predictive',
                                                                                                  'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.bayes_sequential': ( 'rbe/rbe_core.html#bayes_sequential',
                                                                                        'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.bayes_update': ( 'rbe/rbe_core.html#bayes_update',
                                                                                    'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core.pf_batched': ( 'rbe/rbe_core.html#pf_batched',
+                                                                                 'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.pf_effective_size': ( 'rbe/rbe_core.html#pf_effective_size',
                                                                                         'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.pf_init': ('rbe/rbe_core.html#pf_init', 'technical_blog/rbe/core.py'),
@@ -61,12 +125,26 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.pf_resample': ( 'rbe/rbe_core.html#pf_resample',
                                                                                   'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core.pf_resample_metropolis': ( 'rbe/rbe_core.html#pf_resample_metropolis',
+                                                                                             'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core.pf_resample_multinomial': ( 'rbe/rbe_core.html#pf_resample_multinomial',
+                                                                                              'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core.pf_resample_rejection': ( 'rbe/rbe_core.html#pf_resample_rejection',
+                                                                                            'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core.pf_resample_residual': ( 'rbe/rbe_core.html#pf_resample_residual',
+                                                                                           'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core.pf_resample_stratified': ( 'rbe/rbe_core.html#pf_resample_stratified',
+                                                                                             'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core.pf_resample_systematic': ( 'rbe/rbe_core.html#pf_resample_systematic',
+                                                                                             'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.pf_step': ('rbe/rbe_core.html#pf_step', 'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.pf_update': ('rbe/rbe_core.html#pf_update', 'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.prob_entropy': ( 'rbe/rbe_core.html#prob_entropy',
                                                                                    'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.prob_kl_div': ( 'rbe/rbe_core.html#prob_kl_div',
                                                                                   'technical_blog/rbe/core.py'),
+                                         'technical_blog.rbe.core.prob_log_normalize': ( 'rbe/rbe_core.html#prob_log_normalize',
+                                                                                         'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.prob_normalize': ( 'rbe/rbe_core.html#prob_normalize',
                                                                                      'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.prob_sample': ( 'rbe/rbe_core.html#prob_sample',
@@ -77,15 +155,267 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'technical_blog/rbe/core.py'),
                                          'technical_blog.rbe.core.rbe_metrics': ( 'rbe/rbe_core.html#rbe_metrics',
                                                                                   'technical_blog/rbe/core.py'),
-                                         'technical_blog.rbe.core.viz_beliefs': ( 'rbe/rbe_core.html#viz_beliefs',
-                                                                                  'technical_blog/rbe/core.py'),
-                                         'technical_blog.rbe.core.viz_comparison': ( 'rbe/rbe_core.html#viz_comparison',
-                                                                                     'technical_blog/rbe/core.py'),
-                                         'technical_blog.rbe.core.viz_particles': ( 'rbe/rbe_core.html#viz_particles',
-                                                                                    'technical_blog/rbe/core.py'),
-                                         'technical_blog.rbe.core.viz_rbe_summary': ( 'rbe/rbe_core.html#viz_rbe_summary',
-                                                                                      'technical_blog/rbe/core.py')},
-            'technical_blog.rbe.recursive': { 'technical_blog.rbe.recursive.adaptive_threat_monitor': ( 'rbe/recursive_updating.html#adaptive_threat_monitor',
+                                         'technical_blog.rbe.core.rbe_stream': ( 'rbe/rbe_core.html#rbe_stream',
+                                                                                 'technical_blog/rbe/core.py')},
+            'technical_blog.rbe.detection': { 'technical_blog.rbe.detection._det_div': ( 'rbe/rbe_detection.html#_det_div',
+                                                                                         'technical_blog/rbe/detection.py'),
+                                              'technical_blog.rbe.detection.det_auc': ( 'rbe/rbe_detection.html#det_auc',
+                                                                                        'technical_blog/rbe/detection.py'),
+                                              'technical_blog.rbe.detection.det_confusion': ( 'rbe/rbe_detection.html#det_confusion',
+                                                                                              'technical_blog/rbe/detection.py'),
+                                              'technical_blog.rbe.detection.det_metrics': ( 'rbe/rbe_detection.html#det_metrics',
+                                                                                            'technical_blog/rbe/detection.py'),
+                                              'technical_blog.rbe.detection.det_score_sweep': ( 'rbe/rbe_detection.html#det_score_sweep',
+                                                                                                'technical_blog/rbe/detection.py'),
+                                              'technical_blog.rbe.detection.det_sweep': ( 'rbe/rbe_detection.html#det_sweep',
+                                                                                          'technical_blog/rbe/detection.py')},
+            'technical_blog.rbe.fusion': { 'technical_blog.rbe.fusion._fuse_array': ( 'rbe/rbe_fusion.html#_fuse_array',
+                                                                                      'technical_blog/rbe/fusion.py'),
+                                           'technical_blog.rbe.fusion._fuse_chunks': ( 'rbe/rbe_fusion.html#_fuse_chunks',
+                                                                                       'technical_blog/rbe/fusion.py'),
+                                           'technical_blog.rbe.fusion._fuse_weights': ( 'rbe/rbe_fusion.html#_fuse_weights',
+                                                                                        'technical_blog/rbe/fusion.py'),
+                                           'technical_blog.rbe.fusion.fuse_em': ( 'rbe/rbe_fusion.html#fuse_em',
+                                                                                  'technical_blog/rbe/fusion.py'),
+                                           'technical_blog.rbe.fusion.fuse_log_odds': ( 'rbe/rbe_fusion.html#fuse_log_odds',
+                                                                                        'technical_blog/rbe/fusion.py'),
+                                           'technical_blog.rbe.fusion.fuse_posterior': ( 'rbe/rbe_fusion.html#fuse_posterior',
+                                                                                         'technical_blog/rbe/fusion.py')},
+            'technical_blog.rbe.kalman': { 'technical_blog.rbe.kalman._jacobian': ( 'rbe/rbe_kalman.html#_jacobian',
+                                                                                    'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman._kf_gain': ( 'rbe/rbe_kalman.html#_kf_gain',
+                                                                                   'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman._kf_loglike': ( 'rbe/rbe_kalman.html#_kf_loglike',
+                                                                                      'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman._kf_obs': ( 'rbe/rbe_kalman.html#_kf_obs',
+                                                                                  'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman._kf_result': ( 'rbe/rbe_kalman.html#_kf_result',
+                                                                                     'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman._ukf_transform': ( 'rbe/rbe_kalman.html#_ukf_transform',
+                                                                                         'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman.ekf_estimator': ( 'rbe/rbe_kalman.html#ekf_estimator',
+                                                                                        'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman.kf_batch': ( 'rbe/rbe_kalman.html#kf_batch',
+                                                                                   'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman.kf_constant_velocity': ( 'rbe/rbe_kalman.html#kf_constant_velocity',
+                                                                                               'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman.kf_estimator': ( 'rbe/rbe_kalman.html#kf_estimator',
+                                                                                       'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman.kf_predict': ( 'rbe/rbe_kalman.html#kf_predict',
+                                                                                     'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman.kf_update': ( 'rbe/rbe_kalman.html#kf_update',
+                                                                                    'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman.ukf_estimator': ( 'rbe/rbe_kalman.html#ukf_estimator',
+                                                                                        'technical_blog/rbe/kalman.py'),
+                                           'technical_blog.rbe.kalman.ukf_sigma_points': ( 'rbe/rbe_kalman.html#ukf_sigma_points',
+                                                                                           'technical_blog/rbe/kalman.py')},
+            'technical_blog.rbe.markov': { 'technical_blog.rbe.markov._mc_cdf': ( 'rbe/rbe_markov.html#_mc_cdf',
+                                                                                  'technical_blog/rbe/markov.py'),
+                                           'technical_blog.rbe.markov._mc_sparse': ( 'rbe/rbe_markov.html#_mc_sparse',
+                                                                                     'technical_blog/rbe/markov.py'),
+                                           'technical_blog.rbe.markov._mc_start': ( 'rbe/rbe_markov.html#_mc_start',
+                                                                                    'technical_blog/rbe/markov.py'),
+                                           'technical_blog.rbe.markov.mc_distribution': ( 'rbe/rbe_markov.html#mc_distribution',
+                                                                                          'technical_blog/rbe/markov.py'),
+                                           'technical_blog.rbe.markov.mc_evolve': ( 'rbe/rbe_markov.html#mc_evolve',
+                                                                                    'technical_blog/rbe/markov.py'),
+                                           'technical_blog.rbe.markov.mc_power': ( 'rbe/rbe_markov.html#mc_power',
+                                                                                   'technical_blog/rbe/markov.py'),
+                                           'technical_blog.rbe.markov.mc_sample': ( 'rbe/rbe_markov.html#mc_sample',
+                                                                                    'technical_blog/rbe/markov.py'),
+                                           'technical_blog.rbe.markov.mc_stationary': ( 'rbe/rbe_markov.html#mc_stationary',
+                                                                                        'technical_blog/rbe/markov.py'),
+                                           'technical_blog.rbe.markov.mc_validate': ( 'rbe/rbe_markov.html#mc_validate',
+                                                                                      'technical_blog/rbe/markov.py')},
+            'technical_blog.rbe.models': { 'technical_blog.rbe.models.ModelTracker': ( 'rbe/rbe_models.html#modeltracker',
+                                                                                       'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.ModelTracker.__init__': ( 'rbe/rbe_models.html#modeltracker.__init__',
+                                                                                                'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.ModelTracker._index': ( 'rbe/rbe_models.html#modeltracker._index',
+                                                                                              'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.ModelTracker.bayes_factors': ( 'rbe/rbe_models.html#modeltracker.bayes_factors',
+                                                                                                     'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.ModelTracker.best': ( 'rbe/rbe_models.html#modeltracker.best',
+                                                                                            'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.ModelTracker.interpret': ( 'rbe/rbe_models.html#modeltracker.interpret',
+                                                                                                 'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.ModelTracker.log_bayes_factors': ( 'rbe/rbe_models.html#modeltracker.log_bayes_factors',
+                                                                                                         'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.ModelTracker.log_posterior': ( 'rbe/rbe_models.html#modeltracker.log_posterior',
+                                                                                                     'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.ModelTracker.posterior': ( 'rbe/rbe_models.html#modeltracker.posterior',
+                                                                                                 'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.ModelTracker.update': ( 'rbe/rbe_models.html#modeltracker.update',
+                                                                                              'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models._model_loglik': ( 'rbe/rbe_models.html#_model_loglik',
+                                                                                        'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.interpret_bayes_factor': ( 'rbe/rbe_models.html#interpret_bayes_factor',
+                                                                                                 'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.model_gaussian': ( 'rbe/rbe_models.html#model_gaussian',
+                                                                                         'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.model_log_evidence': ( 'rbe/rbe_models.html#model_log_evidence',
+                                                                                             'technical_blog/rbe/models.py'),
+                                           'technical_blog.rbe.models.model_posterior': ( 'rbe/rbe_models.html#model_posterior',
+                                                                                          'technical_blog/rbe/models.py')},
+            'technical_blog.rbe.parallel': { 'technical_blog.rbe.parallel._ShmHistory': ( 'rbe/rbe_parallel.html#_shmhistory',
+                                                                                          'technical_blog/rbe/parallel.py'),
+                                             'technical_blog.rbe.parallel._ShmHistory.__init__': ( 'rbe/rbe_parallel.html#_shmhistory.__init__',
+                                                                                                   'technical_blog/rbe/parallel.py'),
+                                             'technical_blog.rbe.parallel._ShmHistory.append': ( 'rbe/rbe_parallel.html#_shmhistory.append',
+                                                                                                 'technical_blog/rbe/parallel.py'),
+                                             'technical_blog.rbe.parallel._rbe_layout': ( 'rbe/rbe_parallel.html#_rbe_layout',
+                                                                                          'technical_blog/rbe/parallel.py'),
+                                             'technical_blog.rbe.parallel._rbe_obs_dim': ( 'rbe/rbe_parallel.html#_rbe_obs_dim',
+                                                                                           'technical_blog/rbe/parallel.py'),
+                                             'technical_blog.rbe.parallel._rbe_run': ( 'rbe/rbe_parallel.html#_rbe_run',
+                                                                                       'technical_blog/rbe/parallel.py'),
+                                             'technical_blog.rbe.parallel._rbe_shard': ( 'rbe/rbe_parallel.html#_rbe_shard',
+                                                                                         'technical_blog/rbe/parallel.py'),
+                                             'technical_blog.rbe.parallel._rbe_state_dim': ( 'rbe/rbe_parallel.html#_rbe_state_dim',
+                                                                                             'technical_blog/rbe/parallel.py'),
+                                             'technical_blog.rbe.parallel._views': ( 'rbe/rbe_parallel.html#_views',
+                                                                                     'technical_blog/rbe/parallel.py'),
+                                             'technical_blog.rbe.parallel.rbe_parallel': ( 'rbe/rbe_parallel.html#rbe_parallel',
+                                                                                           'technical_blog/rbe/parallel.py')},
+            'technical_blog.rbe.patterns': { 'technical_blog.rbe.patterns.PatternDetector': ( 'rbe/rbe_patterns.html#patterndetector',
+                                                                                              'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector.__init__': ( 'rbe/rbe_patterns.html#patterndetector.__init__',
+                                                                                                       'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector.__len__': ( 'rbe/rbe_patterns.html#patterndetector.__len__',
+                                                                                                      'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector._rebase': ( 'rbe/rbe_patterns.html#patterndetector._rebase',
+                                                                                                      'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector.alerts': ( 'rbe/rbe_patterns.html#patterndetector.alerts',
+                                                                                                     'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector.log_odds': ( 'rbe/rbe_patterns.html#patterndetector.log_odds',
+                                                                                                       'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector.matches': ( 'rbe/rbe_patterns.html#patterndetector.matches',
+                                                                                                      'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector.probabilities': ( 'rbe/rbe_patterns.html#patterndetector.probabilities',
+                                                                                                            'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector.reset': ( 'rbe/rbe_patterns.html#patterndetector.reset',
+                                                                                                    'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector.update': ( 'rbe/rbe_patterns.html#patterndetector.update',
+                                                                                                     'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.PatternDetector.update_many': ( 'rbe/rbe_patterns.html#patterndetector.update_many',
+                                                                                                          'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector': ( 'rbe/rbe_patterns.html#sequencedetector',
+                                                                                               'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.__init__': ( 'rbe/rbe_patterns.html#sequencedetector.__init__',
+                                                                                                        'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.__len__': ( 'rbe/rbe_patterns.html#sequencedetector.__len__',
+                                                                                                       'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector._advance': ( 'rbe/rbe_patterns.html#sequencedetector._advance',
+                                                                                                        'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.alerts': ( 'rbe/rbe_patterns.html#sequencedetector.alerts',
+                                                                                                      'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.completed': ( 'rbe/rbe_patterns.html#sequencedetector.completed',
+                                                                                                         'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.entities': ( 'rbe/rbe_patterns.html#sequencedetector.entities',
+                                                                                                        'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.log_odds': ( 'rbe/rbe_patterns.html#sequencedetector.log_odds',
+                                                                                                        'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.probabilities': ( 'rbe/rbe_patterns.html#sequencedetector.probabilities',
+                                                                                                             'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.progress': ( 'rbe/rbe_patterns.html#sequencedetector.progress',
+                                                                                                        'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.reset': ( 'rbe/rbe_patterns.html#sequencedetector.reset',
+                                                                                                     'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.update': ( 'rbe/rbe_patterns.html#sequencedetector.update',
+                                                                                                      'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns.SequenceDetector.update_many': ( 'rbe/rbe_patterns.html#sequencedetector.update_many',
+                                                                                                           'technical_blog/rbe/patterns.py'),
+                                             'technical_blog.rbe.patterns._logit': ( 'rbe/rbe_patterns.html#_logit',
+                                                                                     'technical_blog/rbe/patterns.py')},
+            'technical_blog.rbe.pf': { 'technical_blog.rbe.pf.BatchedParticleFilter': ( 'rbe/rbe_pf.html#batchedparticlefilter',
+                                                                                        'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter.__init__': ( 'rbe/rbe_pf.html#batchedparticlefilter.__init__',
+                                                                                                 'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter._flip': ( 'rbe/rbe_pf.html#batchedparticlefilter._flip',
+                                                                                              'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter._resample': ( 'rbe/rbe_pf.html#batchedparticlefilter._resample',
+                                                                                                  'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter._spare': ( 'rbe/rbe_pf.html#batchedparticlefilter._spare',
+                                                                                               'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter._uniform': ( 'rbe/rbe_pf.html#batchedparticlefilter._uniform',
+                                                                                                 'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter._update': ( 'rbe/rbe_pf.html#batchedparticlefilter._update',
+                                                                                                'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter.effective_size': ( 'rbe/rbe_pf.html#batchedparticlefilter.effective_size',
+                                                                                                       'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter.estimate': ( 'rbe/rbe_pf.html#batchedparticlefilter.estimate',
+                                                                                                 'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter.particles': ( 'rbe/rbe_pf.html#batchedparticlefilter.particles',
+                                                                                                  'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter.predict': ( 'rbe/rbe_pf.html#batchedparticlefilter.predict',
+                                                                                                'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter.resample': ( 'rbe/rbe_pf.html#batchedparticlefilter.resample',
+                                                                                                 'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter.reset': ( 'rbe/rbe_pf.html#batchedparticlefilter.reset',
+                                                                                              'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter.step': ( 'rbe/rbe_pf.html#batchedparticlefilter.step',
+                                                                                             'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.BatchedParticleFilter.update': ( 'rbe/rbe_pf.html#batchedparticlefilter.update',
+                                                                                               'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter': ( 'rbe/rbe_pf.html#particlefilter',
+                                                                                 'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter.__init__': ( 'rbe/rbe_pf.html#particlefilter.__init__',
+                                                                                          'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter._flip': ( 'rbe/rbe_pf.html#particlefilter._flip',
+                                                                                       'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter._spare': ( 'rbe/rbe_pf.html#particlefilter._spare',
+                                                                                        'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter._uniform': ( 'rbe/rbe_pf.html#particlefilter._uniform',
+                                                                                          'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter.effective_size': ( 'rbe/rbe_pf.html#particlefilter.effective_size',
+                                                                                                'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter.estimate': ( 'rbe/rbe_pf.html#particlefilter.estimate',
+                                                                                          'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter.particles': ( 'rbe/rbe_pf.html#particlefilter.particles',
+                                                                                           'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter.predict': ( 'rbe/rbe_pf.html#particlefilter.predict',
+                                                                                         'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter.resample': ( 'rbe/rbe_pf.html#particlefilter.resample',
+                                                                                          'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter.reset': ( 'rbe/rbe_pf.html#particlefilter.reset',
+                                                                                       'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter.step': ( 'rbe/rbe_pf.html#particlefilter.step',
+                                                                                      'technical_blog/rbe/pf.py'),
+                                       'technical_blog.rbe.pf.ParticleFilter.update': ( 'rbe/rbe_pf.html#particlefilter.update',
+                                                                                        'technical_blog/rbe/pf.py')},
+            'technical_blog.rbe.recursive': { 'technical_blog.rbe.recursive.ThreatMonitor': ( 'rbe/recursive_updating.html#threatmonitor',
+                                                                                              'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.ThreatMonitor.__init__': ( 'rbe/recursive_updating.html#threatmonitor.__init__',
+                                                                                                       'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.ThreatMonitor._sigmoid': ( 'rbe/recursive_updating.html#threatmonitor._sigmoid',
+                                                                                                       'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.ThreatMonitor._threshold_log_odds': ( 'rbe/recursive_updating.html#threatmonitor._threshold_log_odds',
+                                                                                                                  'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.ThreatMonitor.alerts': ( 'rbe/recursive_updating.html#threatmonitor.alerts',
+                                                                                                     'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.ThreatMonitor.probabilities': ( 'rbe/recursive_updating.html#threatmonitor.probabilities',
+                                                                                                            'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.ThreatMonitor.reset': ( 'rbe/recursive_updating.html#threatmonitor.reset',
+                                                                                                    'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.ThreatMonitor.run': ( 'rbe/recursive_updating.html#threatmonitor.run',
+                                                                                                  'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.ThreatMonitor.update': ( 'rbe/recursive_updating.html#threatmonitor.update',
+                                                                                                     'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.WindowedPosterior': ( 'rbe/recursive_updating.html#windowedposterior',
+                                                                                                  'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.WindowedPosterior.__init__': ( 'rbe/recursive_updating.html#windowedposterior.__init__',
+                                                                                                           'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.WindowedPosterior.belief': ( 'rbe/recursive_updating.html#windowedposterior.belief',
+                                                                                                         'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.WindowedPosterior.update': ( 'rbe/recursive_updating.html#windowedposterior.update',
+                                                                                                         'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive._log_prefix': ( 'rbe/recursive_updating.html#_log_prefix',
+                                                                                            'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive._window_posterior': ( 'rbe/recursive_updating.html#_window_posterior',
+                                                                                                  'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.adaptation_sweep': ( 'rbe/recursive_updating.html#adaptation_sweep',
+                                                                                                 'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.adaptive_threat_monitor': ( 'rbe/recursive_updating.html#adaptive_threat_monitor',
                                                                                                         'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.batch_vs_recursive_comparison': ( 'rbe/recursive_updating.html#batch_vs_recursive_comparison',
                                                                                                               'technical_blog/rbe/recursive.py'),
@@ -99,8 +429,6 @@ d = { 'settings': { 'branch': 'main',
                                                                                                 'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.forgetting_factor_filter': ( 'rbe/recursive_updating.html#forgetting_factor_filter',
                                                                                                          'technical_blog/rbe/recursive.py'),
-                                              'technical_blog.rbe.recursive.get': ( 'rbe/recursive_updating.html#get',
-                                                                                    'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.markov_chain_demo': ( 'rbe/recursive_updating.html#markov_chain_demo',
                                                                                                   'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.memory_analysis_corrected': ( 'rbe/recursive_updating.html#memory_analysis_corrected',
@@ -119,10 +447,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                                      'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.position_likelihood': ( 'rbe/recursive_updating.html#position_likelihood',
                                                                                                     'technical_blog/rbe/recursive.py'),
-                                              'technical_blog.rbe.recursive.post': ( 'rbe/recursive_updating.html#post',
-                                                                                     'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.recursive_bayes_demo': ( 'rbe/recursive_updating.html#recursive_bayes_demo',
                                                                                                      'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.recursive_update_app': ( 'rbe/recursive_updating.html#recursive_update_app',
+                                                                                                     'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.recursive_update_component': ( 'rbe/recursive_updating.html#recursive_update_component',
                                                                                                            'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.rolling_memory_analysis': ( 'rbe/recursive_updating.html#rolling_memory_analysis',
@@ -131,6 +459,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                           'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.update_baseline': ( 'rbe/recursive_updating.html#update_baseline',
                                                                                                 'technical_blog/rbe/recursive.py'),
+                                              'technical_blog.rbe.recursive.windowed_beliefs': ( 'rbe/recursive_updating.html#windowed_beliefs',
+                                                                                                 'technical_blog/rbe/recursive.py'),
                                               'technical_blog.rbe.recursive.windowed_filter': ( 'rbe/recursive_updating.html#windowed_filter',
                                                                                                 'technical_blog/rbe/recursive.py')},
             'technical_blog.rbe.uncertainty': { 'technical_blog.rbe.uncertainty.bayesian_intrusion_detection': ( 'rbe/uncertainty_fundamentals.html#bayesian_intrusion_detection',
@@ -142,4 +472,11 @@ d = { 'settings': { 'branch': 'main',
                                                 'technical_blog.rbe.uncertainty.explore_distributions': ( 'rbe/uncertainty_fundamentals.html#explore_distributions',
                                                                                                           'technical_blog/rbe/uncertainty.py'),
                                                 'technical_blog.rbe.uncertainty.multi_threat_assessment': ( 'rbe/uncertainty_fundamentals.html#multi_threat_assessment',
-                                                                                                            'technical_blog/rbe/uncertainty.py')}}}
+                                                                                                            'technical_blog/rbe/uncertainty.py')},
+            'technical_blog.rbe.viz': { 'technical_blog.rbe.viz.viz_beliefs': ('rbe/rbe_viz.html#viz_beliefs', 'technical_blog/rbe/viz.py'),
+                                        'technical_blog.rbe.viz.viz_comparison': ( 'rbe/rbe_viz.html#viz_comparison',
+                                                                                   'technical_blog/rbe/viz.py'),
+                                        'technical_blog.rbe.viz.viz_particles': ( 'rbe/rbe_viz.html#viz_particles',
+                                                                                  'technical_blog/rbe/viz.py'),
+                                        'technical_blog.rbe.viz.viz_rbe_summary': ( 'rbe/rbe_viz.html#viz_rbe_summary',
+                                                                                    'technical_blog/rbe/viz.py')}}}
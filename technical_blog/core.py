@@ -3,14 +3,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_core.ipynb.
 
 # %% auto 0
-__all__ = ['get_nb_url', 'slugify', 'read_meta']
+__all__ = ['get_nb_url', 'slugify', 'read_meta', 'import_profile', 'check_import']
 
 # %% ../nbs/00_core.ipynb 2
 from fastcore.basics import *
 from pathlib import Path
-import re
+import os, re, subprocess, sys
 
-__all__ = ['get_nb_url', 'slugify', 'read_meta']
+__all__ = ['get_nb_url', 'slugify', 'read_meta', 'import_profile', 'check_import']
 
 # %% ../nbs/00_core.ipynb 4
 def get_nb_url(nb_path: Path) -> str:
@@ -66,3 +66,40 @@ def read_meta(nb_path: Path) -> dict:
         'title': title,
         'description': description
     }
+
+# %% ../nbs/00_core.ipynb 11
+def import_profile(module: str, python: str = sys.executable) -> dict:
+    "Import `module` in a fresh interpreter under `-X importtime`; return its import time, imported modules and stdout"
+    # The child sees the same import path as this process, so uninstalled checkouts work too
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(p for p in sys.path if p)}
+    def _run(code):
+        res = subprocess.run([python, '-X', 'importtime', '-c', code], capture_output=True, text=True, env=env)
+        if res.returncode: raise ImportError(res.stderr.strip().splitlines()[-1])
+        # Lines look like `import time: self [us] | cumulative | <indent>name`; nesting is shown by indentation
+        rows = [line.split('|') for line in res.stderr.splitlines() if line.startswith('import time:') and 'cumulative' not in line]
+        return res.stdout, [(r[2][1:], int(r[1])) for r in rows]
+    _, startup = _run('pass')
+    startup = {name.strip() for name, _ in startup}
+    stdout, rows = _run(f'import {module}')
+    # Attribute to `module` only what a bare interpreter does not already import
+    rows = [(name, us) for name, us in rows if name.strip() not in startup]
+    return {
+        'seconds': sum(us for name, us in rows if not name.startswith(' ')) / 1e6,
+        'modules': {name.strip(): us / 1e6 for name, us in rows},
+        'stdout': stdout
+    }
+
+# %% ../nbs/00_core.ipynb 13
+def check_import(module: str, max_modules: int, max_seconds: float,
+                 forbidden=('matplotlib', 'seaborn', 'fasthtml', 'monsterui', 'IPython')) -> dict:
+    "Assert that importing `module` prints nothing, skips `forbidden` packages and stays within its module and time budgets"
+    prof = import_profile(module)
+    n, problems = len(prof['modules']), []
+    if prof['stdout']: problems.append(f"prints {prof['stdout'][:60]!r}")
+    # A forbidden name matches the package and all of its submodules
+    heavy = sorted({m for m in prof['modules'] if m.split('.')[0] in forbidden or m in forbidden})
+    if heavy: problems.append(f"loads {', '.join(heavy[:5])}")
+    if n > max_modules: problems.append(f"loads {n} modules (budget {max_modules})")
+    if prof['seconds'] > max_seconds: problems.append(f"takes {prof['seconds']:.2f}s (budget {max_seconds}s)")
+    if problems: raise AssertionError(f"importing {module} " + '; '.join(problems))
+    return prof
@@ -3,26 +3,22 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/02_bayes_theorem.ipynb.
 
 # %% auto 0
-__all__ = ['example', 'fig', 'axes', 'priors', 'likelihoods', 'posteriors', 'ax', 'sources', 'reliabilities', 'fusion_results',
-           'source_labels', 'base_rate', 'sensitivity', 'specificity', 'fpr', 'tp_rate', 'fp_rate', 'precision',
-           'test_observations', 'results', 'time_steps', 'obs_steps', 'bayes_theorem_step_by_step',
-           'visualize_bayes_update', 'bayes_calculator_component', 'sensitivity_analysis', 'plot_sensitivity_heatmap',
-           'threat_intelligence_fusion', 'false_rate_analysis', 'plot_roc_and_precision_recall',
-           'demonstrate_base_rate_neglect', 'demonstrate_conjunction_fallacy', 'model_comparison_cybersec',
-           'interpret_bayes_factor', 'integrated_threat_tracking']
+__all__ = ['bayes_theorem_step_by_step', 'visualize_bayes_update', 'bayes_calculator_component', 'sensitivity_grid',
+           'sensitivity_analysis', 'plot_sensitivity_heatmap', 'threat_intelligence_fusion', 'false_rate_analysis',
+           'plot_roc_and_precision_recall', 'demonstrate_base_rate_neglect', 'demonstrate_conjunction_fallacy',
+           'model_comparison_cybersec', 'integrated_threat_tracking']
 
 # %% ../../nbs/rbe/02_bayes_theorem.ipynb 3
 import numpy as np
-import matplotlib.pyplot as plt
 from fastcore.test import test_eq, test_close
 from fastcore.all import *
-from .core import *
+from .core import bayes_update, pf_init, pf_step, prob_entropy
 from .uncertainty import *
-from fasthtml.common import *
+from .detection import det_sweep
+from .models import model_log_evidence, model_posterior, interpret_bayes_factor
 from typing import List, Dict, Tuple, Optional
-import seaborn as sns
 
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 5
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 6
 def bayes_theorem_step_by_step(prior, likelihood, evidence=None, labels=None):
     """Step-by-step Bayes theorem calculation with detailed explanations"""
     prior = np.asarray(prior)
@@ -63,16 +59,10 @@ def bayes_theorem_step_by_step(prior, likelihood, evidence=None, labels=None):
         'labels': labels
     }
 
-# Demonstrate with cybersecurity example
-example = bayes_theorem_step_by_step(
-    prior=[0.05, 0.95],  # 5% chance of attack initially
-    likelihood=[0.9, 0.1],  # Attack causes suspicious activity 90% of time
-    labels=['Attack', 'Normal']
-)
-
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 7
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 9
 def visualize_bayes_update(prior, likelihood, title="Bayes' Theorem Visualization"):
     """Visualize how Bayes' theorem updates probability distributions"""
+    import matplotlib.pyplot as plt
     
     # Ensure inputs are numpy arrays
     prior = np.asarray(prior)
@@ -130,17 +120,10 @@ def visualize_bayes_update(prior, likelihood, title="Bayes' Theorem Visualizatio
     plt.tight_layout()
     return fig, axes
 
-# Visualize the cybersecurity example
-fig, axes = visualize_bayes_update(
-    prior=np.array([0.05, 0.95]),
-    likelihood=np.array([0.9, 0.1]),
-    title="Updating Attack Probability with Suspicious Activity"
-)
-plt.show()
-
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 8
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 11
 def bayes_calculator_component():
     """Create interactive Bayes theorem calculator using FastHTML"""
+    from fasthtml.common import Card, Div, H3, H4, Input, Label, Option, Script, Select, Span
     
     return Div(
         Card(
@@ -321,47 +304,52 @@ def bayes_calculator_component():
         """)
     )
 
-# Display the calculator (in FastHTML app this would be interactive)
-print("Interactive Bayes' Theorem Calculator created!")
-print("Features:")
-print("- Real-time probability updates")
-print("- Multiple cybersecurity scenarios")
-print("- Bayes factor interpretation")
-print("- Information gain calculation")
-
-from IPython.display import HTML
-HTML(str(bayes_calculator_component()))
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 14
+def _sens_blocks(n_rows, n_cols, chunk_size):
+    "Row and column slices covering an `(n_rows, n_cols)` array in blocks of about `chunk_size` elements"
+    rows, cols = max(1, chunk_size // max(n_cols, 1)), max(1, min(n_cols, chunk_size))
+    for i in range(0, n_rows, rows):
+        for j in range(0, n_cols, cols): yield slice(i, i+rows), slice(j, j+cols)
+
+def sensitivity_grid(priors, likelihoods, fp_likelihoods=None, out=None, chunk_size=2**16):
+    """Posterior P(Attack|Evidence) for every combination of `priors`, `likelihoods` and `fp_likelihoods`"""
+    p, L = np.asarray(priors, dtype=float), np.asarray(likelihoods, dtype=float)
+    # Without false-positive rates, assume the complementary likelihood for the normal case
+    F = np.clip(1 - L + 0.1, 0.01, 0.99) if fp_likelihoods is None else np.asarray(fp_likelihoods, dtype=float)
+    for name, v in (('priors', p), ('likelihoods', L), ('fp_likelihoods', F)):
+        if v.ndim > 1: raise ValueError(f"`{name}` must be a scalar or 1-D array")
+    dims = [d for d, v in (('prior', p), ('likelihood', L)) if v.ndim]
+    own_fp = fp_likelihoods is not None and F.ndim == 1
+    if own_fp: dims.append('fp_likelihood')
+    # posterior = 1 / (1 + prior odds against attack * likelihood ratio against attack);
+    # NaN marks evidence that is impossible under both hypotheses
+    with np.errstate(divide='ignore', invalid='ignore'):
+        q = (1 - p) / p
+        r = F / (L[:, None] if own_fp and L.ndim else L)
+    shape = q.shape + r.shape
+    if out is None: out = np.empty(shape)
+    elif out.shape != shape or not out.flags.c_contiguous:
+        raise ValueError(f"`out` must be a C-contiguous array of shape {shape}")
+    q2, r2, o2 = q.reshape(-1, 1), r.reshape(1, -1), out.reshape(q.size, r.size)
+    # Work through cache-sized blocks in place, so a memory-mapped `out` is filled without full-size temporaries
+    with np.errstate(invalid='ignore'):
+        for rs, cs in _sens_blocks(q.size, r.size, chunk_size):
+            o = o2[rs, cs]
+            np.multiply(q2[rs], r2[:, cs], out=o)
+            o += 1
+            np.reciprocal(o, out=o)
+    coords = dict(prior=p, likelihood=L, fp_likelihood=F)
+    return dict(posterior=out, dims=tuple(dims), coords=coords)
 
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 10
 def sensitivity_analysis(prior_range, likelihood_range, n_points=50):
     """Analyze sensitivity of posterior to changes in prior and likelihood"""
-    
-    prior_min, prior_max = prior_range
-    like_min, like_max = likelihood_range
-    
-    # Create parameter grids
-    priors = np.linspace(prior_min, prior_max, n_points)
-    likelihoods = np.linspace(like_min, like_max, n_points)
-    
-    # Calculate posterior for each combination
-    posteriors = np.zeros((n_points, n_points))
-    
-    for i, prior in enumerate(priors):
-        for j, likelihood in enumerate(likelihoods):
-            # Assume complementary likelihood for normal case
-            likelihood_normal = 1 - likelihood + 0.1  # Add small offset
-            likelihood_normal = np.clip(likelihood_normal, 0.01, 0.99)
-            
-            posterior = bayes_update(
-                np.array([prior, 1-prior]), 
-                np.array([likelihood, likelihood_normal])
-            )[0]
-            posteriors[i, j] = posterior
-    
-    return priors, likelihoods, posteriors
+    priors = np.linspace(*prior_range, n_points)
+    likelihoods = np.linspace(*likelihood_range, n_points)
+    return priors, likelihoods, sensitivity_grid(priors, likelihoods)['posterior']
 
 def plot_sensitivity_heatmap(priors, likelihoods, posteriors, title="Posterior Sensitivity Analysis"):
     """Plot sensitivity analysis as a heatmap"""
+    import matplotlib.pyplot as plt
     
     fig, ax = plt.subplots(figsize=(10, 8))
     
@@ -386,23 +374,7 @@ def plot_sensitivity_heatmap(priors, likelihoods, posteriors, title="Posterior S
     
     return fig, ax
 
-# Run sensitivity analysis
-priors, likelihoods, posteriors = sensitivity_analysis(
-    prior_range=(0.01, 0.3),     # Prior from 1% to 30%
-    likelihood_range=(0.5, 0.99) # Likelihood from 50% to 99%
-)
-
-fig, ax = plot_sensitivity_heatmap(priors, likelihoods, posteriors, 
-                                  "Sensitivity: How Prior and Likelihood Affect Posterior")
-plt.show()
-
-print("\nSensitivity Analysis Insights:")
-print("- Light regions: High posterior probability (confident attack detection)")
-print("- Dark regions: Low posterior probability (likely false alarm)")
-print("- Contour lines: Iso-probability curves")
-print("- Steep gradients: High sensitivity to parameter changes")
-
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 12
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 19
 def threat_intelligence_fusion(intelligence_sources, reliabilities, rng=None):
     """Fuse multiple threat intelligence sources using Bayesian updating"""
     if rng is None: rng = np.random.default_rng(42)
@@ -441,67 +413,19 @@ def threat_intelligence_fusion(intelligence_sources, reliabilities, rng=None):
     
     return np.array(belief_history)
 
-# Demonstrate threat intelligence fusion
-sources = ['Commercial_TI', 'Government_Feed', 'OSINT_Analysis', 'Internal_SOC']
-reliabilities = [0.85, 0.95, 0.70, 0.80]
-
-fusion_results = threat_intelligence_fusion(sources, reliabilities)
-
-# Visualize the fusion process
-fig, ax = viz_beliefs(fusion_results[:, 0], title='Threat Intelligence Fusion Over Time')
-ax.set_ylabel('Threat Probability')
-ax.set_xlabel('Intelligence Source')
-
-# Add source labels
-source_labels = ['Initial'] + sources
-ax.set_xticks(range(len(source_labels)))
-ax.set_xticklabels(source_labels, rotation=45, ha='right')
-
-plt.tight_layout()
-plt.show()
-
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 14
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 22
 def false_rate_analysis(base_rate, sensitivity, specificity, threshold_range=(0.1, 0.9)):
     """Analyze false positive and false negative rates across decision thresholds"""
     
     thresholds = np.linspace(threshold_range[0], threshold_range[1], 100)
-    
-    results = {
-        'thresholds': thresholds,
-        'false_positive_rate': [],
-        'false_negative_rate': [],
-        'precision': [],
-        'recall': []
-    }
-    
-    for threshold in thresholds:
-        # For each threshold, calculate confusion matrix elements
-        
-        # True positive rate (sensitivity)
-        tpr = sensitivity
-        
-        # False positive rate
-        fpr = 1 - specificity
-        
-        # Calculate actual rates based on base rate
-        tp = base_rate * tpr  # True attacks correctly identified
-        fp = (1 - base_rate) * fpr  # Normal activity flagged as attack
-        tn = (1 - base_rate) * specificity  # Normal activity correctly identified
-        fn = base_rate * (1 - tpr)  # Attacks missed
-        
-        # Calculate metrics
-        precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-        recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-        
-        results['false_positive_rate'].append(fpr)
-        results['false_negative_rate'].append(1 - tpr)
-        results['precision'].append(precision)
-        results['recall'].append(recall)
-    
-    return results
+    # Sensitivity and specificity fix the confusion matrix, so every threshold has the same rates
+    m = det_sweep(base_rate, np.full_like(thresholds, sensitivity), specificity)
+    keys = ['false_positive_rate', 'false_negative_rate', 'precision', 'recall']
+    return {'thresholds': thresholds, **{k: m[k] for k in keys}}
 
 def plot_roc_and_precision_recall(base_rate, sensitivity, specificity):
     """Plot ROC curve and Precision-Recall curve"""
+    import matplotlib.pyplot as plt
     
     # Generate data for different sensitivity/specificity combinations
     sensitivities = np.linspace(0.1, 0.99, 50)
@@ -521,22 +445,10 @@ def plot_roc_and_precision_recall(base_rate, sensitivity, specificity):
     ax1.legend()
     ax1.grid(True, alpha=0.3)
     
-    # Precision-Recall Curve
-    precisions = []
-    recalls = []
-    
-    for sens in sensitivities:
-        for spec in specificities:
-            tp = base_rate * sens
-            fp = (1 - base_rate) * (1 - spec)
-            fn = base_rate * (1 - sens)
-            
-            precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-            recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-            
-            if precision > 0 and recall > 0:
-                precisions.append(precision)
-                recalls.append(recall)
+    # Precision-Recall Curve over every sensitivity/specificity pair
+    m = det_sweep(base_rate, sensitivities[:, None], specificities)
+    keep = (m['precision'] > 0) & (m['recall'] > 0)
+    precisions, recalls = m['precision'][keep], m['recall'][keep]
     
     ax2.scatter(recalls, precisions, alpha=0.6, s=1)
     ax2.axhline(base_rate, color='r', linestyle='--', alpha=0.5, 
@@ -550,32 +462,7 @@ def plot_roc_and_precision_recall(base_rate, sensitivity, specificity):
     plt.tight_layout()
     return fig, (ax1, ax2)
 
-# Analyze false rates for cybersecurity detection
-base_rate = 0.05  # 5% of events are actual attacks
-sensitivity = 0.90  # 90% of attacks are detected
-specificity = 0.95  # 95% of normal events are correctly classified
-
-print(f"Cybersecurity Detection Analysis:")
-print(f"Base attack rate: {base_rate*100:.1f}%")
-print(f"Sensitivity (attack detection rate): {sensitivity*100:.1f}%")
-print(f"Specificity (normal classification rate): {specificity*100:.1f}%")
-
-# Calculate key metrics
-fpr = 1 - specificity
-tp_rate = base_rate * sensitivity
-fp_rate = (1 - base_rate) * fpr
-precision = tp_rate / (tp_rate + fp_rate)
-
-print(f"\nResults:")
-print(f"False Positive Rate: {fpr*100:.1f}%")
-print(f"Precision (when alarm raised): {precision*100:.1f}%")
-print(f"False alarms per true attack: {fp_rate/tp_rate:.1f}")
-
-# Plot ROC and Precision-Recall curves
-fig, axes = plot_roc_and_precision_recall(base_rate, sensitivity, specificity)
-plt.show()
-
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 16
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 26
 def demonstrate_base_rate_neglect():
     """Demonstrate the base rate neglect fallacy with cybersecurity examples"""
     
@@ -628,101 +515,62 @@ def demonstrate_conjunction_fallacy():
     print(f"P(Risk AND Financial Access) = {p_both:.2f}")
     print(f"\nThe conjunction is always less likely than its components!")
 
-# Run demonstrations
-demonstrate_base_rate_neglect()
-demonstrate_conjunction_fallacy()
-
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 18
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 29
 def model_comparison_cybersec(evidence_data, rng=None):
     """Compare different threat models using Bayes factors"""
     if rng is None: rng = np.random.default_rng(42)
     
-    # Define competing models
+    # Define competing models by their log-likelihoods, so long evidence sums instead of underflowing
     models = {
         'Benign': {
             'prior': 0.7,
-            'likelihood_fn': lambda evidence: np.exp(-0.5 * evidence**2)  # Normal activity
+            'log_likelihood_fn': lambda evidence: -0.5 * evidence**2  # Normal activity
         },
         'Insider_Threat': {
             'prior': 0.15,
-            'likelihood_fn': lambda evidence: np.exp(-0.5 * (evidence - 2)**2)  # Moderate anomaly
+            'log_likelihood_fn': lambda evidence: -0.5 * (evidence - 2)**2  # Moderate anomaly
         },
         'External_Attack': {
             'prior': 0.10,
-            'likelihood_fn': lambda evidence: np.exp(-0.5 * (evidence - 4)**2)  # High anomaly
+            'log_likelihood_fn': lambda evidence: -0.5 * (evidence - 4)**2  # High anomaly
         },
         'APT': {
             'prior': 0.05,
-            'likelihood_fn': lambda evidence: np.exp(-0.5 * (evidence - 1)**2) * 0.5 + 
-                                            np.exp(-0.5 * (evidence - 3)**2) * 0.5  # Bimodal
+            'log_likelihood_fn': lambda evidence: np.logaddexp(-0.5 * (evidence - 1)**2,
+                                                               -0.5 * (evidence - 3)**2) + np.log(0.5)  # Bimodal
         }
     }
-    
-    # Calculate model evidence for each model
-    model_evidence = {}
+    names = list(models)
+    priors = np.array([m['prior'] for m in models.values()])
     
     print("=== MODEL COMPARISON ANALYSIS ===")
     print(f"Evidence data: {evidence_data}\n")
     
-    for model_name, model in models.items():
-        # Calculate likelihood of evidence under this model
-        likelihood = 1.0
-        for evidence in evidence_data:
-            likelihood *= model['likelihood_fn'](evidence)
-        
-        # Model evidence = prior × likelihood
-        evidence_val = model['prior'] * likelihood
-        model_evidence[model_name] = evidence_val
-        
-        print(f"{model_name:15}: Prior={model['prior']:.3f}, Likelihood={likelihood:.6f}, Evidence={evidence_val:.8f}")
+    # Log model evidence = log prior + sum of log-likelihoods over all evidence
+    log_lik = model_log_evidence({n: m['log_likelihood_fn'] for n, m in models.items()}, np.asarray(evidence_data, dtype=float))
+    for name, prior, ll in zip(names, priors, log_lik):
+        print(f"{name:15}: Prior={prior:.3f}, Log-likelihood={ll:.4f}, Log-evidence={np.log(prior) + ll:.4f}")
     
-    # Normalize to get posterior model probabilities
-    total_evidence = sum(model_evidence.values())
-    model_posteriors = {name: evidence/total_evidence for name, evidence in model_evidence.items()}
+    # Normalize to get posterior model probabilities (log-sum-exp)
+    log_post = model_posterior(log_lik, priors, log=True)
+    model_posteriors = dict(zip(names, np.exp(log_post)))
     
     print("\n=== POSTERIOR MODEL PROBABILITIES ===")
     for model_name, posterior in sorted(model_posteriors.items(), key=lambda x: x[1], reverse=True):
         print(f"{model_name:15}: {posterior*100:6.2f}%")
     
     # Calculate Bayes factors (relative to most likely model)
-    best_model = max(model_posteriors.items(), key=lambda x: x[1])
-    print(f"\n=== BAYES FACTORS (relative to {best_model[0]}) ===")
+    best = int(np.argmax(log_post))
+    print(f"\n=== BAYES FACTORS (relative to {names[best]}) ===")
     
-    for model_name, posterior in model_posteriors.items():
-        if model_name != best_model[0]:
-            bayes_factor = best_model[1] / posterior
+    for k, model_name in enumerate(names):
+        if k != best:
+            with np.errstate(over='ignore'): bayes_factor = np.exp(log_post[best] - log_post[k])
             print(f"{model_name:15}: BF = {bayes_factor:6.2f} ({interpret_bayes_factor(bayes_factor)})")
     
     return model_posteriors
 
-def interpret_bayes_factor(bf):
-    """Interpret Bayes factor strength of evidence"""
-    if bf < 1:
-        return "Evidence against"
-    elif bf < 3:
-        return "Weak evidence"
-    elif bf < 10:
-        return "Moderate evidence"
-    elif bf < 30:
-        return "Strong evidence"
-    elif bf < 100:
-        return "Very strong evidence"
-    else:
-        return "Decisive evidence"
-
-# Test with different evidence scenarios
-print("Scenario 1: Low anomaly evidence")
-model_comparison_cybersec([0.5, 0.8, 0.3])
-
-print("\n" + "="*50)
-print("Scenario 2: High anomaly evidence")
-model_comparison_cybersec([3.5, 4.2, 3.8])
-
-print("\n" + "="*50)
-print("Scenario 3: Mixed evidence (possible APT)")
-model_comparison_cybersec([1.2, 2.8, 1.5, 3.1])
-
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 20
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 33
 def integrated_threat_tracking(observations, rng=None):
     """Demonstrate integration of Bayes theorem with RBE particle filtering"""
     if rng is None: rng = np.random.default_rng(42)
@@ -785,44 +633,12 @@ def integrated_threat_tracking(observations, rng=None):
         'threat_types': threat_types
     }
 
-# Run integrated tracking demonstration
-test_observations = [0.2, 0.35, 0.6, 0.8, 0.75, 0.4, 0.1]
-results = integrated_threat_tracking(test_observations)
-
-# Visualize results
-fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-
-# Plot discrete belief evolution
-time_steps = np.arange(len(results['discrete_beliefs']))
-for i, threat_type in enumerate(results['threat_types']):
-    ax1.plot(time_steps, results['discrete_beliefs'][:, i], 
-            marker='o', label=threat_type)
-
-ax1.set_title('Discrete Threat Classification (Bayesian Updates)')
-ax1.set_xlabel('Time Step')
-ax1.set_ylabel('Probability')
-ax1.legend()
-ax1.grid(True, alpha=0.3)
-
-# Plot continuous threat level
-obs_steps = np.arange(1, len(results['continuous_estimates']) + 1)
-ax2.plot(obs_steps, results['continuous_estimates'], 'r-o', label='Threat Level')
-ax2.plot(obs_steps, test_observations, 'b--s', alpha=0.7, label='Observations')
-
-ax2.set_title('Continuous Threat Level (Particle Filter)')
-ax2.set_xlabel('Time Step')
-ax2.set_ylabel('Threat Level')
-ax2.legend()
-ax2.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.show()
-
-# %% ../../nbs/rbe/02_bayes_theorem.ipynb 22
+# %% ../../nbs/rbe/02_bayes_theorem.ipynb 37
 __all__ = [
     'bayes_theorem_step_by_step',
     'visualize_bayes_update',
     'bayes_calculator_component',
+    'sensitivity_grid',
     'sensitivity_analysis',
     'plot_sensitivity_heatmap',
     'threat_intelligence_fusion',
@@ -0,0 +1,130 @@
+"""Columnar discrete-hypothesis beliefs for many entities, updated in bulk"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00d_rbe_beliefs.ipynb.
+
+# %% auto 0
+__all__ = ['BeliefTable']
+
+# %% ../../nbs/rbe/00d_rbe_beliefs.ipynb 3
+import numpy as np
+
+# %% ../../nbs/rbe/00d_rbe_beliefs.ipynb 6
+class BeliefTable:
+    "Discrete beliefs for many entities in one contiguous `(n_entities, n_hypotheses)` array"
+    def __init__(self, prior, likelihoods, hypotheses=None, capacity=1024, dtype=np.float64):
+        self.prior = np.asarray(prior, dtype=dtype)
+        self.prior = self.prior / self.prior.sum()
+        if isinstance(likelihoods, dict): self.evidence_types, likelihoods = list(likelihoods), list(likelihoods.values())
+        else: self.evidence_types = None
+        likelihoods = np.asarray(likelihoods, dtype=np.float64)
+        if likelihoods.shape[-1] != len(self.prior): raise ValueError("Likelihood rows must have one entry per hypothesis")
+        with np.errstate(divide='ignore'): self.log_likelihoods = np.log(likelihoods)
+        self.hypotheses, self.dtype = hypotheses, dtype
+        self._beliefs = np.empty((max(capacity, 1), len(self.prior)), dtype=dtype)
+        self._keys, self._key_rows, self._ids = None, np.empty(0, dtype=np.intp), []
+        self.n = 0
+        if self.evidence_types is not None:
+            self._ev_order = np.argsort(self.evidence_types)
+            self._ev_sorted = np.asarray(self.evidence_types)[self._ev_order]
+
+    def __len__(self): return self.n
+
+    @property
+    def beliefs(self):
+        "View of the `(n_entities, n_hypotheses)` beliefs, one row per entity in insertion order"
+        return self._beliefs[:self.n]
+
+    @property
+    def entity_ids(self):
+        "Entity ids in row order"
+        return np.concatenate(self._ids) if self._ids else np.empty(0)
+
+    def _lookup(self, ids):
+        "Rows of `ids`, with -1 for unseen entities"
+        if self._keys is None or not len(self._keys): return np.full(len(ids), -1, dtype=np.intp)
+        pos = np.minimum(np.searchsorted(self._keys, ids), len(self._keys) - 1)
+        return np.where(self._keys[pos] == ids, self._key_rows[pos], -1)
+
+    def _grow(self, size):
+        if size <= len(self._beliefs): return
+        beliefs = np.empty((max(size, 2 * len(self._beliefs)), self._beliefs.shape[1]), dtype=self.dtype)
+        beliefs[:self.n] = self.beliefs
+        self._beliefs = beliefs
+
+    def add(self, entity_ids):
+        "Add unseen `entity_ids` with the prior and return the rows of all `entity_ids`"
+        ids = np.asarray(entity_ids)
+        rows = self._lookup(ids)
+        new = rows < 0
+        if new.any():
+            new_ids = np.unique(ids[new])
+            new_rows = np.arange(self.n, self.n + len(new_ids))
+            self._grow(self.n + len(new_ids))
+            self._beliefs[self.n:self.n + len(new_ids)] = self.prior
+            self.n += len(new_ids)
+            self._ids.append(new_ids)
+            # Insert the (sorted, unseen) new ids into the sorted index in one pass
+            if self._keys is None: self._keys, self._key_rows = new_ids, new_rows
+            else:
+                # Widen the key dtype first, or longer string ids would be cut to the width of the first batch
+                keys = self._keys.astype(np.result_type(self._keys, new_ids), copy=False)
+                pos = np.searchsorted(keys, new_ids)
+                self._keys, self._key_rows = np.insert(keys, pos, new_ids), np.insert(self._key_rows, pos, new_rows)
+            rows[new] = new_rows[np.searchsorted(new_ids, ids[new])]
+        return rows
+
+    def rows(self, entity_ids):
+        "Rows of known `entity_ids`"
+        rows = self._lookup(np.asarray(entity_ids))
+        if (rows < 0).any(): raise KeyError(f"Unknown entities: {np.asarray(entity_ids)[rows < 0][:5]}")
+        return rows
+
+    def __getitem__(self, entity_id): return self.beliefs[self.rows([entity_id])[0]]
+
+    def _evidence_rows(self, evidence):
+        evidence = np.asarray(evidence)
+        if evidence.dtype.kind not in 'UO': return evidence
+        if self.evidence_types is None: raise ValueError("Named evidence needs a dict of likelihoods")
+        pos = np.minimum(np.searchsorted(self._ev_sorted, evidence), len(self._ev_sorted) - 1)
+        if (self._ev_sorted[pos] != evidence).any(): raise ValueError(f"Unknown evidence types: {set(evidence[self._ev_sorted[pos] != evidence])}")
+        return self._ev_order[pos]
+
+    def update(self, entity_ids, evidence_type_ids):
+        "Apply one piece of evidence per `(entity, evidence type)` pair, adding unseen entities with the prior"
+        # Sorted unique ids make the index lookup cache-friendly
+        ids, inverse = np.unique(np.asarray(entity_ids), return_inverse=True)
+        evidence = self._evidence_rows(evidence_type_ids)
+        # Sum the log-likelihoods of each entity's events, one hypothesis at a time. Keeping hypotheses on
+        # the leading axis also makes the per-entity reductions below fast
+        log_like = np.stack([np.bincount(inverse, weights=col[evidence], minlength=len(ids))
+                             for col in self.log_likelihoods.T])
+        m = log_like.max(axis=0)
+        if not np.isfinite(m).all(): raise ValueError("Impossible observation")
+        log_like -= m
+        # Unseen entities start from the prior, but are only added once the update is known to succeed
+        rows = self._lookup(ids)
+        prior = np.where((rows >= 0)[:, None], self._beliefs[np.maximum(rows, 0)] if self.n else self.prior, self.prior)
+        posterior = prior.T * np.exp(log_like)
+        total = posterior.sum(axis=0)
+        if (total == 0).any(): raise ValueError("Impossible observation")
+        posterior /= total
+        rows = self.add(ids)
+        self._beliefs[rows] = posterior.T
+        return self
+
+    def entropy(self):
+        "Entropy in bits of every entity's belief"
+        b = self.beliefs
+        with np.errstate(divide='ignore', invalid='ignore'): return -np.where(b > 0, b * np.log2(b), 0).sum(axis=1)
+
+    def top(self, k=10, hypothesis=0):
+        "Ids and beliefs of the `k` entities most likely to be in `hypothesis` (an index or name)"
+        if not isinstance(hypothesis, (int, np.integer)): hypothesis = list(self.hypotheses).index(hypothesis)
+        col = self.beliefs[:, hypothesis]
+        k = min(k, len(col))
+        idx = np.argpartition(-col, k - 1)[:k] if k else np.empty(0, dtype=np.intp)
+        idx = idx[np.argsort(-col[idx])]
+        return self.entity_ids[idx], col[idx]
+
+# %% ../../nbs/rbe/00d_rbe_beliefs.ipynb 10
+__all__ = ['BeliefTable']
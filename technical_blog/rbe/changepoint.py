@@ -0,0 +1,89 @@
+"""Bayesian online change-point detection with a bounded run-length posterior, over many streams at once"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00j_rbe_changepoint.ipynb.
+
+# %% auto 0
+__all__ = ['ChangepointDetector', 'cp_detect']
+
+# %% ../../nbs/rbe/00j_rbe_changepoint.ipynb 3
+import math
+import numpy as np
+
+# %% ../../nbs/rbe/00j_rbe_changepoint.ipynb 6
+def _lgamma_half_ratio(alpha):
+    "log Gamma(alpha + 1/2) - log Gamma(alpha), elementwise"
+    return np.vectorize(lambda a: math.lgamma(a + 0.5) - math.lgamma(a), otypes=[float])(alpha)
+
+class ChangepointDetector:
+    "Bayesian online change-point detection for `n_streams` Gaussian streams, keeping at most `max_run` run lengths"
+    def __init__(self, n_streams=1, hazard=0.01, max_run=256, mu0=0., kappa0=1., alpha0=1., beta0=1.):
+        if max_run < 2: raise ValueError("`max_run` must be at least 2")
+        if not 0 < hazard < 1: raise ValueError("`hazard` must be in (0, 1)")
+        self.n_streams, self.hazard, self.max_run = n_streams, hazard, max_run
+        mu0, kappa0, alpha0, beta0 = (np.broadcast_to(np.asarray(v, dtype=float), (n_streams,)) for v in (mu0, kappa0, alpha0, beta0))
+        self._prior = (mu0, kappa0, alpha0, beta0, _lgamma_half_ratio(alpha0))
+        self.reset()
+
+    def reset(self):
+        "Start every stream with no observations"
+        self._stats = [np.repeat(p[:, None], self.max_run, axis=1) for p in self._prior]
+        self.log_probs = np.full((self.n_streams, self.max_run), -np.inf)
+        self.log_probs[:, 0] = 0.
+        self.log_pred, self.t = np.zeros(self.n_streams), 0
+        return self
+
+    def update(self, x):
+        "Fold in one observation per stream"
+        x = np.broadcast_to(np.asarray(x, dtype=float), (self.n_streams,))[:, None]
+        mu, kappa, alpha, beta, c = self._stats
+        k1, d2 = kappa + 1, (x - mu) ** 2
+        # Student-t predictive of each run length, then the joint with the run-length posterior
+        g = self.log_probs + c - 0.5 * np.log(2 * np.pi * beta * k1 / kappa) - (alpha + 0.5) * np.log1p(d2 * kappa / (2 * beta * k1))
+        m = g.max(axis=1, keepdims=True)
+        log_ev = m[:, 0] + np.log(np.exp(g - m).sum(axis=1))
+        grow = g + np.log1p(-self.hazard)
+        # Every run grows by one slot; the two longest share the last slot
+        keep_last = grow[:, -1] > grow[:, -2]
+        new = ((kappa * mu + x) / k1, k1, alpha + 0.5, beta + kappa * d2 / (2 * k1), np.log(alpha) - c)
+        for s, n, p in zip(self._stats, new, self._prior):
+            s[:, -1] = np.where(keep_last, n[:, -1], n[:, -2])
+            s[:, 1:-1] = n[:, :-2]
+            s[:, 0] = p
+        self.log_probs[:, -1] = np.logaddexp(grow[:, -2], grow[:, -1])
+        self.log_probs[:, 1:-1] = grow[:, :-2]
+        self.log_probs[:, 0] = log_ev + np.log(self.hazard)
+        self.log_probs -= log_ev[:, None]
+        self.log_pred, self.t = log_ev, self.t + 1
+        return self
+
+    @property
+    def run_length_probs(self): return np.exp(self.log_probs)
+    @property
+    def map_run_length(self): return self.log_probs.argmax(axis=1)
+    @property
+    def expected_run_length(self): return self.run_length_probs @ np.arange(self.max_run)
+    @property
+    def mean(self):
+        "Posterior mean of the current regime, averaged over run lengths"
+        return (self.run_length_probs * self._stats[0]).sum(axis=1)
+
+    def change_prob(self, within=5):
+        "Probability that the current regime started in the last `within` observations"
+        return self.run_length_probs[:, :within + 1].sum(axis=1)
+
+# %% ../../nbs/rbe/00j_rbe_changepoint.ipynb 7
+def cp_detect(data, hazard=0.01, max_run=256, mu0=0., kappa0=1., alpha0=1., beta0=1., within=5):
+    "Run `ChangepointDetector` over `data` (T,) or (n_streams, T); returns per-step arrays"
+    x = np.asarray(data, dtype=float)
+    xs = np.atleast_2d(x)
+    det = ChangepointDetector(len(xs), hazard=hazard, max_run=max_run, mu0=mu0, kappa0=kappa0, alpha0=alpha0, beta0=beta0)
+    res = {'run_length': np.empty(xs.shape, dtype=np.intp), 'change_prob': np.empty(xs.shape),
+           'mean': np.empty(xs.shape), 'log_pred': np.empty(xs.shape)}
+    for t in range(xs.shape[1]):
+        det.update(xs[:, t])
+        res['run_length'][:, t], res['change_prob'][:, t] = det.map_run_length, det.change_prob(within)
+        res['mean'][:, t], res['log_pred'][:, t] = det.mean, det.log_pred
+    return {k: v.reshape(x.shape) for k, v in res.items()}
+
+# %% ../../nbs/rbe/00j_rbe_changepoint.ipynb 11
+__all__ = ['ChangepointDetector', 'cp_detect']
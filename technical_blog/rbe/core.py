@@ -3,19 +3,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00_rbe_core.ipynb.
 
 # %% auto 0
-__all__ = ['prob_normalize', 'prob_sample', 'prob_entropy', 'prob_kl_div', 'bayes_update', 'bayes_sequential',
-           'bayes_posterior_predictive', 'pf_init', 'pf_predict', 'pf_update', 'pf_resample', 'pf_effective_size',
-           'pf_step', 'rbe_estimator', 'rbe_adaptive', 'rbe_metrics', 'viz_particles', 'viz_beliefs', 'viz_comparison',
-           'viz_rbe_summary']
+__all__ = ['pf_resamplers', 'prob_normalize', 'prob_log_normalize', 'prob_sample', 'prob_entropy', 'prob_kl_div', 'bayes_update',
+           'bayes_sequential', 'bayes_posterior_predictive', 'pf_resample_systematic', 'pf_resample_stratified',
+           'pf_resample_multinomial', 'pf_resample_residual', 'pf_resample_metropolis', 'pf_resample_rejection',
+           'pf_batched', 'pf_init', 'pf_predict', 'pf_update', 'pf_resample', 'pf_effective_size', 'pf_step',
+           'rbe_stream', 'rbe_estimator', 'rbe_adaptive', 'rbe_metrics']
 
 # %% ../../nbs/rbe/00_rbe_core.ipynb 3
 import numpy as np
-import matplotlib.pyplot as plt
+import itertools, warnings
 from typing import Optional, Callable, Tuple, List, Union
-from fastcore.test import test_eq, test_close
-from fastcore.all import *
 
-# %% ../../nbs/rbe/00_rbe_core.ipynb 5
+# %% ../../nbs/rbe/00_rbe_core.ipynb 6
 def prob_normalize(probs):
     "Normalize `probs` to sum to 1"
     probs = np.asarray(probs)
@@ -23,6 +22,15 @@ def prob_normalize(probs):
     if s == 0: raise ValueError("Cannot normalize zero probabilities")
     return probs / s
 
+def prob_log_normalize(log_probs):
+    "Normalize `log_probs` in log space (log-sum-exp) so that `exp` of the result sums to 1"
+    log_probs = np.array(log_probs, dtype=float)
+    m = np.max(log_probs)
+    if not np.isfinite(m): raise ValueError("Cannot normalize zero probabilities")
+    log_probs -= m
+    log_probs -= np.log(np.sum(np.exp(log_probs)))
+    return log_probs
+
 def prob_sample(probs, n=1, rng=None):
     "Sample `n` indices from `probs` distribution"
     if rng is None: rng = np.random.default_rng()
@@ -44,7 +52,7 @@ def prob_kl_div(p, q):
     eps = 1e-10
     return np.sum(p * np.log((p + eps) / (q + eps)))
 
-# %% ../../nbs/rbe/00_rbe_core.ipynb 8
+# %% ../../nbs/rbe/00_rbe_core.ipynb 9
 def bayes_update(prior, likelihood, evidence=None):
     "Update `prior` with `likelihood` and optional `evidence`"
     prior, likelihood = np.array(prior), np.array(likelihood)
@@ -52,19 +60,39 @@ def bayes_update(prior, likelihood, evidence=None):
     if evidence == 0: raise ValueError("Impossible observation")
     return (prior * likelihood) / evidence
 
-def bayes_sequential(priors, likelihoods, evidences=None):
-    "Sequential updating of `priors` with `likelihoods` and optional `evidences`"
+def bayes_sequential(priors, likelihoods, evidences=None, log=False):
+    "Sequential updating of `priors` with `(T, K)` or batched `(B, T, K)` `likelihoods` and optional `evidences`"
+    priors, likelihoods = np.asarray(priors, dtype=np.float64), np.asarray(likelihoods, dtype=np.float64)
+    # An empty evidence sequence leaves just the prior
+    if likelihoods.size == 0 and likelihoods.ndim < 2: likelihoods = likelihoods.reshape(0, priors.shape[-1])
+    *batch, n_steps, n_hyp = likelihoods.shape
+    
+    # Every posterior at once: log prior plus the running sum of log-likelihoods
+    with np.errstate(divide='ignore'):
+        log_prior = np.log(priors)[..., None, :]
+        log_post = np.cumsum(likelihoods if log else np.log(likelihoods), axis=-2)
+    log_post += log_prior
+    
+    if evidences is not None:
+        evidences = np.asarray(evidences, dtype=np.float64)
+        if (evidences == 0).any(): raise ValueError("Impossible observation")
+        log_post -= np.cumsum(np.log(evidences), axis=-1)[..., None]
+    
+    # Work with hypotheses on the leading axis: reductions over a short trailing axis are slow
+    lp = np.ascontiguousarray(np.moveaxis(log_post, -1, 0))
     if evidences is None:
-        evidences = [None] * len(likelihoods)
-    
-    posterior = np.array(priors)
-    posteriors = [posterior.copy()]
-    
-    for likelihood, evidence in zip(likelihoods, evidences):
-        posterior = bayes_update(posterior, likelihood, evidence)
-        posteriors.append(posterior.copy())
-    
-    return np.array(posteriors)
+        m = lp.max(axis=0)
+        if not np.isfinite(m).all(): raise ValueError("Impossible observation")
+        lp -= m
+        np.exp(lp, out=lp)
+        lp /= lp.sum(axis=0)
+    else: np.exp(lp, out=lp)
+    
+    # The prior is the first row of the history, as given
+    out = np.empty((*batch, n_steps + 1, n_hyp))
+    out[..., 0, :] = priors
+    np.moveaxis(out[..., 1:, :], -1, 0)[...] = lp
+    return out
 
 def bayes_posterior_predictive(posterior, likelihood_fn, n_samples=1000, rng=None):
     "Sample from posterior predictive distribution"
@@ -83,9 +111,118 @@ def bayes_posterior_predictive(posterior, likelihood_fn, n_samples=1000, rng=Non
     
     return np.array(predictions)
 
-# %% ../../nbs/rbe/00_rbe_core.ipynb 11
-def pf_init(n_particles, state_dim, init_fn=None, rng=None):
-    "Initialize particle filter with `n_particles` and `state_dim`"
+# %% ../../nbs/rbe/00_rbe_core.ipynb 14
+def _pf_ends_to_indices(ends):
+    "Ancestor indices from cumulative copy counts `ends`: particle i fills slots `[ends[i-1], ends[i])`"
+    n = len(ends)
+    indices = np.zeros(n + 1, dtype=np.intp)
+    # Mark where each run starts (the non-empty run written last wins), then forward-fill
+    np.put(indices, ends[:-1], np.arange(1, n))
+    return np.maximum.accumulate(indices[:n])
+
+def pf_resample_systematic(weights, rng):
+    "Systematic resampling: one uniform offset shared by `n` evenly spaced positions"
+    n = len(weights)
+    # Positions (k + u) / n at or below cumsum(w)[i] number floor(n * cumsum(w)[i] - u) + 1
+    scaled = np.cumsum(weights) * n
+    scaled += 1 - rng.uniform()
+    ends = scaled.astype(np.intp)  # Truncation is floor here, as scaled > 0
+    np.minimum(ends, n, out=ends)
+    ends[-1] = n
+    return _pf_ends_to_indices(ends)
+
+def pf_resample_stratified(weights, rng):
+    "Stratified resampling: one independent uniform position in each of `n` equal strata"
+    n = len(weights)
+    u = rng.uniform(size=n)
+    scaled = np.cumsum(weights) * n
+    # Strata below floor(scaled) are fully covered; stratum floor(scaled) only if its draw fits
+    k = np.floor(scaled).astype(np.intp)
+    np.clip(k, 0, n - 1, out=k)
+    ends = k + (u[k] <= scaled - k)
+    ends[-1] = n
+    return _pf_ends_to_indices(ends)
+
+def pf_resample_multinomial(weights, rng):
+    "Multinomial resampling: `n` independent draws, generated as one vector of counts"
+    return _pf_ends_to_indices(np.cumsum(rng.multinomial(len(weights), weights)))
+
+def pf_resample_residual(weights, rng):
+    "Residual resampling: deterministic `floor(n*w)` copies plus multinomial draws for the rest"
+    n = len(weights)
+    scaled = n * np.asarray(weights)
+    counts = np.floor(scaled).astype(np.intp)
+    n_rest = n - counts.sum()
+    if n_rest > 0:
+        residual = scaled - counts
+        counts += rng.multinomial(n_rest, residual / residual.sum())
+    return _pf_ends_to_indices(np.cumsum(counts))
+
+def pf_resample_metropolis(weights, rng, n_iter=None, eps=0.01, max_iter=None):
+    "Metropolis resampling: `n_iter` independent accept/reject moves per particle, no cumulative sum"
+    n = len(weights)
+    weights = np.asarray(weights)
+    if n_iter is None:
+        # Murray et al.: enough moves that the chain's bias is below `eps`, with beta = mean(w) / max(w).
+        # That is about n * max(w) * log(1/eps) moves, so up to O(n) moves (O(n²) work) for one dominant weight
+        beta = weights.mean() / weights.max()
+        n_iter = 1 if beta >= 1 else int(np.ceil(np.log(eps) / np.log1p(-beta)))
+        if max_iter is not None and n_iter > max_iter:
+            warnings.warn(f"Metropolis resampling needs {n_iter} moves for bias below {eps}; "
+                          f"capped at {max_iter}, so the resampled particles are biased")
+            n_iter = max_iter
+    indices = np.arange(n)
+    for _ in range(n_iter):
+        proposals = rng.integers(0, n, size=n)
+        accept = rng.uniform(size=n) * weights[indices] <= weights[proposals]
+        indices = np.where(accept, proposals, indices)
+    return indices
+
+def pf_resample_rejection(weights, rng):
+    "Rejection resampling: propose uniformly, accept with probability `w / max(w)` until every slot is filled"
+    n = len(weights)
+    weights = np.asarray(weights)
+    w_max = weights.max()
+    indices = np.empty(n, dtype=np.intp)
+    pending = np.arange(n)
+    while len(pending):
+        proposals = rng.integers(0, n, size=len(pending))
+        accept = rng.uniform(size=len(pending)) * w_max <= weights[proposals]
+        indices[pending[accept]] = proposals[accept]
+        pending = pending[~accept]
+    return indices
+
+pf_resamplers = {
+    'systematic': pf_resample_systematic,
+    'stratified': pf_resample_stratified,
+    'multinomial': pf_resample_multinomial,
+    'residual': pf_resample_residual,
+    'metropolis': pf_resample_metropolis,
+    'rejection': pf_resample_rejection,
+}
+
+# %% ../../nbs/rbe/00_rbe_core.ipynb 16
+def pf_batched(fn):
+    "Mark `fn` as array-aware: it maps all particles in one call instead of one particle at a time"
+    fn.batched = True
+    return fn
+
+def _pf_is_batched(fn, batched=None):
+    "Use explicit `batched` flag if given, otherwise the marker set by `pf_batched`"
+    return getattr(fn, 'batched', False) if batched is None else batched
+
+def _pf_log_normalize(log_weights):
+    "Normalize `log_weights` in place (with one `exp` scratch array), falling back to uniform if every particle is impossible"
+    m = np.max(log_weights)
+    if not np.isfinite(m):
+        log_weights.fill(-np.log(len(log_weights)))
+        return log_weights
+    log_weights -= m
+    log_weights -= np.log(np.sum(np.exp(log_weights)))
+    return log_weights
+
+def pf_init(n_particles, state_dim, init_fn=None, rng=None, log=False):
+    "Initialize particle filter with `n_particles` and `state_dim` (log-weights if `log`)"
     if rng is None: rng = np.random.default_rng()
     
     if init_fn is None:
@@ -94,25 +231,51 @@ def pf_init(n_particles, state_dim, init_fn=None, rng=None):
     else:
         particles = init_fn(n_particles, state_dim, rng)
     
+    if log: return particles, np.full(n_particles, -np.log(n_particles))
     weights = np.ones(n_particles) / n_particles
     return particles, weights
 
-def pf_predict(particles, weights, transition_fn, rng=None):
+def pf_predict(particles, weights, transition_fn, rng=None, batched=None):
     "Prediction step: apply `transition_fn` to `particles`"
     if rng is None: rng = np.random.default_rng()
     
+    if _pf_is_batched(transition_fn, batched):
+        # Batched: `transition_fn(particles, rng)` maps the whole (n_particles, state_dim) array
+        new_particles = np.asarray(transition_fn(particles, rng))
+        if new_particles.shape != particles.shape:
+            raise ValueError(f"Batched transition_fn returned shape {new_particles.shape}, expected {particles.shape}")
+        return new_particles, weights
+    
     new_particles = np.zeros_like(particles)
     for i, particle in enumerate(particles):
         new_particles[i] = transition_fn(particle, rng)
     
     return new_particles, weights  # Weights unchanged in prediction
 
-def pf_update(particles, weights, observation, likelihood_fn):
+def pf_update(particles, weights, observation, likelihood_fn, batched=None, log=False):
     "Update step: weight `particles` using `observation` and `likelihood_fn`"
-    new_weights = np.zeros_like(weights)
-    
-    for i, particle in enumerate(particles):
-        new_weights[i] = weights[i] * likelihood_fn(particle, observation)
+    if log:
+        # Log mode: `weights` are log-weights and `likelihood_fn` returns log-likelihoods
+        if _pf_is_batched(likelihood_fn, batched):
+            log_likes = np.asarray(likelihood_fn(particles, observation), dtype=float)
+            if log_likes.shape != weights.shape:
+                raise ValueError(f"Batched likelihood_fn returned shape {log_likes.shape}, expected {weights.shape}")
+            new_weights = np.add(weights, log_likes)
+        else:
+            new_weights = np.fromiter((likelihood_fn(p, observation) for p in particles), float, len(particles))
+            new_weights += weights
+        return particles, _pf_log_normalize(new_weights)
+    
+    if _pf_is_batched(likelihood_fn, batched):
+        # Batched: `likelihood_fn(particles, observation)` returns one likelihood per particle
+        likelihoods = np.asarray(likelihood_fn(particles, observation), dtype=float)
+        if likelihoods.shape != weights.shape:
+            raise ValueError(f"Batched likelihood_fn returned shape {likelihoods.shape}, expected {weights.shape}")
+        new_weights = weights * likelihoods
+    else:
+        new_weights = np.zeros_like(weights)
+        for i, particle in enumerate(particles):
+            new_weights[i] = weights[i] * likelihood_fn(particle, observation)
     
     # Normalize weights
     if np.sum(new_weights) > 0:
@@ -123,82 +286,89 @@ def pf_update(particles, weights, observation, likelihood_fn):
     
     return particles, new_weights
 
-def pf_resample(particles, weights, method='systematic', rng=None):
-    "Resample `particles` using `weights` with specified `method`"
+def pf_resample(particles, weights, method='systematic', rng=None, log=False):
+    "Resample `particles` using `weights` with `method`, a name in `pf_resamplers` or a resampler function"
     if rng is None: rng = np.random.default_rng()
     n_particles = len(particles)
+    if log: weights = np.exp(_pf_log_normalize(np.array(weights, dtype=float)))
     
-    if method == 'systematic':
-        # Systematic resampling
-        positions = (np.arange(n_particles) + rng.uniform()) / n_particles
-        cum_weights = np.cumsum(weights)
-        indices = np.searchsorted(cum_weights, positions)
-    elif method == 'multinomial':
-        # Multinomial resampling
-        indices = prob_sample(weights, n_particles, rng)
-    else:
-        raise ValueError(f"Unknown resampling method: {method}")
+    resampler = method if callable(method) else pf_resamplers.get(method)
+    if resampler is None: raise ValueError(f"Unknown resampling method: {method}")
+    indices = resampler(weights, rng)
     
     new_particles = particles[indices]
+    if log: return new_particles, np.full(n_particles, -np.log(n_particles))
     new_weights = np.ones(n_particles) / n_particles
     
     return new_particles, new_weights
 
-def pf_effective_size(weights):
-    "Calculate effective sample size of normalized `weights`"
+def pf_effective_size(weights, log=False):
+    "Calculate effective sample size of normalized `weights` (or of log-weights if `log`, using one scratch array)"
+    if log:
+        # (Σw)² / Σw² is invariant to scale, so shift by the max instead of normalizing
+        w = weights - np.max(weights)
+        np.exp(w, out=w)
+        return np.sum(w)**2 / np.dot(w, w)
     weights = prob_normalize(weights)  # Ensure weights are normalized
     return 1.0 / np.sum(weights**2)
 
 def pf_step(particles, weights, observation, transition_fn, likelihood_fn, 
-           resample_threshold=0.5, rng=None):
+           resample_threshold=0.5, rng=None, batched=None, log=False, resample_method='systematic'):
     "Complete particle filter step: predict, update, and conditionally resample"
     # Prediction
-    particles, weights = pf_predict(particles, weights, transition_fn, rng)
+    particles, weights = pf_predict(particles, weights, transition_fn, rng, batched=batched)
     
     # Update
-    particles, weights = pf_update(particles, weights, observation, likelihood_fn)
+    particles, weights = pf_update(particles, weights, observation, likelihood_fn, batched=batched, log=log)
     
     # Conditional resampling
-    eff_size = pf_effective_size(weights)
+    eff_size = pf_effective_size(weights, log=log)
     if eff_size < resample_threshold * len(particles):
-        particles, weights = pf_resample(particles, weights, rng=rng)
+        particles, weights = pf_resample(particles, weights, resample_method, rng=rng, log=log)
     
     return particles, weights
 
-# %% ../../nbs/rbe/00_rbe_core.ipynb 14
-def rbe_estimator(observations, transition_fn, likelihood_fn, 
-                 n_particles=1000, init_fn=None, rng=None):
-    "Main RBE estimator for `observations` with particle filter"
+# %% ../../nbs/rbe/00_rbe_core.ipynb 25
+def rbe_stream(observations, transition_fn, likelihood_fn, 
+              n_particles=1000, init_fn=None, rng=None, history=None, every=1, log=False):
+    "Streaming RBE estimator: yield the estimate for each of `observations` in constant memory"
     if rng is None: rng = np.random.default_rng()
     
-    # Infer state dimension from first observation
-    state_dim = len(observations[0]) if hasattr(observations[0], '__len__') else 1
+    # Infer state dimension from first observation without materializing the stream
+    observations = iter(observations)
+    try: first = next(observations)
+    except StopIteration: return
+    state_dim = len(first) if hasattr(first, '__len__') else 1
     
     # Initialize particles
-    particles, weights = pf_init(n_particles, state_dim, init_fn, rng)
+    particles, weights = pf_init(n_particles, state_dim, init_fn, rng, log=log)
     
-    # Store results
-    estimates = []
-    particle_history = [particles.copy()]
-    weight_history = [weights.copy()]
+    # Optional history: any container with `append`, e.g. a list, or a `deque(maxlen=k)` ring buffer
+    if history is not None: history.append((particles.copy(), weights.copy()))
     
-    for obs in observations:
+    for t, obs in enumerate(itertools.chain([first], observations), 1):
         # Particle filter step
         particles, weights = pf_step(particles, weights, obs, 
-                                   transition_fn, likelihood_fn, rng=rng)
+                                   transition_fn, likelihood_fn, rng=rng, log=log)
         
-        # Estimate (weighted mean)
-        estimate = np.average(particles, weights=weights, axis=0)
-        estimates.append(estimate)
+        # Keep every `every`-th step only when asked
+        if history is not None and t % every == 0:
+            history.append((particles.copy(), weights.copy()))
         
-        # Store history
-        particle_history.append(particles.copy())
-        weight_history.append(weights.copy())
+        # Estimate (weighted mean)
+        yield np.average(particles, weights=np.exp(weights) if log else weights, axis=0)
+
+def rbe_estimator(observations, transition_fn, likelihood_fn, 
+                 n_particles=1000, init_fn=None, rng=None):
+    "Main RBE estimator for `observations` with particle filter"
+    history = []
+    estimates = list(rbe_stream(observations, transition_fn, likelihood_fn,
+                                n_particles, init_fn, rng, history=history))
     
     return {
         'estimates': np.array(estimates),
-        'particles': particle_history,
-        'weights': weight_history
+        'particles': [p for p, _ in history],
+        'weights': [w for _, w in history]
     }
 
 def rbe_adaptive(observations, transition_fn, likelihood_fn, 
@@ -247,198 +417,34 @@ def rbe_metrics(true_states, estimates):
         'n_samples': len(estimates)
     }
 
-# %% ../../nbs/rbe/00_rbe_core.ipynb 17
-def viz_particles(particles, weights, title='Particle Distribution', 
-                 figsize=(8, 6), alpha=0.6):
-    "Visualize `particles` with `weights`"
-    fig, ax = plt.subplots(figsize=figsize)
-    
-    if particles.shape[1] == 1:
-        # 1D case: histogram
-        ax.hist(particles.flatten(), weights=weights, bins=30, alpha=alpha)
-        ax.set_xlabel('State')
-        ax.set_ylabel('Probability Density')
-    elif particles.shape[1] == 2:
-        # 2D case: scatter plot
-        scatter = ax.scatter(particles[:, 0], particles[:, 1], 
-                           s=weights*1000, alpha=alpha)
-        ax.set_xlabel('State Dimension 1')
-        ax.set_ylabel('State Dimension 2')
-    else:
-        # Higher dimensions: just show first two
-        scatter = ax.scatter(particles[:, 0], particles[:, 1], 
-                           s=weights*1000, alpha=alpha)
-        ax.set_xlabel('State Dimension 1')
-        ax.set_ylabel('State Dimension 2')
-        title += f' (showing dims 1-2 of {particles.shape[1]})'
-    
-    ax.set_title(title)
-    ax.grid(True, alpha=0.3)
-    return fig, ax
-
-def viz_beliefs(beliefs, time_steps=None, title='Belief Evolution', 
-               figsize=(10, 6), labels=None):
-    "Visualize evolution of `beliefs` over `time_steps`"
-    beliefs = np.array(beliefs)
-    if time_steps is None:
-        time_steps = np.arange(len(beliefs))
-    
-    fig, ax = plt.subplots(figsize=figsize)
-    
-    if beliefs.ndim == 2:
-        # Multiple belief dimensions
-        for i in range(beliefs.shape[1]):
-            label = f'Belief {i+1}' if labels is None else labels[i]
-            ax.plot(time_steps, beliefs[:, i], label=label, marker='o')
-        ax.legend()
-    else:
-        # Single belief dimension
-        ax.plot(time_steps, beliefs, marker='o')
-    
-    ax.set_xlabel('Time Step')
-    ax.set_ylabel('Belief Value')
-    ax.set_title(title)
-    ax.grid(True, alpha=0.3)
-    return fig, ax
-
-def viz_comparison(methods_data, time_steps=None, title='Method Comparison',
-                  figsize=(12, 8), metrics=['mse', 'mae']):
-    "Compare multiple methods with `methods_data` dict"
-    if time_steps is None:
-        # Try to infer time_steps from data
-        first_method = list(methods_data.keys())[0]
-        first_data = methods_data[first_method]
-        
-        # Look for estimates first, then fall back to any available metric
-        if 'estimates' in first_data:
-            time_steps = np.arange(len(first_data['estimates']))
-        else:
-            # Use the first available metric to infer length
-            available_metrics = [m for m in metrics if m in first_data]
-            if available_metrics:
-                time_steps = np.arange(len(first_data[available_metrics[0]]))
-            else:
-                # Default fallback
-                time_steps = np.arange(10)
-    
-    n_metrics = len(metrics)
-    fig, axes = plt.subplots(n_metrics, 1, figsize=figsize)
-    if n_metrics == 1:
-        axes = [axes]
-    
-    for i, metric in enumerate(metrics):
-        ax = axes[i]
-        
-        for method_name, method_data in methods_data.items():
-            if metric in method_data:
-                ax.plot(time_steps, method_data[metric], 
-                       label=method_name, marker='o')
-        
-        ax.set_xlabel('Time Step')
-        ax.set_ylabel(metric.upper())
-        ax.set_title(f'{title} - {metric.upper()}')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    return fig, axes
-
-def viz_rbe_summary(rbe_result, true_states=None, title='RBE Summary',
-                   figsize=(15, 10)):
-    "Create comprehensive summary visualization of RBE results"
-    fig = plt.figure(figsize=figsize)
-    
-    # Layout: 2x2 grid
-    gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
-    
-    # Top left: Final particle distribution
-    ax1 = fig.add_subplot(gs[0, 0])
-    final_particles = rbe_result['particles'][-1]
-    final_weights = rbe_result['weights'][-1]
-    
-    if final_particles.shape[1] >= 2:
-        ax1.scatter(final_particles[:, 0], final_particles[:, 1], 
-                   s=final_weights*1000, alpha=0.6)
-        ax1.set_xlabel('State Dim 1')
-        ax1.set_ylabel('State Dim 2')
-    else:
-        ax1.hist(final_particles.flatten(), weights=final_weights, bins=30, alpha=0.6)
-        ax1.set_xlabel('State')
-        ax1.set_ylabel('Density')
-    ax1.set_title('Final Particle Distribution')
-    ax1.grid(True, alpha=0.3)
-    
-    # Top right: Estimates over time
-    ax2 = fig.add_subplot(gs[0, 1])
-    estimates = rbe_result['estimates']
-    time_steps = np.arange(len(estimates))
-    
-    if estimates.ndim == 2 and estimates.shape[1] >= 2:
-        ax2.plot(time_steps, estimates[:, 0], 'b-', label='Dim 1', marker='o')
-        ax2.plot(time_steps, estimates[:, 1], 'r-', label='Dim 2', marker='s')
-        if true_states is not None:
-            true_states = np.array(true_states)
-            ax2.plot(time_steps, true_states[:, 0], 'b--', alpha=0.7, label='True Dim 1')
-            ax2.plot(time_steps, true_states[:, 1], 'r--', alpha=0.7, label='True Dim 2')
-        ax2.legend()
-    else:
-        ax2.plot(time_steps, estimates.flatten(), 'b-', marker='o', label='Estimate')
-        if true_states is not None:
-            ax2.plot(time_steps, np.array(true_states).flatten(), 'r--', alpha=0.7, label='True')
-        ax2.legend()
-    
-    ax2.set_xlabel('Time Step')
-    ax2.set_ylabel('State Value')
-    ax2.set_title('Estimates Over Time')
-    ax2.grid(True, alpha=0.3)
-    
-    # Bottom left: Effective sample size
-    ax3 = fig.add_subplot(gs[1, 0])
-    eff_sizes = [pf_effective_size(w) for w in rbe_result['weights']]
-    ax3.plot(np.arange(len(eff_sizes)), eff_sizes, 'g-', marker='o')
-    ax3.axhline(len(rbe_result['weights'][0])/2, color='r', linestyle='--', alpha=0.7, label='N/2')
-    ax3.set_xlabel('Time Step')
-    ax3.set_ylabel('Effective Sample Size')
-    ax3.set_title('Particle Filter Health')
-    ax3.legend()
-    ax3.grid(True, alpha=0.3)
-    
-    # Bottom right: Error metrics (if true states provided)
-    ax4 = fig.add_subplot(gs[1, 1])
-    if true_states is not None:
-        errors = np.array(true_states) - estimates
-        if errors.ndim == 2:
-            error_norms = np.linalg.norm(errors, axis=1)
-        else:
-            error_norms = np.abs(errors)
-        
-        ax4.plot(time_steps, error_norms, 'r-', marker='o')
-        ax4.set_xlabel('Time Step')
-        ax4.set_ylabel('Estimation Error')
-        ax4.set_title('Error Over Time')
-    else:
-        ax4.text(0.5, 0.5, 'No true states\nprovided', ha='center', va='center', 
-                transform=ax4.transAxes, fontsize=12)
-        ax4.set_title('Error Analysis')
-    ax4.grid(True, alpha=0.3)
-    
-    fig.suptitle(title, fontsize=16)
-    return fig
+# %% ../../nbs/rbe/00_rbe_core.ipynb 29
+_viz_names = ('viz_particles', 'viz_beliefs', 'viz_comparison', 'viz_rbe_summary')
 
-# %% ../../nbs/rbe/00_rbe_core.ipynb 20
+def __getattr__(name):
+    "Load the `viz_*` helpers from `rbe.viz` on first access"
+    if name in _viz_names:
+        from technical_blog.rbe import viz
+        return getattr(viz, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# %% ../../nbs/rbe/00_rbe_core.ipynb 32
 __all__ = [
     # Probability utilities
-    'prob_normalize', 'prob_sample', 'prob_entropy', 'prob_kl_div',
+    'prob_normalize', 'prob_log_normalize', 'prob_sample', 'prob_entropy', 'prob_kl_div',
     
     # Bayesian core
     'bayes_update', 'bayes_sequential', 'bayes_posterior_predictive',
     
     # Particle filter foundation
-    'pf_init', 'pf_predict', 'pf_update', 'pf_resample', 'pf_effective_size', 'pf_step',
+    'pf_batched', 'pf_init', 'pf_predict', 'pf_update', 'pf_resample', 'pf_effective_size', 'pf_step',
+    
+    # Resampling schemes
+    'pf_resamplers', 'pf_resample_systematic', 'pf_resample_stratified', 'pf_resample_multinomial',
+    'pf_resample_residual', 'pf_resample_metropolis', 'pf_resample_rejection',
     
     # RBE estimator
-    'rbe_estimator', 'rbe_adaptive', 'rbe_metrics',
+    'rbe_stream', 'rbe_estimator', 'rbe_adaptive', 'rbe_metrics',
     
-    # Visualization helpers
+    # Visualization helpers, loaded from `rbe.viz` by `__getattr__` when first used
     'viz_particles', 'viz_beliefs', 'viz_comparison', 'viz_rbe_summary'
 ]
@@ -0,0 +1,67 @@
+"""Closed-form, vectorized confusion matrices, precision/recall and F-beta for alert tuning"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00f_rbe_detection.ipynb.
+
+# %% auto 0
+__all__ = ['det_confusion', 'det_metrics', 'det_sweep', 'det_score_sweep', 'det_auc']
+
+# %% ../../nbs/rbe/00f_rbe_detection.ipynb 3
+import numpy as np
+
+# %% ../../nbs/rbe/00f_rbe_detection.ipynb 6
+def _det_div(a, b):
+    "`a / b`, with 0 where `b` is 0"
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    return np.divide(a, b, out=np.zeros(a.shape), where=b != 0)
+
+def det_confusion(base_rate, sensitivity, specificity, n=1):
+    "Expected TP/FP/TN/FN among `n` events for a detector with `sensitivity` and `specificity` at `base_rate`"
+    pi, s, c = (np.asarray(x, dtype=float) for x in (base_rate, sensitivity, specificity))
+    return dict(tp=n * pi * s, fp=n * (1 - pi) * (1 - c), tn=n * (1 - pi) * c, fn=n * pi * (1 - s))
+
+def det_metrics(tp, fp, tn, fn, beta=1):
+    "Precision, recall, error rates, accuracy and F-`beta` from confusion-matrix arrays"
+    tp, fp, tn, fn = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (tp, fp, tn, fn)))
+    b2 = np.asarray(beta, dtype=float) ** 2
+    return dict(precision=_det_div(tp, tp + fp), recall=_det_div(tp, tp + fn),
+                specificity=_det_div(tn, tn + fp), false_positive_rate=_det_div(fp, fp + tn),
+                false_negative_rate=_det_div(fn, tp + fn), accuracy=_det_div(tp + tn, tp + fp + tn + fn),
+                f_beta=_det_div((1 + b2) * tp, (1 + b2) * tp + b2 * fn + fp))
+
+def det_sweep(base_rate, sensitivity, specificity, beta=1):
+    "Confusion matrix and metrics for every broadcast combination of the detector parameters"
+    conf = det_confusion(base_rate, sensitivity, specificity)
+    return {**conf, **det_metrics(**conf, beta=beta)}
+
+# %% ../../nbs/rbe/00f_rbe_detection.ipynb 9
+def det_score_sweep(scores, labels, thresholds=None, weights=None, base_rate=None, beta=1):
+    "Confusion matrix and metrics for alerting on `scores >= threshold`, at every threshold at once"
+    scores, labels = np.asarray(scores, dtype=float).ravel(), np.asarray(labels, dtype=bool).ravel()
+    if scores.shape != labels.shape: raise ValueError("`scores` and `labels` must have the same length")
+    w = np.ones(len(scores)) if weights is None else np.asarray(weights, dtype=float).ravel()
+    order = np.argsort(-scores, kind='stable')
+    desc, w_pos = -scores[order], np.where(labels[order], w[order], 0.)
+    # cum_*[k] is the weight of positives/negatives among the k highest scores
+    cum_tp = np.concatenate([[0.], np.cumsum(w_pos)])
+    cum_fp = np.concatenate([[0.], np.cumsum(w[order] - w_pos)])
+    if thresholds is None:
+        last = np.flatnonzero(np.diff(desc, append=np.inf))
+        thresholds = np.concatenate([[np.inf], -desc[last]])
+    thresholds = np.asarray(thresholds, dtype=float)
+    k = np.searchsorted(desc, -thresholds, side='right')
+    tp, fp = cum_tp[k], cum_fp[k]
+    fn, tn = cum_tp[-1] - tp, cum_fp[-1] - fp
+    if base_rate is not None:
+        tpr, fpr = _det_div(tp, cum_tp[-1]), _det_div(fp, cum_fp[-1])
+        tp, fn, fp, tn = base_rate * tpr, base_rate * (1 - tpr), (1 - base_rate) * fpr, (1 - base_rate) * (1 - fpr)
+    return dict(thresholds=thresholds, tp=tp, fp=fp, tn=tn, fn=fn, **det_metrics(tp, fp, tn, fn, beta=beta))
+
+def det_auc(x, y):
+    "Area under the curve through the points (`x`, `y`), e.g. ROC as (`false_positive_rate`, `recall`)"
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    order = np.argsort(x, kind='stable')
+    x, y = x[order], y[order]
+    return float(np.sum(np.diff(x) * (y[1:] + y[:-1]) / 2))
+
+# %% ../../nbs/rbe/00f_rbe_detection.ipynb 13
+__all__ = ['det_confusion', 'det_metrics', 'det_sweep', 'det_score_sweep', 'det_auc']
@@ -0,0 +1,97 @@
+"""Batched Bayesian fusion of threat-intelligence reports in log-odds space"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00h_rbe_fusion.ipynb.
+
+# %% auto 0
+__all__ = ['fuse_log_odds', 'fuse_posterior', 'fuse_em']
+
+# %% ../../nbs/rbe/00h_rbe_fusion.ipynb 3
+import numpy as np
+
+# %% ../../nbs/rbe/00h_rbe_fusion.ipynb 6
+def _fuse_weights(reliabilities):
+    "Log-odds weights of a threat report (`w1`) and a no-threat report (`w0`) from each source"
+    r = np.asarray(reliabilities, dtype=float)
+    if np.any((r <= 0) | (r >= 1)): raise ValueError("Reliabilities must be strictly between 0 and 1")
+    sens, spec = (r, r) if r.ndim == 1 else r
+    return np.log(sens) - np.log1p(-spec), np.log1p(-sens) - np.log(spec)
+
+def _fuse_array(x):
+    "`x` as an array; ndarrays, including memory maps, pass through without a copy"
+    return x if x is None or isinstance(x, np.ndarray) else np.asarray(x)
+
+def _fuse_chunks(reports, mask, n_sources, chunk_size):
+    "Blocks of rows as (slice, reports with missing set to 0, float presence mask)"
+    reports, mask = _fuse_array(reports), _fuse_array(mask)
+    if reports.ndim != 2 or reports.shape[1] != n_sources: raise ValueError(f"`reports` must have shape (n_indicators, {n_sources})")
+    step = max(1, chunk_size // n_sources)
+    for i in range(0, len(reports), step):
+        sl = slice(i, i + step)
+        R = np.asarray(reports[sl], dtype=float)
+        present = ~np.isnan(R)
+        if mask is not None: present &= np.asarray(mask[sl], dtype=bool)
+        yield sl, np.where(present, R, 0.), present.astype(float)
+
+def fuse_log_odds(reports, reliabilities, prior=0.1, mask=None, out=None, chunk_size=2**18):
+    "Posterior log-odds of a threat for each row of the `(n_indicators, n_sources)` matrix `reports`"
+    w1, w0 = _fuse_weights(reliabilities)
+    reports, mask = _fuse_array(reports), _fuse_array(mask)
+    n = len(reports)
+    prior = np.broadcast_to(np.asarray(prior, dtype=float), (n,))
+    if out is None: out = np.empty(n)
+    for sl, X, P in _fuse_chunks(reports, mask, len(w1), chunk_size):
+        # Every present report adds w0, and a reported threat adds w1 - w0 on top
+        out[sl] = X @ (w1 - w0) + P @ w0 + (np.log(prior[sl]) - np.log1p(-prior[sl]))
+    return out
+
+def fuse_posterior(reports, reliabilities, prior=0.1, mask=None, out=None, chunk_size=2**18):
+    "Posterior probability of a threat for each row of `reports`, fused in log-odds space"
+    out = fuse_log_odds(reports, reliabilities, prior, mask, out, chunk_size)
+    step = max(1, chunk_size)
+    with np.errstate(over='ignore'):
+        for i in range(0, len(out), step):
+            o = out[i:i + step]
+            # sigmoid in place: 1 / (1 + exp(-log_odds))
+            np.negative(o, out=o); np.exp(o, out=o); o += 1; np.reciprocal(o, out=o)
+    return out
+
+# %% ../../nbs/rbe/00h_rbe_fusion.ipynb 10
+def fuse_em(reports, mask=None, labels=None, init=None, max_iter=100, tol=1e-6, pseudo_count=1., chunk_size=2**18):
+    "Learn source sensitivities, specificities and the threat base rate from (partly) unlabeled `reports` with Dawid-Skene EM"
+    reports, mask = _fuse_array(reports), _fuse_array(mask)
+    if reports.ndim != 2: raise ValueError("`reports` must have shape (n_indicators, n_sources)")
+    n, S = reports.shape
+    if init is None: sens, spec, prior = np.full(S, 0.7), np.full(S, 0.7), 0.1
+    else: sens, spec, prior = np.array(init['sensitivity'], dtype=float), np.array(init['specificity'], dtype=float), float(init['prior'])
+    labels = None if labels is None else np.asarray(labels, dtype=float)
+    prev, a = -np.inf, pseudo_count
+    for it in range(1, max_iter + 1):
+        # Joint log p(status, reports) = X @ A + P @ B + log prior, with columns (threat, benign)
+        A = np.stack([np.log(sens) - np.log1p(-sens), np.log1p(-spec) - np.log(spec)], axis=1)
+        B = np.stack([np.log1p(-sens), np.log(spec)], axis=1)
+        log_prior = np.array([np.log(prior), np.log1p(-prior)])
+        ll, t_sum, tX, tP = 0., 0., np.zeros((2, S)), np.zeros((2, S))
+        for sl, X, P in _fuse_chunks(reports, mask, S, chunk_size):
+            L = X @ A + P @ B + log_prior
+            norm = np.logaddexp(L[:, 0], L[:, 1])
+            t = np.exp(L[:, 0] - norm)
+            if labels is not None:
+                lab = labels[sl]
+                known = ~np.isnan(lab)
+                t = np.where(known, lab, t)
+                norm = np.where(known, np.where(lab == 1, L[:, 0], L[:, 1]), norm)
+            ll += norm.sum(); t_sum += t.sum()
+            # Rows: threat-weighted and total sums of reported threats and of present reports
+            T = np.stack([t, np.ones(len(t))])
+            tX += T @ X; tP += T @ P
+        sens = (tX[0] + a) / (tP[0] + 2 * a)
+        spec = (tP[1] - tP[0] - (tX[1] - tX[0]) + a) / (tP[1] - tP[0] + 2 * a)
+        prior = (t_sum + a) / (n + 2 * a)
+        converged = ll - prev < tol * n
+        prev = ll
+        if converged: break
+    return dict(sensitivity=sens, specificity=spec, reliabilities=np.stack([sens, spec]), prior=prior,
+                log_likelihood=ll, n_iter=it, converged=converged)
+
+# %% ../../nbs/rbe/00h_rbe_fusion.ipynb 14
+__all__ = ['fuse_log_odds', 'fuse_posterior', 'fuse_em']
@@ -0,0 +1,173 @@
+"""Closed-form Gaussian filters (KF, EKF, UKF) for models where a particle filter is overkill"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00c_rbe_kalman.ipynb.
+
+# %% auto 0
+__all__ = ['kf_predict', 'kf_update', 'kf_estimator', 'kf_constant_velocity', 'ekf_estimator', 'ukf_sigma_points',
+           'ukf_estimator', 'kf_batch']
+
+# %% ../../nbs/rbe/00c_rbe_kalman.ipynb 3
+import numpy as np
+from functools import partial
+
+# %% ../../nbs/rbe/00c_rbe_kalman.ipynb 6
+def _kf_obs(observations):
+    "Observations as a `(T, obs_dim)` float array"
+    observations = np.asarray(observations, dtype=np.float64)
+    return observations.reshape(len(observations), -1)
+
+def _kf_gain(cov, H, R):
+    "Innovation covariance `S` and Kalman gain `K` for observation matrix `H`"
+    S = H @ cov @ H.T + R
+    # K = P H^T S^-1, solved instead of inverted (S and P are symmetric)
+    K = np.linalg.solve(S, H @ cov).T
+    return S, K
+
+def _kf_loglike(innovation, S):
+    "Gaussian log-density of `innovation` with covariance `S`"
+    _, logdet = np.linalg.slogdet(S)
+    return -0.5 * (innovation @ np.linalg.solve(S, innovation) + logdet + len(innovation) * np.log(2 * np.pi))
+
+def kf_predict(mean, cov, F, Q):
+    "Kalman prediction of the Gaussian belief (`mean`, `cov`) through the linear model `F` with process noise `Q`"
+    return F @ mean, F @ cov @ F.T + Q
+
+def kf_update(mean, cov, observation, H, R):
+    "Kalman update with `observation`; returns the posterior mean, covariance and the observation's log-likelihood"
+    innovation = np.atleast_1d(observation) - H @ mean
+    S, K = _kf_gain(cov, H, R)
+    cov = cov - K @ S @ K.T
+    return mean + K @ innovation, (cov + cov.T) / 2, _kf_loglike(innovation, S)
+
+def _kf_result(estimates, means, covs, log_likelihood):
+    return {'estimates': np.array(estimates), 'means': means, 'covariances': covs, 'log_likelihood': log_likelihood}
+
+def kf_estimator(observations, F, H, Q, R, init_mean, init_cov):
+    "Kalman filter over `observations`, returning the same result shape as `rbe_estimator`"
+    mean, cov = np.asarray(init_mean, dtype=np.float64), np.asarray(init_cov, dtype=np.float64)
+    F, H, Q, R = map(np.atleast_2d, (F, H, Q, R))
+    means, covs, total = [mean], [cov], 0.0
+    for obs in _kf_obs(observations):
+        mean, cov = kf_predict(mean, cov, F, Q)
+        mean, cov, ll = kf_update(mean, cov, obs, H, R)
+        means.append(mean); covs.append(cov)
+        total += ll
+    return _kf_result(means[1:], means, covs, total)
+
+# %% ../../nbs/rbe/00c_rbe_kalman.ipynb 8
+def kf_constant_velocity(dt=1.0, process_noise=0.05, obs_noise=0.1):
+    "`(F, H, Q, R)` for a constant-velocity `[position, velocity]` model with observed position"
+    F = np.array([[1.0, dt], [0.0, 1.0]])
+    H = np.array([[1.0, 0.0]])
+    Q = np.diag([process_noise**2, (process_noise / 2)**2])
+    R = np.array([[obs_noise**2]])
+    return F, H, Q, R
+
+# %% ../../nbs/rbe/00c_rbe_kalman.ipynb 11
+def _jacobian(fn, x, eps=1e-6):
+    "Central finite-difference Jacobian of `fn` at `x`"
+    x = np.asarray(x, dtype=np.float64)
+    cols = [(np.atleast_1d(fn(x + e)) - np.atleast_1d(fn(x - e))) / (2 * eps) for e in np.eye(len(x)) * eps]
+    return np.stack(cols, axis=-1)
+
+def ekf_estimator(observations, transition_fn, observation_fn, Q, R, init_mean, init_cov,
+                  transition_jac=None, observation_jac=None):
+    "Extended Kalman filter: linearize `transition_fn` and `observation_fn` around the current mean"
+    mean, cov = np.asarray(init_mean, dtype=np.float64), np.asarray(init_cov, dtype=np.float64)
+    Q, R = np.atleast_2d(Q), np.atleast_2d(R)
+    if transition_jac is None: transition_jac = partial(_jacobian, transition_fn)
+    if observation_jac is None: observation_jac = partial(_jacobian, observation_fn)
+    means, covs, total = [mean], [cov], 0.0
+    for obs in _kf_obs(observations):
+        F = np.atleast_2d(transition_jac(mean))
+        mean, cov = np.atleast_1d(transition_fn(mean)).astype(np.float64), F @ cov @ F.T + Q
+        H = np.atleast_2d(observation_jac(mean))
+        innovation = obs - np.atleast_1d(observation_fn(mean))
+        S, K = _kf_gain(cov, H, R)
+        mean, cov = mean + K @ innovation, cov - K @ S @ K.T
+        cov = (cov + cov.T) / 2
+        means.append(mean); covs.append(cov)
+        total += _kf_loglike(innovation, S)
+    return _kf_result(means[1:], means, covs, total)
+
+# %% ../../nbs/rbe/00c_rbe_kalman.ipynb 13
+def ukf_sigma_points(mean, cov, alpha=1e-3, beta=2.0, kappa=0.0):
+    "Merwe scaled sigma points of `N(mean, cov)` with their mean and covariance weights"
+    n = len(mean)
+    lam = alpha**2 * (n + kappa) - n
+    root = np.linalg.cholesky((n + lam) * cov)
+    points = np.vstack([mean, mean + root.T, mean - root.T])
+    wm = np.full(2 * n + 1, 1 / (2 * (n + lam)))
+    wc = wm.copy()
+    wm[0] = lam / (n + lam)
+    wc[0] = wm[0] + 1 - alpha**2 + beta
+    return points, wm, wc
+
+def _ukf_transform(points, wm, wc, fn, noise):
+    "Push sigma `points` through `fn`; return the transformed points, their mean and covariance plus `noise`"
+    mapped = np.stack([np.atleast_1d(fn(p)) for p in points]).astype(np.float64)
+    mean = wm @ mapped
+    dev = mapped - mean
+    return mapped, mean, (wc * dev.T) @ dev + noise
+
+def ukf_estimator(observations, transition_fn, observation_fn, Q, R, init_mean, init_cov,
+                  alpha=1e-3, beta=2.0, kappa=0.0):
+    "Unscented Kalman filter: propagate sigma points through the nonlinear `transition_fn` and `observation_fn`"
+    mean, cov = np.asarray(init_mean, dtype=np.float64), np.asarray(init_cov, dtype=np.float64)
+    Q, R = np.atleast_2d(Q), np.atleast_2d(R)
+    means, covs, total = [mean], [cov], 0.0
+    for obs in _kf_obs(observations):
+        points, wm, wc = ukf_sigma_points(mean, cov, alpha, beta, kappa)
+        points, mean, cov = _ukf_transform(points, wm, wc, transition_fn, Q)
+        # Redraw sigma points around the predicted belief so they reflect the added process noise
+        points, wm, wc = ukf_sigma_points(mean, cov, alpha, beta, kappa)
+        z_points, z_mean, S = _ukf_transform(points, wm, wc, observation_fn, R)
+        cross = (wc * (points - mean).T) @ (z_points - z_mean)
+        K = np.linalg.solve(S, cross.T).T
+        innovation = obs - z_mean
+        mean, cov = mean + K @ innovation, cov - K @ S @ K.T
+        cov = (cov + cov.T) / 2
+        means.append(mean); covs.append(cov)
+        total += _kf_loglike(innovation, S)
+    return _kf_result(means[1:], means, covs, total)
+
+# %% ../../nbs/rbe/00c_rbe_kalman.ipynb 16
+def kf_batch(observations, F, H, Q, R, init_mean, init_cov):
+    "Kalman filter over many tracks: `observations` is `(n_tracks, T[, obs_dim])`, NaN marks a missing observation"
+    obs = np.asarray(observations, dtype=np.float64)
+    n_tracks, n_steps = obs.shape[:2]
+    obs = obs.reshape(n_tracks, n_steps, -1)
+    F, H, Q, R = map(np.atleast_2d, (F, H, Q, R))
+    state_dim, obs_dim = F.shape[0], H.shape[0]
+    # Same layout as `kf_estimator` with a leading track axis: T + 1 moments, the first being the initial belief
+    means, covs = np.empty((n_tracks, n_steps + 1, state_dim)), np.empty((n_tracks, n_steps + 1, state_dim, state_dim))
+    means[:, 0], covs[:, 0] = np.asarray(init_mean, dtype=np.float64), np.asarray(init_cov, dtype=np.float64)
+    mean, cov = means[:, 0], covs[:, 0]
+    log_likelihood = np.zeros(n_tracks)
+    for t in range(n_steps):
+        mean = mean @ F.T
+        cov = F @ cov @ F.T + Q
+        z = obs[:, t]
+        seen = ~np.isnan(z).any(axis=1)
+        # Missing observations get a zero innovation, and their tracks keep the predicted belief
+        innovation = np.where(seen[:, None], z - mean @ H.T, 0.0)
+        S = H @ cov @ H.T + R
+        K = np.linalg.solve(S, H @ cov).swapaxes(-1, -2)
+        K[~seen] = 0
+        mean = mean + np.einsum('bdm,bm->bd', K, innovation)
+        cov = cov - K @ S @ K.swapaxes(-1, -2)
+        cov = (cov + cov.swapaxes(-1, -2)) / 2
+        _, logdet = np.linalg.slogdet(S)
+        mahal = np.einsum('bm,bm->b', innovation, np.linalg.solve(S, innovation[..., None])[..., 0])
+        log_likelihood += np.where(seen, -0.5 * (mahal + logdet + obs_dim * np.log(2 * np.pi)), 0.0)
+        means[:, t + 1], covs[:, t + 1] = mean, cov
+    return {'estimates': means[:, 1:], 'means': means, 'covariances': covs, 'log_likelihood': log_likelihood}
+
+# %% ../../nbs/rbe/00c_rbe_kalman.ipynb 20
+__all__ = [
+    # Kalman filter
+    'kf_predict', 'kf_update', 'kf_estimator', 'kf_constant_velocity', 'kf_batch',
+    
+    # Nonlinear filters
+    'ekf_estimator', 'ukf_sigma_points', 'ukf_estimator'
+]
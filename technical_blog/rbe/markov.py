@@ -0,0 +1,124 @@
+"""Stationary distributions, n-step distributions and batched path sampling for dense and sparse transition matrices"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00k_rbe_markov.ipynb.
+
+# %% auto 0
+__all__ = ['mc_validate', 'mc_stationary', 'mc_power', 'mc_distribution', 'mc_evolve', 'mc_sample']
+
+# %% ../../nbs/rbe/00k_rbe_markov.ipynb 3
+import numpy as np
+
+# %% ../../nbs/rbe/00k_rbe_markov.ipynb 6
+def _mc_sparse(P): return hasattr(P, 'tocsr') and hasattr(P, 'nnz')
+
+def mc_validate(P, rtol=1e-10):
+    "`P` as a float array, or a CSR matrix if sparse, after checking it is a transition matrix"
+    P = P.tocsr().astype(np.float64) if _mc_sparse(P) else np.array(P, dtype=np.float64)
+    if P.ndim != 2 or P.shape[0] != P.shape[1]: raise ValueError(f"Transition matrix must be square, got shape {P.shape}")
+    if ((P.data if _mc_sparse(P) else P) < 0).any(): raise ValueError("Transition probabilities must be non-negative")
+    row_sums = np.asarray(P.sum(axis=1)).ravel()
+    if not np.allclose(row_sums, 1.0, rtol=rtol):
+        bad_rows = np.where(~np.isclose(row_sums, 1.0, rtol=rtol))[0]
+        raise ValueError(f"Transition matrix rows must sum to 1. "
+                         f"Rows {bad_rows} sum to {row_sums[bad_rows]}")
+    return P
+
+def mc_stationary(P, method='solve'):
+    "Stationary distribution of an irreducible chain, by a linear solve or as the left eigenvector for eigenvalue 1"
+    if method not in ('solve', 'eig'): raise ValueError(f"Unknown method {method!r}, expected 'solve' or 'eig'")
+    P = mc_validate(P)
+    n = P.shape[0]
+    if _mc_sparse(P):
+        import scipy.sparse as sp
+        from scipy.sparse.linalg import eigs, spsolve
+        if method == 'eig': pi = eigs(P.T, k=1, which='LR')[1][:, 0].real
+        else:
+            # A dense row of ones would fill in the factorisation; pin pi[-1] = 1 and normalise afterwards
+            A = sp.vstack([(P.T - sp.identity(n, format='csr'))[:-1], sp.csr_matrix(([1.], ([0], [n - 1])), shape=(1, n))])
+            pi = spsolve(A.tocsc(), np.r_[np.zeros(n - 1), 1.])
+    elif method == 'eig':
+        vals, vecs = np.linalg.eig(P.T)
+        pi = vecs[:, np.argmin(np.abs(vals - 1))].real
+    else:
+        # pi (P - I) = 0 has rank n - 1; the last equation is replaced by the normalisation
+        A = P.T - np.eye(n)
+        A[-1] = 1
+        pi = np.linalg.solve(A, np.r_[np.zeros(n - 1), 1.])
+    pi = np.maximum(pi / pi.sum(), 0)
+    return pi / pi.sum()
+
+def mc_power(P, n):
+    "`P` to the power `n` by repeated squaring"
+    if n < 0: raise ValueError("`n` must be non-negative")
+    P, result = mc_validate(P), None
+    while n:
+        if n & 1: result = P if result is None else result @ P
+        n >>= 1
+        if n: P = P @ P
+    if result is not None: return result
+    if _mc_sparse(P):
+        import scipy.sparse as sp
+        return sp.identity(P.shape[0], format='csr')
+    return np.eye(len(P))
+
+def _mc_start(pi0, n):
+    return np.full(n, 1 / n) if pi0 is None else np.asarray(pi0, dtype=np.float64)
+
+def mc_distribution(P, n, pi0=None):
+    "Distribution after `n` steps from `pi0` (uniform if None, one distribution per row if 2-d)"
+    P = mc_validate(P)
+    pi = _mc_start(pi0, P.shape[0])
+    # Squaring costs O(k^3 log n), stepping O(k^2 n) dense or O(nnz n) sparse
+    if not _mc_sparse(P) and n > len(P): return pi @ mc_power(P, n)
+    for _ in range(n): pi = np.asarray(pi @ P)
+    return pi
+
+def mc_evolve(P, n_steps, pi0=None):
+    "Distributions at steps 0..`n_steps` from `pi0` (uniform if None), one row per step"
+    P = mc_validate(P)
+    pi = _mc_start(pi0, P.shape[0])
+    out = np.empty((n_steps + 1,) + pi.shape)
+    out[0] = pi
+    for t in range(n_steps): out[t + 1] = out[t] @ P
+    return out
+
+# %% ../../nbs/rbe/00k_rbe_markov.ipynb 7
+def _mc_cdf(P):
+    "Cumulative transition rows in CSR layout: (cdf, indptr, column indices or None if dense)"
+    k = P.shape[0]
+    if _mc_sparse(P):
+        P = P.copy(); P.sum_duplicates(); P.eliminate_zeros()
+        indptr, indices, data = P.indptr, P.indices, P.data
+    else: indptr, indices, data = np.arange(k + 1) * k, None, P.ravel()
+    if indices is None: cum = np.cumsum(P, axis=1).ravel()
+    else:
+        cum = np.cumsum(data)
+        cum -= np.repeat(cum[indptr[:-1]] - data[indptr[:-1]], np.diff(indptr))
+    cum[indptr[1:] - 1] = 1.  # exact row ends, so every draw lands inside its row
+    return cum, indptr, indices
+
+def mc_sample(P, n_steps, n_paths=1, start=None, pi0=None, rng=None):
+    "`n_paths` sample paths of `n_steps` steps from `start` states or `pi0` (uniform if None), all paths per step at once"
+    P = mc_validate(P)
+    rng = np.random.default_rng(rng)
+    k = P.shape[0]
+    cum, indptr, indices = _mc_cdf(P)
+    paths = np.empty((n_paths, n_steps + 1), dtype=np.intp)
+    if start is not None: paths[:, 0] = start
+    else:
+        c = np.cumsum(_mc_start(pi0, k))
+        paths[:, 0] = np.minimum(np.searchsorted(c / c[-1], rng.random(n_paths), side='right'), k - 1)
+    n_iter = int(np.ceil(np.log2(np.diff(indptr).max())))
+    for t in range(n_steps):
+        s, u = paths[:, t], rng.random(n_paths)
+        # Binary search for the first cumulative probability above u within each path's row
+        lo, hi = indptr[s], indptr[s + 1] - 1
+        for _ in range(n_iter):
+            mid = (lo + hi) >> 1
+            right = cum[mid] <= u
+            lo, hi = np.where(right, mid + 1, lo), np.where(right, hi, mid)
+        paths[:, t + 1] = lo - indptr[s] if indices is None else indices[lo]
+    return paths
+
+# %% ../../nbs/rbe/00k_rbe_markov.ipynb 11
+__all__ = ['mc_validate', 'mc_stationary', 'mc_power', 'mc_distribution', 'mc_evolve', 'mc_sample']
@@ -0,0 +1,104 @@
+"""Log-domain model evidence and posterior model probabilities over long evidence streams"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00g_rbe_models.ipynb.
+
+# %% auto 0
+__all__ = ['model_log_evidence', 'model_posterior', 'model_gaussian', 'interpret_bayes_factor', 'ModelTracker']
+
+# %% ../../nbs/rbe/00g_rbe_models.ipynb 3
+import numpy as np
+from .core import prob_log_normalize
+
+# %% ../../nbs/rbe/00g_rbe_models.ipynb 6
+def _model_loglik(models, evidence):
+    "`(n_models, len(evidence))` log-likelihoods of `evidence` under `models`"
+    n = len(evidence)
+    if callable(models): ll = np.asarray(models(evidence), dtype=float)
+    else:
+        fns = models.values() if isinstance(models, dict) else models
+        ll = np.stack([np.broadcast_to(np.asarray(f(evidence), dtype=float), (n,)) for f in fns])
+    if ll.ndim != 2 or ll.shape[1] != n: raise ValueError(f"Log-likelihoods must have shape (n_models, {n}), got {ll.shape}")
+    return ll
+
+def model_log_evidence(models, evidence, log_evidence=None, chunk_size=2**16):
+    "Total log-likelihood of `evidence` under each of `models`, added to a running `log_evidence`"
+    evidence = np.asarray(evidence)
+    if log_evidence is None: total = _model_loglik(models, evidence[:0]).sum(axis=1)
+    else: total = np.array(log_evidence, dtype=float)
+    # Blocks of about `chunk_size` log-likelihoods stay in cache however many models there are
+    step = max(1, chunk_size // max(len(total), 1))
+    for i in range(0, len(evidence), step): total += _model_loglik(models, evidence[i:i+step]).sum(axis=1)
+    return total
+
+def model_posterior(log_evidence, priors=None, log=False):
+    "Posterior model probabilities from `log_evidence` and `priors` (uniform if not given), normalized with log-sum-exp"
+    log_post = np.asarray(log_evidence, dtype=float)
+    if priors is not None:
+        with np.errstate(divide='ignore'): log_post = log_post + np.log(priors)
+    log_post = prob_log_normalize(log_post)
+    return log_post if log else np.exp(log_post)
+
+def model_gaussian(means, sds=1.):
+    "Vectorized log-likelihood for a family of Gaussian models with `means` and `sds`"
+    means, sds = np.broadcast_arrays(np.asarray(means, dtype=float), np.asarray(sds, dtype=float))
+    # Each log-density is a quadratic in the evidence, so the whole family is one `(n_models, 3) @ (3, n)` product.
+    # Centering the evidence on the mean of `means` keeps the expansion accurate.
+    c = means.mean() if means.size else 0.
+    mu, prec = means.ravel() - c, 1 / sds.ravel()**2
+    coefs = np.stack([-np.log(sds.ravel()) - 0.5 * np.log(2 * np.pi) - 0.5 * mu**2 * prec, mu * prec, -0.5 * prec], axis=1)
+    def loglik(evidence):
+        x = np.asarray(evidence, dtype=float) - c
+        return coefs @ np.stack([np.ones_like(x), x, x * x])
+    return loglik
+
+# %% ../../nbs/rbe/00g_rbe_models.ipynb 10
+_bf_bounds = np.array([1, 3, 10, 30, 100])
+_bf_labels = np.array(["Evidence against", "Weak evidence", "Moderate evidence", "Strong evidence",
+                       "Very strong evidence", "Decisive evidence"])
+
+def interpret_bayes_factor(bf):
+    """Interpret Bayes factor strength of evidence"""
+    labels = _bf_labels[np.searchsorted(_bf_bounds, bf, side='right')]
+    return labels if np.ndim(labels) else str(labels)
+
+class ModelTracker:
+    "Running log evidence and posterior probabilities of competing `models`, updated as evidence streams in"
+    def __init__(self, models, priors=None, names=None):
+        if names is None and isinstance(models, dict): names = list(models)
+        n = len(priors) if priors is not None else len(names) if names is not None else None
+        if n is None and not callable(models): n = len(models)
+        if n is None: raise ValueError("Give `priors` or `names` for a model family defined by one callable")
+        self.models, self.priors, self.names = models, priors, list(range(n)) if names is None else list(names)
+        self.log_evidence, self.n_obs = np.zeros(n), 0
+
+    def update(self, evidence):
+        "Fold one observation, or a batch of them, into the running log evidence"
+        evidence = np.atleast_1d(evidence)
+        self.log_evidence = model_log_evidence(self.models, evidence, self.log_evidence)
+        self.n_obs += len(evidence)
+        return self
+
+    @property
+    def log_posterior(self): return model_posterior(self.log_evidence, self.priors, log=True)
+    @property
+    def posterior(self): return np.exp(self.log_posterior)
+    @property
+    def best(self): return self.names[int(np.argmax(self.log_posterior))]
+
+    def _index(self, model): return self.names.index(model)
+
+    def log_bayes_factors(self, reference=None):
+        "Log Bayes factor of the `reference` model (highest evidence by default) against each model"
+        ref = int(np.argmax(self.log_evidence)) if reference is None else self._index(reference)
+        return self.log_evidence[ref] - self.log_evidence
+
+    def bayes_factors(self, reference=None):
+        "Bayes factor of the `reference` model (highest evidence by default) against each model"
+        with np.errstate(over='ignore'): return np.exp(self.log_bayes_factors(reference))
+
+    def interpret(self, reference=None):
+        "Strength of evidence for the `reference` model over each model, keyed by model name"
+        return dict(zip(self.names, interpret_bayes_factor(self.bayes_factors(reference))))
+
+# %% ../../nbs/rbe/00g_rbe_models.ipynb 14
+__all__ = ['model_log_evidence', 'model_posterior', 'model_gaussian', 'interpret_bayes_factor', 'ModelTracker']
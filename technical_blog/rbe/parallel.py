@@ -0,0 +1,105 @@
+"""Run recursive Bayesian estimation over many independent observation streams in a process pool"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00b_rbe_parallel.ipynb.
+
+# %% auto 0
+__all__ = ['rbe_parallel']
+
+# %% ../../nbs/rbe/00b_rbe_parallel.ipynb 3
+import os
+import concurrent.futures as cf
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from fastcore.basics import store_attr
+from .core import rbe_stream
+
+# %% ../../nbs/rbe/00b_rbe_parallel.ipynb 6
+class _ShmHistory:
+    "`history` sink for `rbe_stream` that writes each (particles, weights) pair into preallocated arrays"
+    def __init__(self, particles, weights): store_attr(); self.n = 0
+    def append(self, item):
+        self.particles[self.n], self.weights[self.n] = item
+        self.n += 1
+
+def _rbe_obs_dim(obs): return len(obs[0]) if len(obs) and hasattr(obs[0], '__len__') else 1
+
+def _rbe_state_dim(obs_dim, n_particles, init_fn):
+    "State dimension `rbe_stream` ends up with: `init_fn` may return particles of another size than the observations"
+    if init_fn is None: return obs_dim
+    return np.shape(init_fn(n_particles, obs_dim, np.random.default_rng(0)))[-1]
+
+def _rbe_layout(streams, n_particles, history, state_dims):
+    "Offsets (in float64 items) of each stream's estimates and optional histories in one flat buffer"
+    layout, offset = [], 0
+    for obs, state_dim in zip(streams, state_dims):
+        n_steps = len(obs)
+        shapes = {'estimates': (n_steps, state_dim)}
+        # `rbe_stream` records the initial particles plus one entry per step, and nothing for an empty stream
+        n_hist = n_steps + 1 if n_steps else 0
+        if history: shapes.update(particles=(n_hist, n_particles, state_dim), weights=(n_hist, n_particles))
+        entry = {}
+        for key, shape in shapes.items():
+            entry[key] = (offset, shape)
+            offset += int(np.prod(shape))
+        layout.append(entry)
+    return layout, offset
+
+def _views(buf, entry):
+    return {k: np.ndarray(shape, dtype=np.float64, buffer=buf, offset=8 * off) for k, (off, shape) in entry.items()}
+
+def _rbe_run(buf, observations, entry, seed_seq, transition_fn, likelihood_fn, n_particles, init_fn):
+    "Run one stream, writing its estimates and optional histories into `buf`"
+    out = _views(buf, entry)
+    history = _ShmHistory(out['particles'], out['weights']) if 'particles' in out else None
+    stream = rbe_stream(observations, transition_fn, likelihood_fn, n_particles, init_fn,
+                        np.random.default_rng(seed_seq), history=history)
+    for t, estimate in enumerate(stream): out['estimates'][t] = estimate
+
+def _rbe_shard(shm_name, *args):
+    "Worker: attach to the shared block by name and run one stream into it"
+    # Pool workers share the parent's resource tracker, so the parent alone unlinks the block
+    shm = SharedMemory(name=shm_name)
+    try: _rbe_run(shm.buf, *args)
+    finally: shm.close()
+
+# %% ../../nbs/rbe/00b_rbe_parallel.ipynb 7
+def rbe_parallel(streams, transition_fn, likelihood_fn, n_particles=1000, init_fn=None,
+                 seed=None, history=False, max_workers=None, chunksize=None, state_dim=None):
+    "Run `rbe_estimator` over each of `streams` in a process pool, one `SeedSequence` child per stream"
+    streams = [np.asarray(obs) for obs in streams]
+    if not streams: return []
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    seeds = seed_seq.spawn(len(streams))
+    # The estimate size is the particle size, which `init_fn` decides; ask it once per observation size
+    obs_dims = [_rbe_obs_dim(obs) for obs in streams]
+    if state_dim is None: state_dim = {d: _rbe_state_dim(d, n_particles, init_fn) for d in set(obs_dims)}
+    else: state_dim = dict.fromkeys(obs_dims, state_dim)
+    layout, size = _rbe_layout(streams, n_particles, history, [state_dim[d] for d in obs_dims])
+    
+    n = len(streams)
+    args = [streams, layout, seeds, [transition_fn] * n, [likelihood_fn] * n, [n_particles] * n, [init_fn] * n]
+    if max_workers == 0:
+        data = np.empty(size)
+        for a in zip(*args): _rbe_run(data, *a)
+    else:
+        if max_workers is None: max_workers = min(n, os.cpu_count() or 1)
+        if chunksize is None: chunksize = max(1, n // (4 * max_workers))
+        shm = SharedMemory(create=True, size=max(8 * size, 1))
+        try:
+            with cf.ProcessPoolExecutor(max_workers) as pool:
+                list(pool.map(_rbe_shard, [shm.name] * n, *args, chunksize=chunksize))
+            # One copy out of shared memory; each stream's results are views into it
+            data = np.ndarray(size, dtype=np.float64, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+    
+    results = []
+    for entry in layout:
+        out = _views(data, entry)
+        if history: out['particles'], out['weights'] = list(out['particles']), list(out['weights'])
+        results.append(out)
+    return results
+
+# %% ../../nbs/rbe/00b_rbe_parallel.ipynb 11
+__all__ = ['rbe_parallel']
@@ -0,0 +1,163 @@
+"""Indexed Bayesian detection of multi-step attack patterns over event streams"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00i_rbe_patterns.ipynb.
+
+# %% auto 0
+__all__ = ['PatternDetector', 'SequenceDetector']
+
+# %% ../../nbs/rbe/00i_rbe_patterns.ipynb 3
+import numpy as np
+
+# %% ../../nbs/rbe/00i_rbe_patterns.ipynb 6
+def _logit(p): return np.log(p) - np.log1p(-p)
+
+class PatternDetector:
+    "Beliefs that each of many `patterns` (name -> event types) is under way, updated through an inverted index"
+    def __init__(self, patterns, prior=0.3, match_likelihood=(0.1, 0.9), miss_likelihood=(0.8, 0.2), threshold=0.6):
+        self.names, self.threshold = list(patterns), threshold
+        self.event_types = sorted({e for steps in patterns.values() for e in steps})
+        self._event_ids = {e: i for i, e in enumerate(self.event_types)}
+        # CSR inverted index: patterns containing event type v are _pids[_ptr[v]:_ptr[v+1]]
+        pairs = sorted({(self._event_ids[e], p) for p, steps in enumerate(patterns.values()) for e in steps})
+        ev = np.array([v for v, _ in pairs], dtype=np.intp)
+        self._pids = np.array([p for _, p in pairs], dtype=np.intp)
+        self._ptr = np.searchsorted(ev, np.arange(len(self.event_types) + 1))
+        self._miss = np.log(miss_likelihood[1]) - np.log(miss_likelihood[0])
+        self._extra = np.log(match_likelihood[1]) - np.log(match_likelihood[0]) - self._miss
+        self._prior = _logit(prior)
+        self.reset()
+
+    def __len__(self): return len(self.names)
+
+    def reset(self):
+        "Back to the prior for every pattern"
+        self._log_odds, self._shift, self.n_events = np.full(len(self.names), self._prior), 0., 0
+        return self
+
+    def _rebase(self):
+        if abs(self._shift) > 1e6: self._log_odds += self._shift; self._shift = 0.
+
+    def matches(self, event):
+        "Ids of the patterns that contain `event`"
+        v = self._event_ids.get(event)
+        return self._pids[:0] if v is None else self._pids[self._ptr[v]:self._ptr[v + 1]]
+
+    def update(self, event):
+        "Fold in one event: the matched patterns get the match ratio, all others the shared no-match ratio"
+        self._log_odds[self.matches(event)] += self._extra
+        self._shift += self._miss
+        self.n_events += 1
+        self._rebase()
+        return self
+
+    def update_many(self, events):
+        "Fold in a batch of events with one `bincount` over the index"
+        ids = np.array([self._event_ids.get(e, -1) for e in events], dtype=np.intp)
+        counts = np.bincount(ids[ids >= 0], minlength=len(self.event_types))
+        hits = np.bincount(self._pids, weights=np.repeat(counts, np.diff(self._ptr)), minlength=len(self.names))
+        self._log_odds += hits * self._extra
+        self._shift += len(ids) * self._miss
+        self.n_events += len(ids)
+        self._rebase()
+        return self
+
+    @property
+    def log_odds(self): return self._log_odds + self._shift
+    @property
+    def probabilities(self): 
+        with np.errstate(over='ignore'): return 1 / (1 + np.exp(-self.log_odds))
+
+    def alerts(self):
+        "Ids of the patterns whose attack probability is above `threshold`"
+        return np.flatnonzero(self._log_odds > _logit(self.threshold) - self._shift)
+
+# %% ../../nbs/rbe/00i_rbe_patterns.ipynb 10
+class SequenceDetector:
+    "Per-entity beliefs that each of many ordered `patterns` (name -> event types) is under way, tracked as NFA progress"
+    def __init__(self, patterns, prior=0.01, step_likelihood=(0.1, 0.9), threshold=0.5):
+        self.names, self.threshold = list(patterns), threshold
+        steps = list(patterns.values())
+        self.lengths = np.array([len(s) for s in steps], dtype=np.intp)
+        self.event_types = sorted({e for s in steps for e in s})
+        self._event_ids = {e: i for i, e in enumerate(self.event_types)}
+        # Transitions: event type v moves pattern p from step k to k + 1 for each (p, k) in _trans[v], sorted by (p, k)
+        self._trans = [[] for _ in self.event_types]
+        for p, s in enumerate(steps):
+            for k, e in enumerate(s): self._trans[self._event_ids[e]].append((p, k))
+        n_max = int(self.lengths.max(initial=0))
+        lik = np.asarray(step_likelihood, dtype=float)
+        if lik.ndim == 2 and len(lik) < n_max:
+            raise ValueError(f"step_likelihood has {len(lik)} rows but the longest pattern has {n_max} steps")
+        lik = np.broadcast_to(lik, (n_max, 2)) if lik.ndim == 1 else lik
+        # Log odds after k steps in order
+        self._cum = _logit(prior) + np.concatenate([[0.], np.cumsum(np.log(lik[:, 1]) - np.log(lik[:, 0]))])
+        self._cum_list = self._cum.tolist()
+        self.reset()
+
+    def __len__(self): return len(self.names)
+
+    def reset(self, entity=None):
+        "Forget the progress of `entity`, or of every entity"
+        if entity is not None:
+            self._steps.pop(entity, None)
+            return self
+        # entity -> {pattern id: steps seen}, holding only the patterns under way
+        self._steps, self.n_events, self.new_alerts = {}, 0, []
+        return self
+
+    @property
+    def entities(self):
+        "Entities with at least one pattern under way"
+        return list(self._steps)
+
+    def _advance(self, entity, v, thr):
+        "Apply event type `v` to `entity`; returns the ids of the patterns whose belief crossed `thr`"
+        prog = self._steps.get(entity) or {}
+        cum, new, last = self._cum_list, [], -1
+        for p, k in self._trans[v]:
+            # Read before write: a pattern that repeats the event type still advances one step per event
+            if p != last and prog.get(p, 0) == k:
+                prog[p], last = k + 1, p
+                if cum[k] <= thr < cum[k + 1]: new.append(p)
+        if prog: self._steps[entity] = prog
+        return new
+
+    def update(self, entity, event):
+        "Fold in one event of `entity`: the patterns waiting on this step advance"
+        self.n_events, self.new_alerts = self.n_events + 1, []
+        v = self._event_ids.get(event)
+        if v is not None: self.new_alerts = [(entity, self.names[p]) for p in self._advance(entity, v, _logit(self.threshold))]
+        return self
+
+    def update_many(self, entities, events):
+        "Fold in a batch of `(entity, event)` pairs in stream order"
+        self.n_events, self.new_alerts = self.n_events + len(events), []
+        thr, ids = _logit(self.threshold), self._event_ids
+        for x, e in zip(entities, events):
+            v = ids.get(e)
+            if v is not None: self.new_alerts += [(x, self.names[p]) for p in self._advance(x, v, thr)]
+        return self
+
+    def progress(self, entity):
+        "Steps seen in order for each pattern of `entity` (zeros for entities with nothing under way)"
+        out = np.zeros(len(self), dtype=np.intp)
+        prog = self._steps.get(entity)
+        if prog: out[list(prog)] = list(prog.values())
+        return out
+
+    def log_odds(self, entity):
+        "Log odds of each pattern for `entity` (the prior for unseen entities)"
+        return self._cum[self.progress(entity)]
+
+    def probabilities(self, entity): return 1 / (1 + np.exp(-self.log_odds(entity)))
+
+    def alerts(self, entity):
+        "Ids of the patterns whose attack probability for `entity` is above `threshold`"
+        return np.flatnonzero(self.log_odds(entity) > _logit(self.threshold))
+
+    def completed(self, entity):
+        "Ids of the patterns `entity` has gone through in full"
+        return np.flatnonzero((self.progress(entity) == self.lengths) & (self.lengths > 0))
+
+# %% ../../nbs/rbe/00i_rbe_patterns.ipynb 14
+__all__ = ['PatternDetector', 'SequenceDetector']
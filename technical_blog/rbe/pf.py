@@ -0,0 +1,219 @@
+"""Stateful particle filters with preallocated buffers for allocation-free streaming"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00a_rbe_pf.ipynb.
+
+# %% auto 0
+__all__ = ['ParticleFilter', 'BatchedParticleFilter']
+
+# %% ../../nbs/rbe/00a_rbe_pf.ipynb 3
+import numpy as np
+from fastcore.basics import store_attr
+
+# %% ../../nbs/rbe/00a_rbe_pf.ipynb 6
+class ParticleFilter:
+    "Particle filter that owns preallocated, double-buffered particle and weight arrays"
+    def __init__(self, n_particles, state_dim, transition_fn, log_likelihood_fn,
+                 init_fn=None, resample_threshold=0.5, rng=None):
+        if rng is None: rng = np.random.default_rng()
+        store_attr()
+        self._buffers = np.empty((2, n_particles, state_dim))
+        self.log_weights, self.weights = np.empty(n_particles), np.empty(n_particles)
+        # Scratch space for likelihoods and resampling
+        self._log_likes, self._cdf = np.empty(n_particles), np.empty(n_particles)
+        self._ends = np.empty(n_particles, dtype=np.intp)
+        self._indices = np.empty(n_particles + 1, dtype=np.intp)
+        self._arange = np.arange(n_particles, dtype=np.intp)
+        self.reset()
+
+    @property
+    def particles(self): return self._buffers[self._cur]
+    @property
+    def _spare(self): return self._buffers[1 - self._cur]
+
+    def _flip(self): self._cur = 1 - self._cur
+
+    def _uniform(self):
+        self.log_weights.fill(-np.log(self.n_particles))
+        self.weights.fill(1 / self.n_particles)
+
+    def reset(self):
+        "Draw fresh particles from `init_fn` (uniform in [0, 1] by default) with uniform weights"
+        self._cur = 0
+        if self.init_fn is None: self.rng.random(out=self.particles)
+        else: self.particles[...] = self.init_fn(self.n_particles, self.state_dim, self.rng)
+        self._uniform()
+        return self
+
+    def predict(self):
+        "Propagate particles with `transition_fn` into the spare buffer, then swap buffers"
+        self.transition_fn(self.particles, self.rng, self._spare)
+        self._flip()
+        return self
+
+    def update(self, observation):
+        "Add log-likelihoods of `observation` to the log-weights and renormalize in place"
+        lw, w = self.log_weights, self.weights
+        self.log_likelihood_fn(self.particles, observation, self._log_likes)
+        lw += self._log_likes
+        m = lw.max()
+        if not np.isfinite(m):
+            # Every particle is impossible: reset to uniform like `pf_update`
+            self._uniform()
+            return self
+        lw -= m
+        np.exp(lw, out=w)
+        s = w.sum()
+        w /= s
+        lw -= np.log(s)
+        return self
+
+    def effective_size(self):
+        "Effective sample size of the current weights"
+        return 1.0 / np.dot(self.weights, self.weights)
+
+    def resample(self):
+        "Systematic resampling into the spare buffer, without `searchsorted` or temporaries"
+        n, cdf, ends, idx = self.n_particles, self._cdf, self._ends, self._indices
+        # ends[i] = number of systematic positions (k + u) / n that fall at or below cumsum(w)[i]
+        np.cumsum(self.weights, out=cdf)
+        cdf *= n
+        cdf -= self.rng.random()
+        np.floor(cdf, out=cdf)
+        cdf += 1
+        np.minimum(cdf, n, out=cdf)
+        cdf[-1] = n
+        np.copyto(ends, cdf, casting='unsafe')
+        # Copies of particle i occupy [ends[i-1], ends[i]): mark each run start, then forward-fill
+        idx.fill(0)
+        np.put(idx, ends[:-1], self._arange[1:])
+        np.maximum.accumulate(idx[:n], out=idx[:n])
+        np.take(self.particles, idx[:n], axis=0, out=self._spare, mode='clip')
+        self._flip()
+        self._uniform()
+        return self
+
+    def estimate(self, out=None):
+        "Weighted mean of the particles, optionally written into `out`"
+        return np.dot(self.weights, self.particles, out=out)
+
+    def step(self, observation):
+        "Predict, update and resample when the effective size drops below `resample_threshold`"
+        self.predict().update(observation)
+        if self.effective_size() < self.resample_threshold * self.n_particles: self.resample()
+        return self
+
+# %% ../../nbs/rbe/00a_rbe_pf.ipynb 10
+class BatchedParticleFilter:
+    "Many independent particle filters stored and stepped as one `(n_filters, n_particles, state_dim)` array"
+    def __init__(self, n_filters, n_particles, state_dim, transition_fn, log_likelihood_fn,
+                 init_fn=None, resample_threshold=0.5, block_size=None, rng=None):
+        if rng is None: rng = np.random.default_rng()
+        # `step` works through blocks of filters small enough to stay in cache (~64k particles each)
+        if block_size is None: block_size = max(1, 2**16 // n_particles)
+        store_attr()
+        self._buffers = np.empty((2, n_filters, n_particles, state_dim))
+        self.log_weights, self.weights = np.empty((n_filters, n_particles)), np.empty((n_filters, n_particles))
+        self._log_likes = np.empty((n_filters, n_particles))
+        self._starts = np.arange(1, n_particles, dtype=np.intp)
+        self.resampled = np.zeros(n_filters, dtype=bool)
+        self.reset()
+
+    @property
+    def particles(self): return self._buffers[self._cur]
+    @property
+    def _spare(self): return self._buffers[1 - self._cur]
+
+    def _flip(self): self._cur = 1 - self._cur
+
+    def _uniform(self, rows=slice(None)):
+        self.log_weights[rows] = -np.log(self.n_particles)
+        self.weights[rows] = 1 / self.n_particles
+
+    def reset(self):
+        "Draw fresh particles for every filter from `init_fn` (uniform in [0, 1] by default) with uniform weights"
+        self._cur = 0
+        if self.init_fn is None: self.rng.random(out=self.particles)
+        else: self.particles[...] = self.init_fn(self.n_filters, self.n_particles, self.state_dim, self.rng)
+        self._uniform()
+        self.resampled[:] = False
+        return self
+
+    def predict(self):
+        "Propagate all filters with `transition_fn` into the spare buffer, then swap buffers"
+        self.transition_fn(self.particles, self.rng, self._spare)
+        self._flip()
+        return self
+
+    def _update(self, particles, sl, observations, mask):
+        lw, w, ll = self.log_weights[sl], self.weights[sl], self._log_likes[sl]
+        self.log_likelihood_fn(particles, observations, ll)
+        if mask is None: lw += ll
+        else: np.add(lw, ll, out=lw, where=np.asarray(mask, dtype=bool)[:, None])
+        m = lw.max(axis=1, keepdims=True)
+        dead = ~np.isfinite(m[:, 0])
+        m[dead] = 0
+        lw -= m
+        np.exp(lw, out=w)
+        s = w.sum(axis=1, keepdims=True)
+        s[dead] = 1
+        w /= s
+        lw -= np.log(s)
+        # Filters where every particle is impossible reset to uniform like `pf_update`
+        if dead.any(): self._uniform(np.flatnonzero(dead) + sl.start)
+
+    def update(self, observations, mask=None):
+        "Weight each filter by its own observation; filters where `mask` is False keep their weights"
+        self._update(self.particles, slice(0, self.n_filters), observations, mask)
+        return self
+
+    def effective_size(self):
+        "Effective sample size of each filter, shape `(n_filters,)`"
+        return 1.0 / np.einsum('fn,fn->f', self.weights, self.weights)
+
+    def _resample(self, particles, rows):
+        n, r = self.n_particles, len(rows)
+        if not r: return
+        # Per filter, ends[i] = number of positions (k + u) / n at or below cumsum(w)[i]
+        scaled = np.cumsum(self.weights[rows], axis=1)
+        scaled *= n
+        scaled += 1 - self.rng.random((r, 1))
+        ends = scaled.astype(np.intp)
+        np.minimum(ends, n, out=ends)
+        # Copies of particle i occupy [ends[i-1], ends[i]): mark run starts in rows laid out n + 1 apart,
+        # forward-fill each row, then offset into the flattened particles of the selected filters
+        idx = np.zeros((r, n + 1), dtype=np.intp)
+        ends += np.arange(0, r * (n + 1), n + 1)[:, None]
+        np.put(idx, ends[:, :-1], self._starts)
+        idx = np.maximum.accumulate(idx[:, :n], axis=1)
+        idx += np.arange(0, r * n, n)[:, None]
+        particles[rows] = particles[rows].reshape(r * n, self.state_dim).take(idx, axis=0)
+        self._uniform(rows)
+        self.resampled[rows] = True
+
+    def resample(self, rows=None):
+        "Systematic resampling of the filters in `rows` (all by default), each with its own random offset"
+        rows = np.arange(self.n_filters) if rows is None else np.asarray(rows)
+        self._resample(self.particles, np.flatnonzero(rows) if rows.dtype == bool else rows)
+        return self
+
+    def estimate(self):
+        "Weighted mean of each filter, shape `(n_filters, state_dim)`"
+        return np.matmul(self.weights[:, None, :], self.particles)[:, 0]
+
+    def step(self, observations, mask=None):
+        "Predict, update, then resample the filters whose effective size is below `resample_threshold`"
+        observations = np.asarray(observations)
+        current, new = self.particles, self._spare
+        threshold = self.resample_threshold * self.n_particles
+        self.resampled[:] = False
+        for start in range(0, self.n_filters, self.block_size):
+            sl = slice(start, min(start + self.block_size, self.n_filters))
+            self.transition_fn(current[sl], self.rng, new[sl])
+            self._update(new[sl], sl, observations[sl], None if mask is None else np.asarray(mask)[sl])
+            w = self.weights[sl]
+            self._resample(new, start + np.flatnonzero(1.0 / np.einsum('fn,fn->f', w, w) < threshold))
+        self._flip()
+        return self
+
+# %% ../../nbs/rbe/00a_rbe_pf.ipynb 14
+__all__ = ['ParticleFilter', 'BatchedParticleFilter']
@@ -3,30 +3,26 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/03_recursive_updating.ipynb.
 
 # %% auto 0
-__all__ = ['prior', 'evidence_sequence', 'likelihoods', 'belief_evolution', 'fig', 'axes', 'current_step', 'beliefs', 'app', 'rt',
-           'mixed_evidence', 'balanced_likelihoods', 'corrected_results', 'insights_fig', 'decision_fig',
-           'change_points', 'segment_patterns', 'obs_data', 'true_regimes', 'strategies', 'adaptation_results',
-           'time_steps', 'recursive_bayes_demo', 'particle_filter', 'motion_model', 'position_likelihood',
-           'markov_chain_demo', 'belief_evolution_visualizer', 'belief_state_component', 'control_buttons',
-           'recursive_update_component', 'get', 'post', 'batch_vs_recursive_comparison', 'memory_analysis_corrected',
-           'rolling_memory_analysis', 'plot_memory_insights', 'plot_memory_decision_guide', 'update_baseline',
-           'multi_step_attack_detection', 'adaptive_threat_monitor', 'non_stationary_demo',
-           'compare_adaptation_strategies', 'forgetting_factor_filter', 'windowed_filter', 'standard_recursive_filter']
+__all__ = ['current_step', 'beliefs', 'evidence_sequence', 'recursive_bayes_demo', 'particle_filter', 'motion_model',
+           'position_likelihood', 'markov_chain_demo', 'belief_evolution_visualizer', 'belief_state_component',
+           'control_buttons', 'recursive_update_component', 'recursive_update_app', 'batch_vs_recursive_comparison',
+           'windowed_beliefs', 'WindowedPosterior', 'memory_analysis_corrected', 'rolling_memory_analysis',
+           'plot_memory_insights', 'plot_memory_decision_guide', 'update_baseline', 'multi_step_attack_detection',
+           'ThreatMonitor', 'adaptive_threat_monitor', 'non_stationary_demo', 'compare_adaptation_strategies',
+           'forgetting_factor_filter', 'windowed_filter', 'standard_recursive_filter', 'adaptation_sweep']
 
 # %% ../../nbs/rbe/03_recursive_updating.ipynb 3
 import numpy as np
-import matplotlib.pyplot as plt
 from fastcore.test import test_eq, test_close
 from fastcore.all import *
-from .core import bayes_update, bayes_sequential, pf_init, pf_step, pf_effective_size, prob_normalize, prob_sample, prob_entropy, prob_kl_div, viz_beliefs
-from fasthtml.common import *
-from monsterui.all import *
+from .core import bayes_update, bayes_sequential, pf_init, pf_step, pf_effective_size, prob_normalize, prob_log_normalize, prob_sample, prob_entropy, prob_kl_div
+from .patterns import PatternDetector
+from .markov import mc_validate, mc_evolve, mc_sample
 from typing import List, Dict, Tuple, Optional, Callable
-import seaborn as sns
 import time
 from collections import defaultdict
 
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 6
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 7
 def recursive_bayes_demo(prior, evidence_seq, likelihoods, labels=None):
     "Demonstrate recursive Bayesian updating"
     if labels is None: labels = [f'H{i}' for i in range(len(prior))]
@@ -41,20 +37,7 @@ def recursive_bayes_demo(prior, evidence_seq, likelihoods, labels=None):
     
     return np.array(beliefs)
 
-# Example: Network intrusion detection over time
-print("Example: Sequential Network Monitoring")
-prior = [0.1, 0.9]  # 10% initial attack probability
-evidence_sequence = ['suspicious_port', 'failed_login', 'privilege_escalation']
-likelihoods = [
-    [0.7, 0.1],  # Suspicious port: 70% if attack, 10% if normal
-    [0.9, 0.05], # Failed login: 90% if attack, 5% if normal  
-    [0.95, 0.01] # Privilege escalation: 95% if attack, 1% if normal
-]
-
-belief_evolution = recursive_bayes_demo(prior, evidence_sequence, likelihoods, 
-                                       labels=['Attack', 'Normal'])
-
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 9
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 11
 def particle_filter(initial_state,  # Initial state estimate
                     observations,  # Sequence of observations
                     transition_fn,  # Function (state, rng) -> new_state
@@ -89,9 +72,7 @@ def particle_filter(initial_state,  # Initial state estimate
                                for p in particles])
         
         # Normalize in log space for numerical stability
-        log_weights -= np.max(log_weights)  # Prevent overflow
-        weights = np.exp(log_weights)
-        weights = prob_normalize(weights)
+        weights = np.exp(prob_log_normalize(log_weights))
         
         # Estimate current state
         estimate = np.average(particles, weights=weights, axis=0)
@@ -119,7 +100,7 @@ def position_likelihood(state, obs, obs_noise=0.1):
     return np.exp(-0.5 * ((pos - obs) / obs_noise)**2)
 
 
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 14
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 16
 def markov_chain_demo(P, # transition matrix
                       n_steps, # number of steps to simulate
                       π0=None, # initial distribution (uniform if None)
@@ -127,17 +108,11 @@ def markov_chain_demo(P, # transition matrix
                       seed=None # random seed for reproducibility
                       ):
     """Demonstrate Markov chain evolution and properties"""
-    P = np.array(P, dtype=np.float64)
-    n_states = len(P)
+    # Validate transition matrix (dense or scipy.sparse)
+    P = mc_validate(P)
+    n_states = P.shape[0]
     rng = np.random.default_rng(seed)
     
-    # Validate transition matrix
-    row_sums = P.sum(axis=1)
-    if not np.allclose(row_sums, 1.0, rtol=1e-10):
-        bad_rows = np.where(~np.isclose(row_sums, 1.0, rtol=1e-10))[0]
-        raise ValueError(f"Transition matrix rows must sum to 1. "
-                        f"Rows {bad_rows} sum to {row_sums[bad_rows]}")
-    
     # Set defaults
     if π0 is None: π0 = np.ones(n_states) / n_states
     if labels is None: labels = [f'S{i}' for i in range(n_states)]
@@ -146,43 +121,37 @@ def markov_chain_demo(P, # transition matrix
     
     print("=== MARKOV CHAIN ===")
     print("Transition Matrix P:")
-    for i, (label, row) in enumerate(zip(labels, P)):
+    for i, label in enumerate(labels):
+        # Sparse rows are 1×n matrices whose repr lists (row, col) entries; show them as dense vectors
+        row = P[i].toarray().ravel() if hasattr(P, 'tocsr') else P[i]
         print(f"  {label}: {row}")
     
     # Evolution: π_{t+1} = π_t @ P  
-    πs = [π0.copy()]
-    π = π0.copy()
+    πs = mc_evolve(P, n_steps, π0)
     
     print(f"\nDistribution Evolution:")
-    print(f"t=0: {dict(zip(labels, π))}")
-    
+    print(f"t=0: {dict(zip(labels, πs[0]))}")
     for t in range(n_steps):
-        π = π @ P
-        πs.append(π.copy())
-        print(f"t={t+1}: {dict(zip(labels, π.round(4)))}")
+        print(f"t={t+1}: {dict(zip(labels, πs[t + 1].round(4)))}")
     
-    # Sample path
+    # Sample path, drawn by inverse CDF over the precomputed cumulative rows
     print(f"\nSample Path:")
-    s = rng.choice(n_states, p=π0)
-    path = [s]
-    print(f"t=0: {labels[s]}")
-    
-    for t in range(min(10, n_steps)):
-        s = rng.choice(n_states, p=P[s])
-        path.append(s)
-        print(f"t={t+1}: {labels[s]}")
+    path = mc_sample(P, min(10, n_steps), pi0=π0, rng=rng)[0].tolist()
+    for t, s in enumerate(path):
+        print(f"t={t}: {labels[s]}")
     
     return {
-        'distributions': np.array(πs),
+        'distributions': πs,
         'path': path,
-        'steady_state': π,
+        'steady_state': πs[-1],
         'P': P
     }
 
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 17
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 20
 def belief_evolution_visualizer(beliefs, time_steps=None, title="Belief Evolution",
                                labels=None, figsize=(12, 6)):
     """Visualize how beliefs evolve over time with interactive features"""
+    import matplotlib.pyplot as plt
     beliefs = np.array(beliefs)
     if time_steps is None:
         time_steps = np.arange(len(beliefs))
@@ -221,15 +190,7 @@ def belief_evolution_visualizer(beliefs, time_steps=None, title="Belief Evolutio
     plt.tight_layout()
     return fig, (ax1, ax2)
 
-# Visualize our network monitoring example
-fig, axes = belief_evolution_visualizer(
-    belief_evolution, 
-    labels=['Attack Probability', 'Normal Probability'],
-    title="Network Threat Assessment Over Time"
-)
-plt.show()
-
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 18
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 22
 # Global state for the demo (in a real app, you'd use sessions or database)
 current_step = 0
 beliefs = [0.1, 0.9]  # [Attack, Normal]
@@ -243,6 +204,8 @@ evidence_sequence = [
 
 def belief_state_component():
     """Component showing current belief state"""
+    from fasthtml.common import Div, Span
+    from monsterui.all import Button, Strong
     global current_step, beliefs, evidence_sequence
     
     # Progress indicator
@@ -281,6 +244,8 @@ def belief_state_component():
 
 def control_buttons():
     """Control buttons component"""
+    from fasthtml.common import Div
+    from monsterui.all import Button
     return Div(
         Button("Update Beliefs", 
                cls="uk-button uk-button-primary uk-margin-small-right",
@@ -300,6 +265,8 @@ def control_buttons():
 
 def recursive_update_component():
     """Main component using HTMX"""
+    from fasthtml.common import Div, P, Style
+    from monsterui.all import H3, H4
     
     style = """
     .monospace-text {
@@ -336,41 +303,40 @@ def recursive_update_component():
         cls="uk-container uk-container-small uk-margin-large-top"
     )
 
-# FastHTML app setup
-app, rt = fast_app()
-
-@rt("/")
-def get():
-    return Titled("Bayesian Demo", recursive_update_component())
-
-@rt("/update_beliefs")
-def post():
-    """HTMX endpoint to update beliefs"""
-    global current_step, beliefs, evidence_sequence
+def recursive_update_app():
+    """FastHTML app serving the interactive recursive updating demo"""
+    from monsterui.all import Titled, fast_app
+    app, rt = fast_app()
     
-    if current_step < len(evidence_sequence):
-        evidence = evidence_sequence[current_step]
-        beliefs = bayes_update(beliefs, evidence['likelihood'])
-        current_step += 1
+    @rt("/")
+    def get():
+        return Titled("Bayesian Demo", recursive_update_component())
     
-    return belief_state_component()
-
-@rt("/reset_demo")  
-def post():
-    """HTMX endpoint to reset demo"""
-    global current_step, beliefs
+    @rt("/update_beliefs")
+    def post():
+        """HTMX endpoint to update beliefs"""
+        global current_step, beliefs, evidence_sequence
+        
+        if current_step < len(evidence_sequence):
+            evidence = evidence_sequence[current_step]
+            beliefs = bayes_update(beliefs, evidence['likelihood'])
+            current_step += 1
+        
+        return belief_state_component()
     
-    current_step = 0
-    beliefs = [0.1, 0.9]
+    @rt("/reset_demo")  
+    def post():
+        """HTMX endpoint to reset demo"""
+        global current_step, beliefs
+        
+        current_step = 0
+        beliefs = [0.1, 0.9]
+        
+        return belief_state_component()
     
-    return belief_state_component()
+    return app
 
-# For Jupyter display
-from IPython.display import HTML
-HTML(str(recursive_update_component()))
-
-
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 21
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 26
 def batch_vs_recursive_comparison(data_sizes, n_trials=10, rng=None):
     """Compare true batch processing vs recursive updating"""
     if rng is None: rng = np.random.default_rng()
@@ -430,76 +396,91 @@ def batch_vs_recursive_comparison(data_sizes, n_trials=10, rng=None):
     
     return results
 
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 25
-mixed_evidence = ['event'] * 25
-balanced_likelihoods = (
-        [[0.7, 0.4]] * 6 +    # Moderate evidence for H1
-        [[0.4, 0.7]] * 8 +    # Moderate evidence for H2  
-        [[0.6, 0.45]] * 6 +   # Weak evidence for H1
-        [[0.45, 0.6]] * 5     # Weak evidence for H2
-    )
-
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 32
+def _log_prefix(likelihoods):
+    "Prefix sums of log-likelihoods and of zero-likelihood counts, each with a leading row of zeros"
+    lik = np.asarray(likelihoods, dtype=float)
+    zero = lik == 0
+    ll = np.log(np.where(zero, 1., lik))
+    pad = lambda a: np.concatenate([np.zeros((1,) + a.shape[1:]), np.cumsum(a, axis=0)])
+    return pad(ll), pad(zero.astype(float))
+
+def _window_posterior(log_sum, n_zero, prior):
+    "Normalized posterior(s) from `prior` and summed log-likelihoods, zero wherever a likelihood was 0"
+    with np.errstate(divide='ignore'):
+        log_post = np.where(n_zero > 0, -np.inf, np.log(prior) + log_sum)
+    m = log_post.max(axis=-1, keepdims=True)
+    if not np.all(np.isfinite(m)): raise ValueError("Impossible observation: every hypothesis has zero likelihood")
+    post = np.exp(log_post - m)
+    return post / post.sum(axis=-1, keepdims=True)
+
+def windowed_beliefs(likelihoods, window, initial_prior=None):
+    "Posterior after each step, from `initial_prior` and only the last `window` likelihoods"
+    S, Z = _log_prefix(likelihoods)
+    if initial_prior is None: initial_prior = np.full(S.shape[1], 1 / S.shape[1])
+    end = np.arange(1, len(S))
+    start = np.maximum(end - window, 0)
+    return _window_posterior(S[end] - S[start], Z[end] - Z[start], np.asarray(initial_prior, dtype=float))
+
+class WindowedPosterior:
+    "Posterior from `prior` and the last `window` likelihoods, updated in O(K) per step with a ring buffer"
+    def __init__(self, prior, window):
+        if window < 1: raise ValueError("`window` must be at least 1")
+        self.prior, self.window = np.asarray(prior, dtype=float), window
+        self._ll, self._zero = np.zeros((window, len(self.prior))), np.zeros((window, len(self.prior)))
+        self._sum, self._n_zero = np.zeros(len(self.prior)), np.zeros(len(self.prior))
+        self._pos, self.n = 0, 0
+
+    def update(self, likelihood):
+        "Add `likelihood` to the window and drop the evidence that falls out of it"
+        lik = np.asarray(likelihood, dtype=float)
+        zero = (lik == 0).astype(float)
+        ll = np.log(np.where(zero, 1., lik))
+        p = self._pos
+        if self.n >= self.window: self._sum -= self._ll[p]; self._n_zero -= self._zero[p]
+        self._ll[p], self._zero[p] = ll, zero
+        self._sum += ll; self._n_zero += zero
+        self._pos, self.n = (p + 1) % self.window, self.n + 1
+        # Once per lap, re-add the window from scratch so rounding errors cannot accumulate
+        if self._pos == 0: self._sum = self._ll.sum(axis=0)
+        return self
+
+    @property
+    def belief(self): return _window_posterior(self._sum, self._n_zero, self.prior)
+
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 34
 def memory_analysis_corrected(evidence_sequence, likelihoods, lookback_windows, 
                             initial_prior=None):
     """Corrected memory analysis - simulate true memory limitations"""
     if initial_prior is None:
         initial_prior = np.array([0.5, 0.5])
+    initial_prior = np.asarray(initial_prior, dtype=float)
     
-    n_evidence = len(evidence_sequence)
+    # One pass of prefix sums serves the full-memory baseline and every window
+    S, Z = _log_prefix(likelihoods)
+    n_evidence = len(S) - 1
+    full_belief = _window_posterior(S[-1], Z[-1], initial_prior)
     
-    # Full memory baseline - use ALL evidence from initial prior
-    full_belief = initial_prior.copy()
-    for likelihood in likelihoods:
-        full_belief = bayes_update(full_belief, np.array(likelihood))
+    # TRUE memory limitation: start from the initial prior, but only use the LAST 'window' pieces of evidence
+    start = n_evidence - np.minimum(lookback_windows, n_evidence)
+    windowed = _window_posterior(S[-1] - S[start], Z[-1] - Z[start], initial_prior)
     
     results = {
         'lookback_windows': lookback_windows,
-        'final_beliefs': [],
-        'belief_differences': [],
-        'information_loss': []
+        'final_beliefs': list(windowed),
+        'belief_differences': list(np.linalg.norm(full_belief - windowed, axis=1)),
+        'information_loss': [prob_kl_div(full_belief, b) for b in windowed]
     }
     
     print(f"Full memory final belief: {full_belief}")
-    
-    # Test different memory limitations
-    for window in lookback_windows:
-        if window >= n_evidence:
-            # Use all evidence - same as full case
-            windowed_belief = full_belief.copy()
-        else:
-            # TRUE memory limitation: start from initial prior,
-            # but only use the LAST 'window' pieces of evidence
-            windowed_belief = initial_prior.copy()
-            start_idx = n_evidence - window
-            
-            # Only apply the last 'window' pieces of evidence
-            for i in range(start_idx, n_evidence):
-                windowed_belief = bayes_update(windowed_belief, np.array(likelihoods[i]))
-        
-        # Calculate differences from full-memory result
-        belief_diff = np.linalg.norm(full_belief - windowed_belief)
-        info_loss = prob_kl_div(full_belief, windowed_belief)
-        
-        results['final_beliefs'].append(windowed_belief)
-        results['belief_differences'].append(belief_diff)
-        results['information_loss'].append(info_loss)
-        
+    for window, windowed_belief, belief_diff, info_loss in zip(
+            lookback_windows, windowed, results['belief_differences'], results['information_loss']):
         print(f"Window {window}: belief = {windowed_belief.round(6)}, "
               f"diff = {belief_diff:.6f}, KL = {info_loss:.6f}")
     
     return results
 
-# Test the corrected version
-print("=== CORRECTED MEMORY ANALYSIS ===")
-corrected_results = memory_analysis_corrected(
-    ['event'] * len(balanced_likelihoods), 
-    balanced_likelihoods,
-    lookback_windows=[1, 3, 5, 8, 12, 16, 20, 25],
-    initial_prior=[0.5, 0.5]
-)
-
-
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 26
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 36
 def rolling_memory_analysis(evidence_sequence, likelihoods, window_size, 
                           initial_prior=None):
     """Analyze performance with a fixed rolling memory window"""
@@ -507,25 +488,12 @@ def rolling_memory_analysis(evidence_sequence, likelihoods, window_size,
         initial_prior = np.array([0.5, 0.5])
     
     # Full memory baseline
-    full_belief = initial_prior.copy()
-    for likelihood in likelihoods:
-        full_belief = bayes_update(full_belief, np.array(likelihood))
+    full_belief = bayes_sequential(initial_prior, likelihoods)[-1]
     
-    # Rolling window simulation
-    rolling_belief = initial_prior.copy()
-    recent_evidence = []
-    
-    for i, likelihood in enumerate(likelihoods):
-        recent_evidence.append(likelihood)
-        
-        # Keep only last 'window_size' pieces of evidence
-        if len(recent_evidence) > window_size:
-            recent_evidence.pop(0)
-        
-        # Recompute belief from scratch using only recent evidence
-        rolling_belief = initial_prior.copy()
-        for recent_like in recent_evidence:
-            rolling_belief = bayes_update(rolling_belief, np.array(recent_like))
+    # Rolling window simulation: O(K) per step instead of rebuilding from the prior
+    rolling = WindowedPosterior(initial_prior, window_size)
+    for likelihood in likelihoods: rolling.update(likelihood)
+    rolling_belief = rolling.belief
     
     return {
         'full_belief': full_belief,
@@ -534,10 +502,10 @@ def rolling_memory_analysis(evidence_sequence, likelihoods, window_size,
         'kl_divergence': prob_kl_div(full_belief, rolling_belief)
     }
 
-
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 28
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 40
 def plot_memory_insights(results, likelihoods):
     """Create insightful visualizations of memory effects"""
+    import matplotlib.pyplot as plt
     
     fig = plt.figure(figsize=(16, 12))
     gs = fig.add_gridspec(3, 2, height_ratios=[1, 1, 1], hspace=0.3, wspace=0.3)
@@ -656,14 +624,10 @@ def plot_memory_insights(results, likelihoods):
     plt.suptitle('Comprehensive Memory Analysis: Key Insights', fontsize=16, y=0.98)
     return fig
 
-# Create the comprehensive insights plot
-insights_fig = plot_memory_insights(corrected_results, balanced_likelihoods)
-plt.show()
-
-
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 29
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 42
 def plot_memory_decision_guide(results):
     """Create a practical decision guide for choosing memory window size"""
+    import matplotlib.pyplot as plt
     
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
     
@@ -775,25 +739,20 @@ def plot_memory_decision_guide(results):
     plt.tight_layout()
     return fig
 
-# Create the decision guide
-decision_fig = plot_memory_decision_guide(corrected_results)
-plt.show()
-
-
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 31
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 45
 def update_baseline(current_baseline, observation, adaptation_rate):
     """Update baseline using exponential moving average"""
     return (1 - adaptation_rate) * current_baseline + adaptation_rate * observation
 
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 32
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 46
 def multi_step_attack_detection(event_sequence, attack_patterns, 
                                        window_size=5, threshold=0.6):
     """Improved multi-step attack detection with better calibration"""
     
-    # Start with more neutral beliefs - less confident about benign state
-    pattern_beliefs = {}
-    for pattern_name in attack_patterns:
-        pattern_beliefs[pattern_name] = np.array([0.7, 0.3])  # Less confident start
+    # Start with more neutral beliefs - less confident about benign state (30% attack);
+    # the detector only touches the patterns an event matches
+    detector = PatternDetector(attack_patterns, prior=0.3, match_likelihood=(0.1, 0.9),
+                               miss_likelihood=(0.8, 0.2), threshold=threshold)
     
     results = {
         'time_steps': [],
@@ -805,91 +764,123 @@ def multi_step_attack_detection(event_sequence, attack_patterns,
     print("=== IMPROVED MULTI-STEP ATTACK DETECTION ===")
     
     for t, event in enumerate(event_sequence):
-        alerts_this_step = []
-        detected_this_step = []
-        
         print(f"\nTime step {t}: Event = {event}")
         
-        for pattern_name, pattern_steps in attack_patterns.items():
-            current_belief = pattern_beliefs[pattern_name]
-            
-            if event in pattern_steps:
-                # Strong evidence for attack when event matches pattern
-                likelihood = np.array([0.1, 0.9])  # 90% evidence for attack
-            else:
-                # Moderate evidence against attack when no match
-                likelihood = np.array([0.8, 0.2])  # 80% evidence for benign
-            
-            # Recursive Bayesian update
-            updated_belief = bayes_update(current_belief, likelihood)
-            pattern_beliefs[pattern_name] = updated_belief
-            
-            # Check for detection
-            attack_prob = updated_belief[1]
-            alert = attack_prob > threshold
-            
-            if alert:
-                alerts_this_step.append(pattern_name)
-                detected_this_step.append(pattern_name)
-            
-            print(f"  {pattern_name}: Match={event in pattern_steps}, P(attack)={attack_prob:.3f}, Alert={alert}")
-            
-            results['pattern_probabilities'][pattern_name].append(attack_prob)
+        matched = set(detector.matches(event).tolist())
+        attack_probs = detector.update(event).probabilities
+        alerts_this_step = [name for name, p in zip(detector.names, attack_probs) if p > threshold]
+        
+        for i, pattern_name in enumerate(detector.names):
+            print(f"  {pattern_name}: Match={i in matched}, P(attack)={attack_probs[i]:.3f}, Alert={attack_probs[i] > threshold}")
+            results['pattern_probabilities'][pattern_name].append(attack_probs[i])
         
         results['time_steps'].append(t)
         results['alerts'].append(alerts_this_step)
-        results['detected_patterns'].append(detected_this_step)
+        results['detected_patterns'].append(list(alerts_this_step))
     
     return results
 
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 33
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 48
+class ThreatMonitor:
+    "Threat beliefs for many metric streams against their `baseline`, with bucketed deviation likelihoods and decay toward the prior"
+    def __init__(self, baseline, n_streams=None, threshold=0.6, decay_rate=0.1, prior=0.4, decay_below=10.,
+                 edges=(5, 15, 40), likelihoods=((0.9, 0.1), (0.7, 0.3), (0.3, 0.7), (0.1, 0.9))):
+        lik = np.asarray(likelihoods, dtype=float)
+        if len(lik) != len(edges) + 1: raise ValueError(f"{len(edges)} edges need {len(edges) + 1} likelihood pairs, got {len(lik)}")
+        self.baseline = np.asarray(baseline, dtype=float)
+        self.shape = self.baseline.shape if n_streams is None else (n_streams,)
+        self.threshold, self.decay_rate, self.prior, self.decay_below = threshold, decay_rate, prior, decay_below
+        self.edges, self._llr = np.asarray(edges, dtype=float), np.log(lik[:, 1]) - np.log(lik[:, 0])
+        self._scale = 100 / self.baseline
+        # Scratch reused by every `update`, so a tick allocates nothing
+        self._dev, self._tmp = np.empty(self.shape), np.empty(self.shape)
+        self._bucket, self._mask = np.empty(self.shape, dtype=np.intp), np.empty(self.shape, dtype=bool)
+        self.reset()
+
+    def reset(self):
+        "Every stream back to the prior"
+        self.log_odds, self.n_updates = np.full(self.shape, np.log(self.prior) - np.log1p(-self.prior)), 0
+        return self
+
+    def update(self, observations):
+        "Fold in one observation per stream"
+        dev = self._dev
+        np.subtract(observations, self.baseline, out=dev)
+        np.abs(dev, out=dev)
+        dev *= self._scale
+        # Bucket index = number of edges at or below the deviation, as `np.digitize` counts it
+        bucket, mask, tmp = self._bucket, self._mask, self._tmp
+        bucket.fill(0)
+        for e in self.edges:
+            np.greater_equal(dev, e, out=mask)
+            bucket += mask
+        # mode='clip' writes straight into `out`; the default mode buffers a full-size copy
+        np.take(self._llr, bucket, out=tmp, mode='clip')
+        self.log_odds += tmp
+        if self.decay_rate:
+            # Decay every stream in scratch, then keep the result only where the stream is calm
+            np.less(dev, self.decay_below, out=mask)
+            with np.errstate(over='ignore', divide='ignore'):
+                self._sigmoid(self.log_odds, out=tmp)
+                tmp *= 1 - self.decay_rate
+                tmp += self.prior * self.decay_rate
+                np.negative(tmp, out=dev); np.log1p(dev, out=dev); np.log(tmp, out=tmp); tmp -= dev
+            np.copyto(self.log_odds, tmp, where=mask)
+        self.n_updates += 1
+        return self
+
+    @staticmethod
+    def _sigmoid(log_odds, out):
+        np.negative(log_odds, out=out); np.exp(out, out=out); out += 1
+        return np.reciprocal(out, out=out)
+
+    @property
+    def probabilities(self): return self._sigmoid(self.log_odds, np.empty(self.shape))
+    @property
+    def alerts(self): return self.log_odds > self._threshold_log_odds()
+    def _threshold_log_odds(self): return np.log(self.threshold) - np.log1p(-self.threshold)
+
+    def run(self, observations, out=None, alerts_out=None):
+        "Update with each column of `observations` (n_streams, T), storing the probabilities and alerts after every step"
+        obs = np.asarray(observations, dtype=float)
+        if obs.shape[:-1] != self.shape: raise ValueError(f"Expected observations of shape {self.shape} + (T,), got {obs.shape}")
+        probs = np.empty(obs.shape) if out is None else out
+        alerts = np.empty(obs.shape, dtype=bool) if alerts_out is None else alerts_out
+        thr = self._threshold_log_odds()
+        for t in range(obs.shape[-1]):
+            self.update(obs[..., t])
+            # Results go straight into their columns, with no per-step temporaries
+            self._sigmoid(self.log_odds, out=probs[..., t])
+            np.greater(self.log_odds, thr, out=alerts[..., t])
+        return {'threat_probabilities': probs, 'alerts': alerts}
+
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 49
 def adaptive_threat_monitor(baseline_behavior, time_series_data, 
                          adaptation_rate=0.01, threshold=0.6,
                          decay_rate=0.1):  # Add memory decay
     """Refined version with better memory management"""
     
-    threat_belief = np.array([0.6, 0.4])  # Slightly less neutral start
+    # Slightly less neutral start (40% threat), decaying back toward it during normal periods
     original_baseline = float(baseline_behavior)
+    monitor = ThreatMonitor(original_baseline, threshold=threshold, decay_rate=decay_rate, prior=0.4)
+    observations = np.asarray(time_series_data, dtype=float)
+    run = monitor.run(observations)
+    deviation_percentage = np.abs(observations - original_baseline) / original_baseline * 100
     
-    results = {'time_steps': [], 'threat_probabilities': [], 'alerts': [], 'observations': []}
+    results = {'time_steps': list(range(len(observations))),
+               'threat_probabilities': run['threat_probabilities'].tolist(),
+               'alerts': run['alerts'].tolist(),
+               'observations': list(time_series_data)}
     
     print("=== REFINED THREAT MONITORING ===")
     
     for t, observation in enumerate(time_series_data):
-        absolute_deviation = abs(observation - original_baseline)
-        deviation_percentage = (absolute_deviation / original_baseline) * 100
-        
-        # More balanced likelihood functions
-        if deviation_percentage < 5:     # Very close to baseline
-            likelihood = np.array([0.9, 0.1])
-        elif deviation_percentage < 15:  # Small deviation
-            likelihood = np.array([0.7, 0.3])
-        elif deviation_percentage < 40:  # Moderate deviation
-            likelihood = np.array([0.3, 0.7])
-        else:  # Large deviation
-            likelihood = np.array([0.1, 0.9])
-        
-        # Bayesian update
-        threat_belief = bayes_update(threat_belief, likelihood)
-        
-        # Add memory decay - gradually return toward neutral when no strong evidence
-        if deviation_percentage < 10:  # Only decay during normal periods
-            threat_belief[1] = threat_belief[1] * (1 - decay_rate) + 0.4 * decay_rate
-            threat_belief[0] = 1 - threat_belief[1]
-        
-        alert = threat_belief[1] > threshold
-        
-        results['time_steps'].append(t)
-        results['threat_probabilities'].append(threat_belief[1])
-        results['alerts'].append(alert)
-        results['observations'].append(observation)
-        
-        print(f"Time {t}: Obs={observation:.1f}, DevPct={deviation_percentage:.1f}%, " +
-              f"Threat={threat_belief[1]:.3f}, Alert={alert}")
+        print(f"Time {t}: Obs={observation:.1f}, DevPct={deviation_percentage[t]:.1f}%, " +
+              f"Threat={results['threat_probabilities'][t]:.3f}, Alert={results['alerts'][t]}")
     
     return results
 
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 39
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 58
 def non_stationary_demo(change_points, segment_patterns, n_observations=100):
     """Demonstrate challenges with non-stationary data"""
     rng = np.random.default_rng(42)
@@ -912,132 +903,74 @@ def non_stationary_demo(change_points, segment_patterns, n_observations=100):
     
     return observations, true_states
 
-def compare_adaptation_strategies(observations, true_states, strategies):
+def compare_adaptation_strategies(observations, true_states, strategies, verbose=True):
     """Compare different adaptation strategies for non-stationary data"""
-    results = {name: {'estimates': [], 'errors': []} for name in strategies}
-    
-    for strategy_name, strategy_fn in strategies.items():
-        estimates = strategy_fn(observations)
-        errors = [abs(est - true) for est, true in zip(estimates, true_states)]
-        
-        results[strategy_name]['estimates'] = estimates
-        results[strategy_name]['errors'] = errors
+    observations, true_states = np.asarray(observations, dtype=float), np.asarray(true_states, dtype=float)
+    results = {}
+    
+    for strategy_name, strategy in strategies.items():
+        # A strategy is a filter function, or estimates computed already (e.g. by `adaptation_sweep`)
+        estimates = strategy(observations) if callable(strategy) else np.asarray(strategy)
+        errors = np.abs(estimates - true_states)
+        results[strategy_name] = {'estimates': estimates, 'errors': errors}
         
-        print(f"{strategy_name}: Mean error = {np.mean(errors):.3f}")
+        if verbose: print(f"{strategy_name}: Mean error = {np.mean(errors):.3f}")
     
     return results
 
 def forgetting_factor_filter(observations, forgetting_factor=0.95):
     """Simple filter with exponential forgetting"""
-    estimates = []
-    current_estimate = observations[0] if observations else 0
-    
-    for obs in observations:
-        current_estimate = forgetting_factor * current_estimate + (1 - forgetting_factor) * obs
-        estimates.append(current_estimate)
-    
-    return estimates
+    from scipy.signal import lfilter
+    x = np.asarray(observations, dtype=float)
+    factors = np.asarray(forgetting_factor, dtype=float)
+    if x.shape[-1] == 0: return np.zeros(factors.shape + x.shape)
+    # estimate[t] = f * estimate[t-1] + (1 - f) * x[t], starting from x[0]: one IIR pass over every series per factor
+    def ema(f): return lfilter([1 - f], [1, -f], x, axis=-1, zi=f * x[..., :1])[0]
+    return ema(float(factors)) if factors.ndim == 0 else np.stack([ema(f) for f in factors])
 
 def windowed_filter(observations, window_size=20):
     """Simple windowed mean filter"""
-    estimates = []
-    
-    for i, obs in enumerate(observations):
-        start_idx = max(0, i - window_size + 1)
-        window_data = observations[start_idx:i+1]
-        estimates.append(np.mean(window_data))
-    
-    return estimates
+    x = np.asarray(observations, dtype=float)
+    end = np.arange(1, x.shape[-1] + 1)
+    start = np.maximum(end - np.asarray(window_size)[..., None], 0)
+    # Window sums as differences of one running sum, so the cost does not depend on the window size
+    csum = np.concatenate([np.zeros(x.shape[:-1] + (1,)), np.cumsum(x, axis=-1)], axis=-1)
+    means = (np.take(csum, np.broadcast_to(end, start.shape), axis=-1) - np.take(csum, start, axis=-1)) / (end - start)
+    return means if np.ndim(window_size) == 0 else np.moveaxis(means, -2, 0)
 
 def standard_recursive_filter(observations):
     """Standard recursive mean (no adaptation)"""
-    estimates = []
-    running_mean = 0
-    
-    for i, obs in enumerate(observations):
-        running_mean = (running_mean * i + obs) / (i + 1)
-        estimates.append(running_mean)
-    
-    return estimates
-
-# Demonstrate non-stationarity challenges
-print("=== NON-STATIONARITY CHALLENGES ===")
-
-# Define regime changes
-change_points = [30, 60]
-segment_patterns = [
-    {'mean': 10, 'std': 2},   # Regime 1
-    {'mean': 25, 'std': 3},   # Regime 2  
-    {'mean': 5, 'std': 1}     # Regime 3
-]
-
-obs_data, true_regimes = non_stationary_demo(change_points, segment_patterns, 90)
-
-# Compare adaptation strategies
-strategies = {
-    'Standard Recursive': standard_recursive_filter,
-    'Forgetting Factor': lambda x: forgetting_factor_filter(x, 0.9),
-    'Sliding Window': lambda x: windowed_filter(x, 15)
-}
-
-adaptation_results = compare_adaptation_strategies(obs_data, [p['mean'] for p in segment_patterns for _ in range(30)], strategies)
-
-# Plot comparison
-fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-
-# Top: Observations and true regime changes
-time_steps = np.arange(len(obs_data))
-ax1.plot(time_steps, obs_data, 'k.', alpha=0.5, label='Observations')
-
-# Mark regime changes
-for cp in change_points:
-    ax1.axvline(cp, color='red', linestyle='--', alpha=0.7)
-
-ax1.set_ylabel('Observation Value')
-ax1.set_title('Non-stationary Data with Regime Changes')
-ax1.legend()
-ax1.grid(True, alpha=0.3)
-
-# Bottom: Estimation errors
-for strategy_name, strategy_data in adaptation_results.items():
-    ax2.plot(time_steps, strategy_data['errors'], label=strategy_name, alpha=0.8)
-
-for cp in change_points:
-    ax2.axvline(cp, color='red', linestyle='--', alpha=0.7)
-
-ax2.set_xlabel('Time Step')
-ax2.set_ylabel('Estimation Error')
-ax2.set_title('Adaptation Strategy Comparison')
-ax2.legend()
-ax2.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.show()
-
-print("\nKey insights:")
-print("- Standard recursive filtering fails with regime changes")
-print("- Forgetting factors help adapt to new regimes")
-print("- Sliding windows provide good balance of adaptation and stability")
-print("- Choice depends on expected change frequency and noise levels")
-
-# %% ../../nbs/rbe/03_recursive_updating.ipynb 41
+    x = np.asarray(observations, dtype=float)
+    return np.cumsum(x, axis=-1) / np.arange(1, x.shape[-1] + 1)
+
+def adaptation_sweep(observations, forgetting_factors=(), window_sizes=()):
+    """Estimates of the standard filter and of every forgetting factor and window size, keyed by strategy name"""
+    x = np.asarray(observations, dtype=float)
+    sweep = {'Standard Recursive': standard_recursive_filter(x)}
+    if len(forgetting_factors):
+        sweep.update(zip([f'Forgetting Factor {f:g}' for f in forgetting_factors], forgetting_factor_filter(x, forgetting_factors)))
+    if len(window_sizes):
+        sweep.update(zip([f'Sliding Window {w}' for w in window_sizes], windowed_filter(x, window_sizes)))
+    return sweep
+
+# %% ../../nbs/rbe/03_recursive_updating.ipynb 64
 __all__ = [
     # Core recursive functions
-    'recursive_bayes_demo', 'particle_filter', 'markov_chain_demo',
+    'recursive_bayes_demo', 'particle_filter', 'motion_model', 'position_likelihood', 'markov_chain_demo',
     
     # Interactive components
-    'belief_evolution_visualizer', 'recursive_update_component',
+    'belief_evolution_visualizer', 'recursive_update_component', 'recursive_update_app',
     
     # Performance analysis
-    'batch_vs_recursive_comparison', 'plot_performance_comparison',
+    'batch_vs_recursive_comparison',
     
     # Memory analysis
-    'memory_analysis', 'plot_memory_analysis', 
+    'WindowedPosterior', 'windowed_beliefs', 'memory_analysis_corrected', 'rolling_memory_analysis', 'plot_memory_insights', 'plot_memory_decision_guide',
     
     # Cybersecurity applications
-    'adaptive_threat_monitor', 'multi_step_attack_detection',
+    'update_baseline', 'ThreatMonitor', 'adaptive_threat_monitor', 'multi_step_attack_detection',
     
     # Non-stationarity handling
     'non_stationary_demo', 'compare_adaptation_strategies',
-    'forgetting_factor_filter', 'windowed_filter', 'standard_recursive_filter'
+    'forgetting_factor_filter', 'windowed_filter', 'standard_recursive_filter', 'adaptation_sweep'
 ]
@@ -3,20 +3,17 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/01_uncertainty_fundamentals.ipynb.
 
 # %% auto 0
-__all__ = ['uncertainty_demo', 'fig', 'dists', 'entropies', 'beliefs', 'obs_sequence', 'ax', 'threat_beliefs', 'threat_types',
-           'evidence_seq', 'demo_uncertainty_types', 'explore_distributions', 'bayesian_intrusion_detection',
-           'multi_threat_assessment', 'create_uncertainty_calculator']
+__all__ = ['demo_uncertainty_types', 'explore_distributions', 'bayesian_intrusion_detection', 'multi_threat_assessment',
+           'create_uncertainty_calculator']
 
 # %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 3
 import numpy as np
-import matplotlib.pyplot as plt
 from fastcore.test import test_eq, test_close
 from fastcore.all import *
-from .core import *
-from fasthtml.common import *
+from .core import bayes_update, prob_entropy
 from typing import List, Dict, Tuple
 
-# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 9
+# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 10
 def demo_uncertainty_types(n_samples=1000, rng=None):
     """Demonstrate aleatory vs epistemic uncertainty with cybersecurity examples"""
     if rng is None: rng = np.random.default_rng(42)
@@ -38,39 +35,10 @@ def demo_uncertainty_types(n_samples=1000, rng=None):
         'true_threat': true_threat_level
     }
 
-# Demonstrate the difference
-uncertainty_demo = demo_uncertainty_types()
-
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-
-# Aleatory uncertainty: login time distribution
-ax1.hist(uncertainty_demo['aleatory'], bins=50, alpha=0.7, color='blue')
-ax1.set_title('Aleatory Uncertainty\n(Login Time Distribution)')
-ax1.set_xlabel('Hours Between Logins')
-ax1.set_ylabel('Frequency')
-ax1.text(0.02, 0.98, 'Irreducible:\nInherent randomness', 
-         transform=ax1.transAxes, va='top', bbox=dict(boxstyle='round', facecolor='lightblue'))
-
-# Epistemic uncertainty: our belief about threat level
-ax2.hist(uncertainty_demo['epistemic'], bins=50, alpha=0.7, color='red')
-ax2.axvline(uncertainty_demo['true_threat'], color='black', linestyle='--', linewidth=2, label='True Value')
-ax2.set_title('Epistemic Uncertainty\n(Threat Level Estimate)')
-ax2.set_xlabel('Estimated Threat Level')
-ax2.set_ylabel('Frequency')
-ax2.legend()
-ax2.text(0.02, 0.98, 'Reducible:\nLack of knowledge', 
-         transform=ax2.transAxes, va='top', bbox=dict(boxstyle='round', facecolor='lightcoral'))
-
-plt.tight_layout()
-plt.show()
-
-print(f"Aleatory uncertainty (login times): mean={np.mean(uncertainty_demo['aleatory']):.2f} hours")
-print(f"Epistemic uncertainty range: {np.min(uncertainty_demo['epistemic']):.2f} to {np.max(uncertainty_demo['epistemic']):.2f}")
-print(f"True threat level: {uncertainty_demo['true_threat']} (unknown to us initially)")
-
-# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 11
+# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 13
 def explore_distributions():
     """Interactive exploration of probability distributions and entropy"""
+    import matplotlib.pyplot as plt
     
     # Different types of distributions with cybersecurity interpretations
     distributions = {
@@ -113,17 +81,7 @@ def explore_distributions():
     
     return distributions, entropies
 
-# Explore different distributions
-dists, entropies = explore_distributions()
-
-print("\nEntropy Analysis:")
-for (name, _), entropy in zip(dists.items(), entropies):
-    print(f"{name}: {entropy:.3f} bits")
-    
-print(f"\nMaximum possible entropy (uniform): {np.log2(4):.3f} bits")
-print(f"Minimum possible entropy (certain): 0.000 bits")
-
-# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 13
+# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 16
 def bayesian_intrusion_detection(n_observations=10, rng=None):
     """Demonstrate Bayesian updating for intrusion detection"""
     if rng is None: rng = np.random.default_rng(42)
@@ -162,24 +120,7 @@ def bayesian_intrusion_detection(n_observations=10, rng=None):
     
     return np.array(belief_history), observations
 
-# Run the demonstration
-beliefs, obs_sequence = bayesian_intrusion_detection()
-
-# Visualize the evolution of beliefs
-fig, ax = viz_beliefs(beliefs[:, 0], title='Attack Probability Over Time', 
-                      figsize=(10, 6))
-ax.set_ylabel('Attack Probability')
-ax.set_ylim(0, 1)
-
-# Add observation labels
-for i, obs in enumerate(obs_sequence):
-    ax.annotate(obs, (i+1, beliefs[i+1, 0]), 
-                xytext=(5, 5), textcoords='offset points', 
-                fontsize=8, alpha=0.7)
-
-plt.show()
-
-# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 15
+# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 19
 def multi_threat_assessment(rng=None):
     """Demonstrate multi-hypothesis threat assessment"""
     if rng is None: rng = np.random.default_rng(42)
@@ -225,24 +166,10 @@ def multi_threat_assessment(rng=None):
     
     return np.array(beliefs), threats, evidence_sequence
 
-# Run multi-threat assessment
-threat_beliefs, threat_types, evidence_seq = multi_threat_assessment()
-
-# Visualize evolution of all threat probabilities
-fig, ax = viz_beliefs(threat_beliefs, labels=threat_types, 
-                      title='Multi-Threat Probability Evolution', figsize=(12, 6))
-
-# Add evidence markers
-for i, evidence in enumerate(evidence_seq):
-    ax.axvline(i+1, color='gray', linestyle='--', alpha=0.5)
-    ax.text(i+1, ax.get_ylim()[1]*0.9, evidence, 
-            rotation=45, ha='right', va='top', fontsize=9)
-
-plt.show()
-
-# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 17
+# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 22
 def create_uncertainty_calculator():
     """Create an interactive uncertainty calculator using FastHTML"""
+    from fasthtml.common import Div, Form, H3, Input, Label, P, Script, Span
     
     def uncertainty_form():
         return Form(
@@ -315,16 +242,7 @@ def create_uncertainty_calculator():
     
     return uncertainty_form()
 
-# Display the interactive calculator
-print("Interactive Uncertainty Calculator:")
-print("(This would be rendered as interactive HTML in the FastHTML app)")
-print("\nFeatures:")
-print("- Adjust prior belief with slider")
-print("- Change evidence strength")
-print("- See real-time Bayesian updates")
-print("- Track uncertainty reduction")
-
-# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 19
+# %% ../../nbs/rbe/01_uncertainty_fundamentals.ipynb 26
 __all__ = [
     'demo_uncertainty_types',
     'explore_distributions', 
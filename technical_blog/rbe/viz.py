@@ -0,0 +1,192 @@
+"""Plotting helpers for particles, beliefs and RBE runs"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/rbe/00e_rbe_viz.ipynb.
+
+# %% auto 0
+__all__ = ['viz_particles', 'viz_beliefs', 'viz_comparison', 'viz_rbe_summary']
+
+# %% ../../nbs/rbe/00e_rbe_viz.ipynb 3
+import numpy as np
+import matplotlib.pyplot as plt
+from .core import pf_effective_size
+
+# %% ../../nbs/rbe/00e_rbe_viz.ipynb 6
+def viz_particles(particles, weights, title='Particle Distribution', 
+                 figsize=(8, 6), alpha=0.6):
+    "Visualize `particles` with `weights`"
+    fig, ax = plt.subplots(figsize=figsize)
+    
+    if particles.shape[1] == 1:
+        # 1D case: histogram
+        ax.hist(particles.flatten(), weights=weights, bins=30, alpha=alpha)
+        ax.set_xlabel('State')
+        ax.set_ylabel('Probability Density')
+    elif particles.shape[1] == 2:
+        # 2D case: scatter plot
+        scatter = ax.scatter(particles[:, 0], particles[:, 1], 
+                           s=weights*1000, alpha=alpha)
+        ax.set_xlabel('State Dimension 1')
+        ax.set_ylabel('State Dimension 2')
+    else:
+        # Higher dimensions: just show first two
+        scatter = ax.scatter(particles[:, 0], particles[:, 1], 
+                           s=weights*1000, alpha=alpha)
+        ax.set_xlabel('State Dimension 1')
+        ax.set_ylabel('State Dimension 2')
+        title += f' (showing dims 1-2 of {particles.shape[1]})'
+    
+    ax.set_title(title)
+    ax.grid(True, alpha=0.3)
+    return fig, ax
+
+def viz_beliefs(beliefs, time_steps=None, title='Belief Evolution', 
+               figsize=(10, 6), labels=None):
+    "Visualize evolution of `beliefs` over `time_steps`"
+    beliefs = np.array(beliefs)
+    if time_steps is None:
+        time_steps = np.arange(len(beliefs))
+    
+    fig, ax = plt.subplots(figsize=figsize)
+    
+    if beliefs.ndim == 2:
+        # Multiple belief dimensions
+        for i in range(beliefs.shape[1]):
+            label = f'Belief {i+1}' if labels is None else labels[i]
+            ax.plot(time_steps, beliefs[:, i], label=label, marker='o')
+        ax.legend()
+    else:
+        # Single belief dimension
+        ax.plot(time_steps, beliefs, marker='o')
+    
+    ax.set_xlabel('Time Step')
+    ax.set_ylabel('Belief Value')
+    ax.set_title(title)
+    ax.grid(True, alpha=0.3)
+    return fig, ax
+
+def viz_comparison(methods_data, time_steps=None, title='Method Comparison',
+                  figsize=(12, 8), metrics=['mse', 'mae']):
+    "Compare multiple methods with `methods_data` dict"
+    if time_steps is None:
+        # Try to infer time_steps from data
+        first_method = list(methods_data.keys())[0]
+        first_data = methods_data[first_method]
+        
+        # Look for estimates first, then fall back to any available metric
+        if 'estimates' in first_data:
+            time_steps = np.arange(len(first_data['estimates']))
+        else:
+            # Use the first available metric to infer length
+            available_metrics = [m for m in metrics if m in first_data]
+            if available_metrics:
+                time_steps = np.arange(len(first_data[available_metrics[0]]))
+            else:
+                # Default fallback
+                time_steps = np.arange(10)
+    
+    n_metrics = len(metrics)
+    fig, axes = plt.subplots(n_metrics, 1, figsize=figsize)
+    if n_metrics == 1:
+        axes = [axes]
+    
+    for i, metric in enumerate(metrics):
+        ax = axes[i]
+        
+        for method_name, method_data in methods_data.items():
+            if metric in method_data:
+                ax.plot(time_steps, method_data[metric], 
+                       label=method_name, marker='o')
+        
+        ax.set_xlabel('Time Step')
+        ax.set_ylabel(metric.upper())
+        ax.set_title(f'{title} - {metric.upper()}')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    return fig, axes
+
+def viz_rbe_summary(rbe_result, true_states=None, title='RBE Summary',
+                   figsize=(15, 10)):
+    "Create comprehensive summary visualization of RBE results"
+    fig = plt.figure(figsize=figsize)
+    
+    # Layout: 2x2 grid
+    gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
+    
+    # Top left: Final particle distribution
+    ax1 = fig.add_subplot(gs[0, 0])
+    final_particles = rbe_result['particles'][-1]
+    final_weights = rbe_result['weights'][-1]
+    
+    if final_particles.shape[1] >= 2:
+        ax1.scatter(final_particles[:, 0], final_particles[:, 1], 
+                   s=final_weights*1000, alpha=0.6)
+        ax1.set_xlabel('State Dim 1')
+        ax1.set_ylabel('State Dim 2')
+    else:
+        ax1.hist(final_particles.flatten(), weights=final_weights, bins=30, alpha=0.6)
+        ax1.set_xlabel('State')
+        ax1.set_ylabel('Density')
+    ax1.set_title('Final Particle Distribution')
+    ax1.grid(True, alpha=0.3)
+    
+    # Top right: Estimates over time
+    ax2 = fig.add_subplot(gs[0, 1])
+    estimates = rbe_result['estimates']
+    time_steps = np.arange(len(estimates))
+    
+    if estimates.ndim == 2 and estimates.shape[1] >= 2:
+        ax2.plot(time_steps, estimates[:, 0], 'b-', label='Dim 1', marker='o')
+        ax2.plot(time_steps, estimates[:, 1], 'r-', label='Dim 2', marker='s')
+        if true_states is not None:
+            true_states = np.array(true_states)
+            ax2.plot(time_steps, true_states[:, 0], 'b--', alpha=0.7, label='True Dim 1')
+            ax2.plot(time_steps, true_states[:, 1], 'r--', alpha=0.7, label='True Dim 2')
+        ax2.legend()
+    else:
+        ax2.plot(time_steps, estimates.flatten(), 'b-', marker='o', label='Estimate')
+        if true_states is not None:
+            ax2.plot(time_steps, np.array(true_states).flatten(), 'r--', alpha=0.7, label='True')
+        ax2.legend()
+    
+    ax2.set_xlabel('Time Step')
+    ax2.set_ylabel('State Value')
+    ax2.set_title('Estimates Over Time')
+    ax2.grid(True, alpha=0.3)
+    
+    # Bottom left: Effective sample size
+    ax3 = fig.add_subplot(gs[1, 0])
+    eff_sizes = [pf_effective_size(w) for w in rbe_result['weights']]
+    ax3.plot(np.arange(len(eff_sizes)), eff_sizes, 'g-', marker='o')
+    ax3.axhline(len(rbe_result['weights'][0])/2, color='r', linestyle='--', alpha=0.7, label='N/2')
+    ax3.set_xlabel('Time Step')
+    ax3.set_ylabel('Effective Sample Size')
+    ax3.set_title('Particle Filter Health')
+    ax3.legend()
+    ax3.grid(True, alpha=0.3)
+    
+    # Bottom right: Error metrics (if true states provided)
+    ax4 = fig.add_subplot(gs[1, 1])
+    if true_states is not None:
+        errors = np.array(true_states) - estimates
+        if errors.ndim == 2:
+            error_norms = np.linalg.norm(errors, axis=1)
+        else:
+            error_norms = np.abs(errors)
+        
+        ax4.plot(time_steps, error_norms, 'r-', marker='o')
+        ax4.set_xlabel('Time Step')
+        ax4.set_ylabel('Estimation Error')
+        ax4.set_title('Error Over Time')
+    else:
+        ax4.text(0.5, 0.5, 'No true states\nprovided', ha='center', va='center', 
+                transform=ax4.transAxes, fontsize=12)
+        ax4.set_title('Error Analysis')
+    ax4.grid(True, alpha=0.3)
+    
+    fig.suptitle(title, fontsize=16)
+    return fig
+
+# %% ../../nbs/rbe/00e_rbe_viz.ipynb 9
+__all__ = ['viz_particles', 'viz_beliefs', 'viz_comparison', 'viz_rbe_summary']